@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Local Asset Server
+Serves the diagrams and TLM pages over the LAN with HTTP caching, compression and ranges
+"""
+import argparse
+import asyncio
+import email.utils
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import secrets
+import socket
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # brotli variants are skipped without it
+    brotli = None
+
+REPO_ROOT = Path(__file__).resolve().parent
+PRECOMPRESSED_DIR = REPO_ROOT / ".build" / "precompressed"
+SERVED_DIRS = ("visualizations", "interactive", "presentation")
+DEFAULT_INDEX = "interactive/diabetes_interactive_tlm.html"
+
+# Text formats worth precompressing; PNG/WebP/AVIF are already compressed
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt", ".md"}
+# (Content-Encoding, variant suffix), most preferred first
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+# Content-hashed names such as epidemiology_chart.3f2a9c1b0e.png never change; the
+# digest length is the one google_drive_helper.py writes into asset-manifest.json
+HASH_LENGTH = 10
+HASHED_NAME = re.compile(rf'\.[0-9a-f]{{{HASH_LENGTH}}}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+RANGE_HEADER = re.compile(r'^bytes=(\d*)-(\d*)$')
+IDLE_TIMEOUT = 15  # seconds a keep-alive connection may sit idle
+MAX_HEADER_BYTES = 16 * 1024
+# Largest PUT body accepted; the diagrams are well under 1 MB each
+MAX_UPLOAD_BYTES = 32 * 1024 * 1024
+# Environment variable asset_server.py and asset_sync.py read the shared upload token from
+UPLOAD_TOKEN_ENV = "ASSET_UPLOAD_TOKEN"
+
+mimetypes.add_type("font/woff2", ".woff2")
+mimetypes.add_type("image/avif", ".avif")
+mimetypes.add_type("image/webp", ".webp")
+
+
+def encode_file(source, target, encoding):
+    """Write a gzip or brotli copy of source at target (atomically)"""
+    data = source.read_bytes()
+    if encoding == "gzip":
+        payload = gzip.compress(data, compresslevel=9, mtime=0)
+    else:
+        payload = brotli.compress(data, quality=11)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(target.name + f".tmp{os.getpid()}")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, target)
+
+
+def precompress(root=REPO_ROOT, dirs=SERVED_DIRS, output_dir=PRECOMPRESSED_DIR):
+    """Refresh gzip/brotli variants of every compressible file; returns how many were written"""
+    written = 0
+    for directory in dirs:
+        for source in sorted((Path(root) / directory).rglob("*")):
+            if not source.is_file() or source.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+                continue
+            relative = source.relative_to(root)
+            for encoding, suffix in ENCODINGS:
+                if encoding == "br" and brotli is None:
+                    continue
+                target = Path(output_dir) / (str(relative) + suffix)
+                if target.exists() and target.stat().st_mtime_ns >= source.stat().st_mtime_ns:
+                    continue
+                encode_file(source, target, encoding)
+                written += 1
+    return written
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single 'bytes=' range, None to ignore it, or 'invalid'"""
+    match = RANGE_HEADER.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if first == '':
+        length = int(last)
+        if length == 0:
+            return 'invalid'
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        return 'invalid'
+    return start, end
+
+
+class AssetServer:
+    def __init__(self, root=REPO_ROOT, dirs=SERVED_DIRS, index=DEFAULT_INDEX,
+                 precompressed_dir=PRECOMPRESSED_DIR, upload_dir=None, upload_token=None,
+                 max_upload_bytes=MAX_UPLOAD_BYTES):
+        """
+        root              -- folder the URL paths are resolved against
+        dirs              -- top-level folders under root that may be served
+        index             -- page "/" redirects to
+        precompressed_dir -- where the .gz/.br variants are kept
+        upload_dir        -- root-relative folder that accepts PUT uploads (off by default)
+        upload_token      -- bearer token a PUT must carry; a random one is generated if not given
+        max_upload_bytes  -- larger PUT bodies are refused with 413
+        """
+        self.root = Path(root).resolve()
+        self.dirs = tuple(dirs)
+        self.index = index
+        self.precompressed_dir = Path(precompressed_dir)
+        self.upload_dir = upload_dir.strip("/") if upload_dir else None
+        # The server listens on the whole LAN, so uploads need the token as well as the folder
+        self.upload_token = upload_token or secrets.token_hex(16)
+        self.max_upload_bytes = max_upload_bytes
+        # path -> (mtime_ns, size, etag); ETags are strong content hashes
+        self._etags = {}
+        self.requests = 0
+        self.bytes_sent = 0
+
+    def resolve(self, url_path):
+        """Filesystem path for a request path, or None if it is not servable"""
+        relative = unquote(url_path).lstrip("/")
+        top = relative.split("/", 1)[0]
+        if top not in self.dirs:
+            return None
+        path = (self.root / relative).resolve()
+        # Reject anything that escapes the served folder, e.g. via '..'
+        if (self.root / top).resolve() not in path.parents or not path.is_file():
+            return None
+        return path
+
+    def upload_target(self, url_path):
+        """Destination for a PUT, or None unless it names a plain file directly in upload_dir"""
+        if not self.upload_dir:
+            return None
+        folder, _, name = unquote(url_path).strip("/").rpartition("/")
+        if folder != self.upload_dir or not name or name.startswith(".") or "\\" in name:
+            return None
+        return self.root / folder / name
+
+    def etag(self, path, stat):
+        known = self._etags.get(path)
+        if known and known[0] == stat.st_mtime_ns and known[1] == stat.st_size:
+            return known[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        self._etags[path] = (stat.st_mtime_ns, stat.st_size, etag)
+        return etag
+
+    def variant(self, path, stat, accept_encoding):
+        """(Content-Encoding, variant path) of the best precompressed copy the client accepts"""
+        if path.suffix.lower() not in COMPRESSIBLE_SUFFIXES:
+            return None, path
+        accepted = {token.split(";")[0].strip().lower() for token in accept_encoding.split(",")}
+        relative = path.relative_to(self.root)
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+            candidate = self.precompressed_dir / (str(relative) + suffix)
+            try:
+                if candidate.stat().st_mtime_ns >= stat.st_mtime_ns:
+                    return encoding, candidate
+            except FileNotFoundError:
+                continue
+        return None, path
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError):
+                    break
+                keep_alive = await self.handle_request(head.decode("latin-1"), reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, head, reader, writer):
+        """Answer one request; returns whether the connection may be reused"""
+        self.requests += 1
+        request_line, *header_lines = head.split("\r\n")
+        try:
+            method, target, version = request_line.split(" ")
+        except ValueError:
+            await self.send_status(writer, 400, "Bad Request", keep_alive=False)
+            return False
+        headers = {}
+        for line in header_lines:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+        url_path = urlsplit(target).path
+        if method == "PUT" and self.upload_dir:
+            return await self.handle_upload(url_path, headers, reader, writer, keep_alive)
+        if method not in ("GET", "HEAD"):
+            allow = "GET, HEAD, PUT" if self.upload_dir else "GET, HEAD"
+            await self.send_status(writer, 405, "Method Not Allowed", False, {"Allow": allow})
+            return False
+        if url_path == "/":
+            await self.send_status(writer, 302, "Found", keep_alive, {"Location": "/" + self.index},
+                                   body=method != "HEAD")
+            return keep_alive
+        path = self.resolve(url_path)
+        if path is None:
+            await self.send_status(writer, 404, "Not Found", keep_alive, body=method != "HEAD")
+            return keep_alive
+
+        stat = path.stat()
+        etag = self.etag(path, stat)
+        response = {
+            "ETag": etag,
+            "Last-Modified": email.utils.formatdate(stat.st_mtime, usegmt=True),
+            "Cache-Control": IMMUTABLE_CACHE if HASHED_NAME.search(path.name) else REVALIDATE_CACHE,
+            "Content-Type": mimetypes.guess_type(path.name)[0] or "application/octet-stream",
+            "Accept-Ranges": "bytes",
+        }
+        if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            response["Vary"] = "Accept-Encoding"
+
+        byte_range = None
+        if "range" in headers and headers.get("if-range", etag) == etag:
+            byte_range = parse_range(headers["range"], stat.st_size)
+            if byte_range == 'invalid':
+                response["Content-Range"] = f"bytes */{stat.st_size}"
+                await self.send_status(writer, 416, "Range Not Satisfiable", keep_alive, response,
+                                       body=method != "HEAD")
+                return keep_alive
+
+        if byte_range:
+            # Ranges always address the identity encoding
+            body_path, start, end = path, byte_range[0], byte_range[1]
+            response["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+            status = (206, "Partial Content")
+        else:
+            encoding, body_path = self.variant(path, stat, headers.get("accept-encoding", ""))
+            if encoding:
+                # Each encoding is a different representation with its own strong ETag
+                response["Content-Encoding"] = encoding
+                response["ETag"] = f'{etag[:-1]}-{encoding}"'
+            if response["ETag"] in [tag.strip() for tag in headers.get("if-none-match", "").split(",")]:
+                await self.send_status(writer, 304, "Not Modified", keep_alive, response, body=False)
+                return keep_alive
+            start, end = 0, body_path.stat().st_size - 1
+            status = (200, "OK")
+
+        response["Content-Length"] = str(end - start + 1)
+        response["Connection"] = "keep-alive" if keep_alive else "close"
+        writer.write(self.format_head(*status, response))
+        await writer.drain()
+        if method == "GET" and end >= start:
+            with open(body_path, 'rb') as f:
+                # Zero-copy where the platform supports it, buffered copy otherwise
+                await asyncio.get_running_loop().sendfile(writer.transport, f, start, end - start + 1)
+            self.bytes_sent += end - start + 1
+        return keep_alive
+
+    async def handle_upload(self, url_path, headers, reader, writer, keep_alive):
+        """Store a PUT body atomically; used by asset_sync.py's HTTP backend.
+
+        Refused bodies are never read, so every refusal closes the connection.
+        """
+        target = self.upload_target(url_path)
+        if target is None:
+            await self.send_status(writer, 403, "Forbidden", False)
+            return False
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not secrets.compare_digest(token.strip(), self.upload_token):
+            await self.send_status(writer, 401, "Unauthorized", False, {"WWW-Authenticate": "Bearer"})
+            return False
+        if not headers.get("content-length", "").isdigit():
+            await self.send_status(writer, 411, "Length Required", False)
+            return False
+        remaining = int(headers["content-length"])
+        if remaining > self.max_upload_bytes:
+            await self.send_status(writer, 413, "Content Too Large", False)
+            return False
+
+        existed = target.exists()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(f".{target.name}.tmp{id(writer):x}")
+        try:
+            with open(tmp_path, 'wb') as f:
+                while remaining:
+                    block = await asyncio.wait_for(reader.readexactly(min(remaining, 1024 * 1024)), IDLE_TIMEOUT)
+                    f.write(block)
+                    remaining -= len(block)
+            os.replace(tmp_path, target)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+            # Client went away or stalled mid-body; keep the previous file
+            return False
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        await self.send_status(writer, 204 if existed else 201, "No Content" if existed else "Created", keep_alive)
+        return keep_alive
+
+    @staticmethod
+    def format_head(code, reason, headers):
+        lines = [f"HTTP/1.1 {code} {reason}", f"Date: {email.utils.formatdate(usegmt=True)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def send_status(self, writer, code, reason, keep_alive, headers=None, body=True):
+        """Bodiless (or plain-text) response for redirects, errors and 304s; body=False for HEAD"""
+        headers = dict(headers or {})
+        text = f"{code} {reason}\n".encode("utf-8") if code >= 400 else b""
+        if code != 304:
+            headers["Content-Type"] = "text/plain; charset=utf-8"
+            headers["Content-Length"] = str(len(text))
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        writer.write(self.format_head(code, reason, headers) + (text if body else b""))
+        await writer.drain()
+
+    async def serve(self, host="0.0.0.0", port=8000):
+        server = await asyncio.start_server(self.handle_connection, host, port,
+                                            limit=MAX_HEADER_BYTES, backlog=512)
+        async with server:
+            await server.serve_forever()
+
+
+def lan_address():
+    """Best guess at this machine's LAN IP, for printing student-facing URLs"""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        try:
+            probe.connect(("10.255.255.255", 1))
+            return probe.getsockname()[0]
+        except OSError:
+            return "127.0.0.1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the TLM diagrams and pages to a classroom LAN")
+    parser.add_argument("--host", default="0.0.0.0", help="interface to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="TCP port")
+    parser.add_argument("--no-precompress", action="store_true",
+                        help="skip refreshing the gzip/brotli variants before serving")
+    parser.add_argument("--allow-upload", metavar="DIR",
+                        help="accept PUT uploads into this served folder (e.g. visualizations/hosted) for asset_sync.py")
+    parser.add_argument("--upload-token", default=os.environ.get(UPLOAD_TOKEN_ENV),
+                        help=f"token uploads must send (default: ${UPLOAD_TOKEN_ENV}, else a random one)")
+    parser.add_argument("--max-upload-mb", type=float, default=MAX_UPLOAD_BYTES / (1024 * 1024),
+                        help="largest upload accepted, in MB")
+    args = parser.parse_args()
+
+    print("📡 DIABETES TLM - LOCAL ASSET SERVER")
+    print("=" * 50)
+    if not args.no_precompress:
+        written = precompress()
+        print(f"🗜️  Precompressed variants refreshed: {written}"
+              + ("" if brotli else " (gzip only; pip install brotli for br)"))
+    base_url = f"http://{lan_address()}:{args.port}"
+    print(f"✅ Serving {', '.join(SERVED_DIRS)} from {REPO_ROOT}")
+    server = AssetServer(upload_dir=args.allow_upload, upload_token=args.upload_token,
+                         max_upload_bytes=int(args.max_upload_mb * 1024 * 1024))
+    if args.allow_upload:
+        print(f"⬆️  Accepting uploads into {args.allow_upload}/ with token {server.upload_token}")
+        print(f"   {UPLOAD_TOKEN_ENV}={server.upload_token} python asset_sync.py {base_url}/{server.upload_dir}")
+    print(f"🌐 Students open: {base_url}/")
+    print(f"🔗 Point Drive URLs here: python google_drive_helper.py --local-server {base_url}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Asset Sync
+Uploads only new or changed content-hashed diagrams to the hosting backend
+"""
+import argparse
+import http.client
+import json
+import os
+import queue
+import shutil
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from asset_server import UPLOAD_TOKEN_ENV
+from google_drive_helper import GoogleDriveHelper, HASHED_DIR_NAME, MANIFEST_NAME
+
+URL_MAPPING_NAME = "asset-urls.json"
+
+SyncResult = namedtuple('SyncResult', ['uploaded', 'unchanged', 'failed', 'urls'])
+
+
+class DirectoryBackend:
+    """Stand-in host: a folder (shared drive, web root) that some server exposes at base_url"""
+
+    def __init__(self, root, base_url=None):
+        self.root = Path(root)
+        self.base_url = (base_url or self.root.resolve().as_uri()).rstrip("/")
+
+    def fetch_manifest(self):
+        try:
+            with open(self.root / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def upload(self, source, name):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f".{name}.tmp{os.getpid()}"
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, self.root / name)
+
+    def store_manifest(self, manifest):
+        self.upload_bytes(json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'), MANIFEST_NAME)
+
+    def upload_bytes(self, data, name):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.root / f".{name}.tmp{os.getpid()}"
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.root / name)
+
+    def url_for(self, name):
+        return f"{self.base_url}/{name}"
+
+    def close(self):
+        pass
+
+
+class HttpBackend:
+    """GET/PUT host such as a WebDAV share or `asset_server.py --allow-upload`"""
+
+    def __init__(self, base_url, pool_size=4, timeout=60, token=None):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+        self.base_url = base_url.rstrip("/")
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.path = parts.path.rstrip("/")
+        self.timeout = timeout
+        # Sent as a bearer token with every upload
+        self.token = token
+        # Idle keep-alive connections shared by the upload workers
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        self.connections_opened = 0
+
+    def _connection(self, fresh=False):
+        """(connection, reused); reused is True for an idle pooled connection.
+
+        The server may have closed a pooled connection without this side
+        having seen it; fresh=True always opens a new one.
+        """
+        if not fresh:
+            try:
+                return self._pool.get_nowait(), True
+            except queue.Empty:
+                pass
+        self.connections_opened += 1
+        connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return connection_class(self.netloc, timeout=self.timeout), False
+
+    def _release(self, connection):
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method, name, body=None, headers=None):
+        """(status, body bytes) of one request, reusing a pooled connection"""
+        for attempt in range(2):
+            connection, reused = self._connection(fresh=attempt > 0)
+            try:
+                connection.request(method, f"{self.path}/{name}", body=body, headers=headers or {})
+                response = connection.getresponse()
+                data = response.read()
+                break
+            except (ConnectionResetError, BrokenPipeError):
+                # RemoteDisconnected included: a keep-alive connection the server dropped
+                # while it sat in the pool. GET and PUT are idempotent, so retry once on a new one
+                connection.close()
+                if not reused:
+                    raise
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, data
+
+    def fetch_manifest(self):
+        status, data = self.request("GET", MANIFEST_NAME)
+        if status == 404:
+            return {}
+        if status != 200:
+            raise OSError(f"Fetching {MANIFEST_NAME} failed: HTTP {status}")
+        return json.loads(data)
+
+    def upload(self, source, name):
+        with open(source, 'rb') as f:
+            self.upload_bytes(f.read(), name)
+
+    def upload_bytes(self, data, name):
+        headers = {"Content-Length": str(len(data)), "Content-Type": "application/octet-stream"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        status, _ = self.request("PUT", name, body=data, headers=headers)
+        if status not in (200, 201, 204):
+            raise OSError(f"Uploading {name} failed: HTTP {status}")
+
+    def store_manifest(self, manifest):
+        self.upload_bytes(json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'), MANIFEST_NAME)
+
+    def url_for(self, name):
+        return f"{self.base_url}/{name}"
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+
+def open_backend(destination, base_url=None, workers=4, token=None):
+    """HttpBackend for http(s) URLs, DirectoryBackend for anything else"""
+    if destination.startswith(("http://", "https://")):
+        return HttpBackend(destination, pool_size=workers, token=token)
+    return DirectoryBackend(destination, base_url)
+
+
+def plan_uploads(local_manifest, remote_manifest):
+    """Logical names whose content the remote does not have yet"""
+    return sorted(name for name, entry in local_manifest.items()
+                  if remote_manifest.get(name, {}).get("sha256") != entry["sha256"])
+
+
+def write_url_mapping(path, urls):
+    """Replace the URL mapping file atomically, so readers never see half of it"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(urls, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def sync(local_manifest, hashed_dir, backend, workers=4, mapping_file=None):
+    """Bring the backend up to date with local_manifest.
+
+    Costs one manifest fetch when nothing changed. Otherwise the changed
+    files are uploaded concurrently, then the remote manifest (only once
+    every file it names exists), then the local URL mapping.
+    """
+    remote_manifest = backend.fetch_manifest()
+    to_upload = plan_uploads(local_manifest, remote_manifest)
+
+    uploaded, failed = [], []
+    if to_upload:
+        def upload(name):
+            backend.upload(Path(hashed_dir) / local_manifest[name]["file"], local_manifest[name]["file"])
+            return name
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(upload, name): name for name in to_upload}
+            for future, name in futures.items():
+                try:
+                    uploaded.append(future.result())
+                except (OSError, http.client.HTTPException) as e:
+                    print(f"❌ {name}: {e}")
+                    failed.append(name)
+
+        for name in uploaded:
+            remote_manifest[name] = local_manifest[name]
+        if uploaded:
+            backend.store_manifest(remote_manifest)
+
+    urls = {name: backend.url_for(entry["file"]) for name, entry in remote_manifest.items()
+            if name in local_manifest}
+    if mapping_file:
+        write_url_mapping(mapping_file, urls)
+    unchanged = [name for name in local_manifest if name not in to_upload]
+    return SyncResult(uploaded, unchanged, failed, urls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload only new or changed diagrams to the image host")
+    parser.add_argument("destination", help="folder or http(s) URL that hosts the hashed images")
+    parser.add_argument("--base-url", help="public URL of a folder destination (default: file:// URL)")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent uploads")
+    parser.add_argument("--token", default=os.environ.get(UPLOAD_TOKEN_ENV),
+                        help=f"upload token for an http(s) destination (default: ${UPLOAD_TOKEN_ENV})")
+    parser.add_argument("--responsive", action="store_true",
+                        help="also sync copies resampled for srcset (see google_drive_helper.py --responsive)")
+    parser.add_argument("--update-html", action="store_true", help="rewrite the TLM HTML against the synced URLs")
+    args = parser.parse_args()
+
+    print("☁️  DIABETES TLM - ASSET SYNC")
+    print("=" * 50)
+    start = time.perf_counter()
+    helper = GoogleDriveHelper()
+    variants = helper.build_responsive_images() if args.responsive else None
+    local_manifest = helper.build_asset_manifest(variants)
+    hashed_dir = helper.images_dir / HASHED_DIR_NAME
+
+    backend = open_backend(args.destination, args.base_url, args.workers, args.token)
+    try:
+        result = sync(local_manifest, hashed_dir, backend, args.workers,
+                      mapping_file=hashed_dir / URL_MAPPING_NAME)
+    finally:
+        backend.close()
+
+    for name in result.uploaded:
+        print(f"⬆️  Uploaded: {name} -> {local_manifest[name]['file']}")
+    uploaded_bytes = sum(local_manifest[name]["bytes"] for name in result.uploaded)
+    print(f"✅ Uploaded: {len(result.uploaded)} ({uploaded_bytes / 1024:.0f} KB)  "
+          f"⏩ Unchanged: {len(result.unchanged)}  ❌ Failed: {len(result.failed)}")
+    print(f"🔗 URL mapping: {hashed_dir / URL_MAPPING_NAME}")
+    print(f"⏱️  {time.perf_counter() - start:.2f}s")
+
+    if args.update_html and not result.failed:
+        helper.update_html_with_drive_urls(result.urls)
+    return 1 if result.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Embed Memory Benchmark
+Records peak RSS of each create_embedded_html mode as total image size grows
+"""
+import contextlib
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+MODES = ("regex", "stream", "chunked")
+IMAGE_COUNT = 8
+
+
+def make_fixture(directory, total_mb):
+    """HTML page referencing IMAGE_COUNT images that add up to total_mb"""
+    images_dir = Path(directory) / "visualizations"
+    images_dir.mkdir()
+    image_bytes = total_mb * 1024 * 1024 // IMAGE_COUNT
+    tags = []
+    for i in range(IMAGE_COUNT):
+        with open(images_dir / f"figure_{i}.png", 'wb') as f:
+            for offset in range(0, image_bytes, 1024 * 1024):
+                f.write(os.urandom(min(1024 * 1024, image_bytes - offset)))
+        tags.append(f'<section id="s{i}"><p>Figure {i}</p><img src="../visualizations/figure_{i}.png"></section>')
+    html_file = Path(directory) / "page.html"
+    html_file.write_text("<html><body>" + "\n".join(tags) + "</body></html>", encoding='utf-8')
+    return images_dir, html_file
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(mode, images_dir, html_file):
+    """Embed once in this (fresh) process and print the peak RSS"""
+    from auto_embed_images import ImageEmbedder
+
+    baseline = peak_rss_mb()
+    embedder = ImageEmbedder(images_dir=images_dir, html_file=html_file, disk_cache=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        embedder.create_embedded_html(Path(html_file).with_name("out.html"), mode=mode)
+    print(f"{baseline:.1f} {peak_rss_mb():.1f}")
+
+
+def main():
+    print("🧠 EMBED PEAK MEMORY BENCHMARK")
+    print("=" * 64)
+    print(f"{'images MB':>9} " + " ".join(f"{mode + ' MB':>14}" for mode in MODES))
+
+    for total_mb in (8, 32, 128):
+        with tempfile.TemporaryDirectory() as directory:
+            images_dir, html_file = make_fixture(directory, total_mb)
+            row = []
+            for mode in MODES:
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", mode, str(images_dir), str(html_file)],
+                    check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+                ).stdout.split()
+                baseline, peak = map(float, output)
+                row.append(peak - baseline)
+        print(f"{total_mb:>9} " + " ".join(f"{value:>14.1f}" for value in row))
+
+    print("=" * 64)
+    print("Values are peak RSS growth over interpreter start-up.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        run_child(*sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Embed Rewriter Benchmark
+Shows how the single-pass tokenizer scales with document size and image count
+"""
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from auto_embed_images import ImageEmbedder
+from html_image_rewriter import HtmlImageRewriter, PLACEHOLDER_SECTIONS
+
+FILLER = '<div class="content-card"><p>Diabetes mellitus is a group of metabolic diseases.</p></div>\n' * 40
+
+
+def build_document(sections, payload_kb):
+    """Synthetic TLM page: one placeholder and one img tag per section"""
+    parts = ['<html><body>']
+    names = list(PLACEHOLDER_SECTIONS.items())
+    for i in range(sections):
+        section_id, image_name = names[i % len(names)]
+        parts.append(f'<section class="section" id="{section_id}">')
+        parts.append(FILLER)
+        parts.append(
+            '<div style="margin-bottom: 20px; background: #f8f9fa; padding: 20px; border-radius: 8px; '
+            'text-align: center; border: 2px dashed #3498db;">'
+            '<div style="font-size: 48px;"><i class="fas fa-chart-bar"></i></div>'
+            '<div style="font-weight: bold;">Diagram</div></div>'
+        )
+        parts.append(f'<img src="../visualizations/extra_{i}.png" alt="extra">')
+        parts.append('</section>')
+    parts.append('</body></html>')
+
+    mappings = {image_name: 'data:image/png;base64,' + 'A' * (payload_kb * 1024)
+                for image_name in PLACEHOLDER_SECTIONS.values()}
+    for i in range(sections):
+        mappings[f'extra_{i}.png'] = 'data:image/png;base64,' + 'B' * (payload_kb * 1024)
+    return ''.join(parts), mappings
+
+
+def time_stream(html, mappings):
+    out = io.StringIO()
+    start = time.perf_counter()
+    HtmlImageRewriter(mappings).rewrite(html, lambda slot: mappings[slot.name], out.write)
+    return time.perf_counter() - start
+
+
+def time_regex(html, mappings):
+    embedder = ImageEmbedder()
+    start = time.perf_counter()
+    embedder.rewrite_with_regex(html, mappings)
+    return time.perf_counter() - start
+
+
+def best_of(func, *args, repeat=3):
+    return min(func(*args) for _ in range(repeat))
+
+
+def main():
+    print("📈 EMBED REWRITER SCALING BENCHMARK")
+    print("=" * 72)
+    print(f"{'sections':>8} {'images':>7} {'html KB':>9} {'stream ms':>10} {'us/KB':>7} {'regex ms':>10}")
+
+    for sections in (6, 12, 24, 48, 96):
+        html, mappings = build_document(sections, payload_kb=64)
+        html_kb = len(html) / 1024
+        stream = best_of(time_stream, html, mappings)
+        with contextlib.redirect_stdout(io.StringIO()):
+            regex = best_of(time_regex, html, mappings)
+        print(f"{sections:>8} {len(mappings):>7} {html_kb:>9.0f} {stream * 1000:>10.2f} "
+              f"{stream * 1e6 / html_kb:>7.1f} {regex * 1000:>10.2f}")
+
+    print("=" * 72)
+    print("A flat us/KB column means the tokenizer cost grows linearly with input size.")
+
+
+if __name__ == "__main__":
+    main()
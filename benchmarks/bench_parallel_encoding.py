@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Parallel Encoding Benchmark
+Compares serial, thread-pool and process-pool image encoding at 10/100/1000 images
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from auto_embed_images import ImageEmbedder
+
+IMAGE_KB = 128
+WORKERS = max(2, min(8, os.cpu_count() or 1))
+
+
+def make_images(directory, count):
+    """Write count incompressible PNG-sized files (contents do not matter to the encoder)"""
+    for i in range(count):
+        with open(Path(directory) / f"image_{i:04d}.png", 'wb') as f:
+            f.write(os.urandom(IMAGE_KB * 1024))
+
+
+def time_encoding(directory, **options):
+    embedder = ImageEmbedder(images_dir=directory, disk_cache=False, **options)
+    start = time.perf_counter()
+    consumed = 0
+    for _, data_uri in embedder.iter_image_data_uris():
+        consumed += len(data_uri)
+    return time.perf_counter() - start
+
+
+def main():
+    print("⚡ PARALLEL IMAGE ENCODING BENCHMARK")
+    print(f"{IMAGE_KB} KB per image, {WORKERS} workers")
+    print("=" * 78)
+    print(f"{'images':>7} {'serial s':>9} {'thread s':>9} {'process s':>10} {'process+bounded s':>18}")
+
+    for count in (10, 100, 1000):
+        with tempfile.TemporaryDirectory() as directory:
+            make_images(directory, count)
+            serial = time_encoding(directory)
+            thread = time_encoding(directory, workers=WORKERS, pool="thread")
+            process = time_encoding(directory, workers=WORKERS, pool="process")
+            bounded = time_encoding(directory, workers=WORKERS, pool="process", max_in_flight=WORKERS * 2)
+        print(f"{count:>7} {serial:>9.3f} {thread:>9.3f} {process:>10.3f} {bounded:>18.3f}")
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
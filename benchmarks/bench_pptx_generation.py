@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+PPTX Generation Benchmark
+Per-slide render time, prs.save time, bytes per slide and media part and peak memory
+of every deck, stored as JSON and compared against an earlier run
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from deck_renderer import DeckRenderer, load_deck
+from decks import DECKS
+from pptx import Presentation
+from pptx_optimizer import PptxOptimizer
+
+REPEAT = 5
+# A measurement regresses when it grows by more than both the relative tolerance and the floor;
+# the time floor keeps scheduler noise on 3-5 ms slides from being reported
+TOLERANCES = {"seconds": (0.25, 0.005), "bytes": (0.05, 1024), "mb": (0.20, 1.0)}
+# How each kind of measurement is printed: (scale, unit)
+UNITS = {"seconds": (1000, "ms"), "bytes": (1 / 1024, "KB"), "mb": (1, "MB")}
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class TimedRenderer(DeckRenderer):
+    """DeckRenderer that records how long each slide spec takes to render"""
+
+    def __init__(self, root=REPO_ROOT):
+        super().__init__(root)
+        self.slide_seconds = []
+
+    def add_slide(self, prs, spec, theme):
+        start = time.perf_counter()
+        slide = super().add_slide(prs, spec, theme)
+        self.slide_seconds.append(time.perf_counter() - start)
+        return slide
+
+
+def part_sizes(prs, path):
+    """Bytes of every slide and of every picture/chart/embedding it pulls in, from the saved ZIP"""
+    with zipfile.ZipFile(path) as archive:
+        sizes = {"/" + info.filename: (info.file_size, info.compress_size) for info in archive.infolist()}
+
+    slides, media = [], {}
+    for index, slide in enumerate(prs.slides):
+        related, stack, seen = 0, [slide.part], set()
+        while stack:
+            part = stack.pop()
+            for rel in part.rels.values():
+                if rel.is_external or "slideLayout" in rel.reltype:
+                    continue
+                target = rel.target_part
+                if target.partname in seen:
+                    continue
+                seen.add(target.partname)
+                stack.append(target)
+                size, compressed = sizes[target.partname]
+                related += size
+                entry = media.setdefault(target.partname, {
+                    "part": target.partname, "content_type": target.content_type,
+                    "bytes": size, "compressed_bytes": compressed, "slides": [],
+                })
+                entry["slides"].append(index)
+        size, compressed = sizes[slide.part.partname]
+        slides.append({"part": slide.part.partname, "xml_bytes": size,
+                       "compressed_bytes": compressed, "related_bytes": related})
+    return slides, sorted(media.values(), key=lambda entry: entry["part"])
+
+
+def run_child(name, repeat):
+    """Benchmark one deck in this (fresh) process and print the result as JSON"""
+    deck = load_deck(name)
+    baseline_rss = peak_rss_mb()
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        output = Path(directory) / deck.output
+        DeckRenderer().render(deck).save(output)  # warm-up: imports, image decoders, chart builders
+
+        slide_seconds, save_seconds = None, []
+        for _ in range(repeat):
+            renderer = TimedRenderer()
+            prs = renderer.render(deck)
+            seconds = renderer.slide_seconds
+            slide_seconds = seconds if slide_seconds is None else list(map(min, slide_seconds, seconds))
+            start = time.perf_counter()
+            prs.save(output)
+            save_seconds.append(time.perf_counter() - start)
+
+        # Separate pass: tracemalloc slows allocation-heavy code down too much to time under it
+        tracemalloc.start()
+        DeckRenderer().render(deck).save(output)
+        peak_traced = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # What the generators write: the saved deck after the optimiser, which never uses its cache here
+        raw_bytes = output.stat().st_size
+        start = time.perf_counter()
+        PptxOptimizer(cache_dir=None).optimize(output)
+        optimize_seconds = time.perf_counter() - start
+        slides, media = part_sizes(Presentation(str(output)), output)
+        file_bytes = output.stat().st_size
+
+    for spec, slide, seconds in zip(deck.slides, slides, slide_seconds):
+        slide.update(name=spec.name, seconds=seconds)
+    for entry in media:
+        entry["slides"] = [deck.slides[index].name for index in entry["slides"]]
+    print(json.dumps({
+        "output": deck.output,
+        "render_seconds": sum(slide_seconds),
+        "save_seconds": min(save_seconds),
+        "optimize_seconds": optimize_seconds,
+        "raw_bytes": raw_bytes,
+        "file_bytes": file_bytes,
+        "peak_traced_mb": peak_traced / (1024 * 1024),
+        "peak_rss_mb": peak_rss_mb() - baseline_rss,
+        "slides": slides,
+        "media": media,
+    }))
+
+
+def run(decks, repeat):
+    import pptx
+
+    results = {
+        "python": platform.python_version(),
+        "python_pptx": pptx.__version__,
+        "repeat": repeat,
+        "decks": {},
+    }
+    for name in decks:
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", name, str(repeat)],
+            check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+        ).stdout
+        results["decks"][name] = json.loads(output)
+    return results
+
+
+def print_results(results):
+    for name, deck in results["decks"].items():
+        print(f"\n📊 {name}: {deck['output']}")
+        print(f"{'#':>3} {'Slide':<28} {'ms':>8} {'XML KB':>8} {'Related KB':>11}")
+        for index, slide in enumerate(deck["slides"], 1):
+            print(f"{index:>3} {slide['name']:<28} {slide['seconds'] * 1000:>8.2f} "
+                  f"{slide['xml_bytes'] / 1024:>8.1f} {slide['related_bytes'] / 1024:>11.1f}")
+        for entry in deck["media"]:
+            if entry["content_type"].startswith("image/"):
+                print(f"    🖼️  {entry['part']:<26} {entry['bytes'] / 1024:>8.0f} KB  {', '.join(entry['slides'])}")
+        print(f"    render {deck['render_seconds'] * 1000:.1f} ms, save {deck['save_seconds'] * 1000:.1f} ms, "
+              f"optimise {deck['optimize_seconds'] * 1000:.0f} ms, {deck['raw_bytes'] / 1024:.0f} -> "
+              f"{deck['file_bytes'] / 1024:.0f} KB, peak {deck['peak_traced_mb']:.1f} MB traced / "
+              f"{deck['peak_rss_mb']:.1f} MB RSS")
+
+
+def regressed(kind, before, after):
+    relative, floor = TOLERANCES[kind]
+    return after - before > max(before * relative, floor)
+
+
+def compare(baseline, results):
+    """Lines describing every measurement that regressed against baseline"""
+    regressions = []
+
+    def check(label, kind, before, after):
+        if regressed(kind, before, after):
+            scale, unit = UNITS[kind]
+            change = f"+{(after - before) / before:.0%}" if before else "new"
+            regressions.append(f"{label}: {before * scale:.1f} -> {after * scale:.1f} {unit} ({change})")
+
+    for name, deck in results["decks"].items():
+        old = baseline["decks"].get(name)
+        if old is None:
+            continue
+        check(f"{name} render_seconds", "seconds", old["render_seconds"], deck["render_seconds"])
+        check(f"{name} save_seconds", "seconds", old["save_seconds"], deck["save_seconds"])
+        if "optimize_seconds" in old:
+            check(f"{name} optimize_seconds", "seconds", old["optimize_seconds"], deck["optimize_seconds"])
+        check(f"{name} file_bytes", "bytes", old["file_bytes"], deck["file_bytes"])
+        check(f"{name} peak_traced_mb", "mb", old["peak_traced_mb"], deck["peak_traced_mb"])
+        old_slides = {slide["name"]: slide for slide in old["slides"]}
+        for slide in deck["slides"]:
+            before = old_slides.get(slide["name"])
+            if before is None:
+                continue
+            for key, kind in (("seconds", "seconds"), ("xml_bytes", "bytes"), ("related_bytes", "bytes")):
+                check(f"{name}/{slide['name']} {key}", kind, before[key], slide[key])
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PPTX generation per deck and per slide")
+    parser.add_argument("decks", nargs="*", help=f"decks to benchmark (default: all of {', '.join(DECKS)})")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="timed renders per deck; the fastest counts")
+    parser.add_argument("--output", help="write the results JSON here")
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON of an earlier run to check against")
+    parser.add_argument("--results", help="compare this results JSON instead of running the benchmark")
+    args = parser.parse_args()
+
+    unknown = set(args.decks) - set(DECKS)
+    if unknown:
+        raise SystemExit(f"Unknown decks: {', '.join(sorted(unknown))}")
+
+    print("⏱️  PPTX GENERATION BENCHMARK")
+    print("=" * 64)
+    if args.results:
+        results = json.loads(Path(args.results).read_text(encoding="utf-8"))
+    else:
+        results = run(args.decks or DECKS, args.repeat)
+        print_results(results)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(baseline, results)
+        print("=" * 64)
+        if regressions:
+            print(f"⚠️  {len(regressions)} regression(s) against {args.compare}:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"✅ No regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--child":
+        run_child(sys.argv[2], int(sys.argv[3]))
+    else:
+        sys.exit(main())
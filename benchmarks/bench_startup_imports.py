@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Startup Import Benchmark
+Times `python -X importtime` for the PPTX generators against a budget and fails when a
+heavy scientific library gets back into their imports or into rendering a deck
+"""
+import argparse
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from decks import DECKS
+
+GENERATORS = [
+    "create_comprehensive_pptx",
+    "create_pptx_presentation",
+    "create_control_prevention_pptx",
+    "create_improved_pptx_with_npcdcs",
+    "deck_renderer",
+]
+BUDGET_MS = 350  # cumulative import time of each generator, best of --repeat fresh interpreters
+REPEAT = 5
+# None of these draw anything python-pptx puts in a deck; the native charts need only xlsxwriter
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib", "seaborn", "scipy")
+
+RENDER_SNIPPET = (
+    "import sys\n"
+    "from deck_renderer import DeckRenderer, load_deck\n"
+    "DeckRenderer().render(load_deck({deck!r}))\n"
+    "print(' '.join(sorted({{name.split('.')[0] for name in sys.modules}})))\n"
+)
+
+
+def import_profile(module):
+    """(cumulative ms, {top-level package: self ms}) of importing module in a fresh interpreter"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+    ).stderr
+    total, packages = 0.0, defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        packages[name.strip().split(".")[0]] += int(self_us) / 1000
+        if name.strip() == module:
+            total = int(cumulative_us) / 1000
+    return total, dict(packages)
+
+
+def modules_after_render(deck):
+    """Top-level packages loaded once deck has been rendered (not saved)"""
+    return subprocess.run(
+        [sys.executable, "-c", RENDER_SNIPPET.format(deck=deck)],
+        check=True, capture_output=True, text=True, cwd=REPO_ROOT,
+    ).stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the PPTX generators' import time against a budget")
+    parser.add_argument("modules", nargs="*", help=f"modules to time (default: {', '.join(GENERATORS)})")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="allowed import time per module")
+    parser.add_argument("--repeat", type=int, default=REPEAT, help="fresh interpreters per module; the fastest counts")
+    args = parser.parse_args()
+
+    print("🚀 PPTX GENERATOR STARTUP BENCHMARK")
+    print("=" * 72)
+    print(f"{'Module':<34} {'ms':>7} {'Budget':>7}  Slowest packages")
+    failures = []
+    for module in args.modules or GENERATORS:
+        profiles = [import_profile(module) for _ in range(args.repeat)]
+        total, packages = min(profiles, key=lambda profile: profile[0])
+        slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:3]
+        heavy = sorted(set(packages) & set(HEAVY_MODULES))
+        status = "✅" if total <= args.budget_ms and not heavy else "❌"
+        print(f"{module:<34} {total:>7.1f} {args.budget_ms:>7.0f}  "
+              + ", ".join(f"{name} {ms:.0f}" for name, ms in slowest) + f" {status}")
+        if total > args.budget_ms:
+            failures.append(f"{module} imports in {total:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+        if heavy:
+            failures.append(f"{module} imports {', '.join(heavy)} at start-up")
+
+    print("-" * 72)
+    for deck in DECKS:
+        heavy = sorted(set(modules_after_render(deck)) & set(HEAVY_MODULES))
+        print(f"render {deck:<27} {'loads ' + ', '.join(heavy) + ' ❌' if heavy else 'no heavy imports ✅'}")
+        if heavy:
+            failures.append(f"rendering {deck} loads {', '.join(heavy)}")
+
+    print("=" * 72)
+    if failures:
+        print(f"⚠️  {len(failures)} startup budget failure(s):")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+    print("✅ All generators within the start-up budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
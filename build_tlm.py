@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+TLM Build Orchestrator
+Rebuilds diagrams, the embedded HTML and the PPTX decks only when their inputs change
+"""
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from visualizations import DIAGRAMS, SHARED_MODULES
+
+REPO_ROOT = Path(__file__).resolve().parent
+BUILD_DIR = REPO_ROOT / ".build"
+STATE_FILE = BUILD_DIR / "state.json"
+
+# The deck scripts write to paths like 'TLM_Diabetes_Mellitus/x.pptx', i.e.
+# they expect to be run from the folder that contains the project checkout
+# under this name. Diagrams go through render_diagrams.py from the repo root.
+PROJECT_DIR_NAME = "TLM_Diabetes_Mellitus"
+
+EMBEDDER_SOURCES = ["auto_embed_images.py", "html_image_rewriter.py", "data_uri_cache.py", "image_optimizer.py",
+                    "icon_inliner.py", "responsive_images.py", "vector_diagrams.py", "figure_cache.py"]
+SHARED_DATA = [f"visualizations/{module}.py" for module in SHARED_MODULES]
+# How every diagram gets rendered: the entry point and the cache/rcParams it goes through
+DIAGRAM_RENDERER_SOURCES = ["render_diagrams.py", "figure_cache.py"]
+# Decks that draw the epidemiology panels as native charts instead of the PNG
+CHART_SOURCES = ["pptx_charts.py"] + SHARED_DATA
+# Every deck script compiles its decks/ spec with the shared renderer
+DECK_RENDERER_SOURCES = ["deck_renderer.py", "slide_specs.py", "decks/__init__.py", "pptx_optimizer.py"]
+
+
+class Target:
+    def __init__(self, name, inputs, outputs, command, cwd="project"):
+        """
+        inputs  -- repo-relative files whose content decides staleness
+        outputs -- repo-relative files the command produces
+        command -- argv run with the current Python interpreter
+        cwd     -- "project" (parent of the TLM_Diabetes_Mellitus folder) or "repo"
+        """
+        self.name = name
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.command = list(command)
+        self.cwd = cwd
+
+    def recipe(self):
+        """String that changes whenever the way this target is built changes"""
+        return json.dumps([self.command, self.cwd, self.outputs])
+
+
+def default_targets():
+    """Dependency graph of the TLM: diagram scripts -> PNGs -> embedded HTML and decks"""
+    targets = []
+    for diagram in DIAGRAMS:
+        targets.append(Target(
+            f"diagram:{diagram}",
+            inputs=[f"visualizations/{diagram}.py"] + SHARED_DATA + DIAGRAM_RENDERER_SOURCES,
+            outputs=[f"visualizations/{diagram}.png"],
+            command=["render_diagrams.py", diagram],
+            cwd="repo",
+        ))
+
+    pngs = [f"visualizations/{diagram}.png" for diagram in DIAGRAMS]
+    targets.append(Target(
+        "html:embedded",
+        inputs=["interactive/diabetes_interactive_tlm.html"] + EMBEDDER_SOURCES + pngs,
+        outputs=["interactive/diabetes_interactive_tlm_embedded.html"],
+        command=["auto_embed_images.py"],
+        cwd="repo",
+    ))
+
+    decks = [
+        ("create_comprehensive_pptx.py", "comprehensive", "Diabetes_Comprehensive_TLM_Presentation.pptx",
+         ["pathophysiology_diagram", "risk_factor_diagram", "treatment_algorithm",
+          "prevention_flowchart", "national_program_diagram"], CHART_SOURCES),
+        ("create_pptx_presentation.py", "tlm", "Diabetes_TLM_Presentation.pptx",
+         ["pathophysiology_diagram", "risk_factor_diagram", "treatment_algorithm",
+          "prevention_flowchart"], CHART_SOURCES),
+        ("create_control_prevention_pptx.py", "control_prevention", "Diabetes_Control_Prevention_Presentation.pptx",
+         ["control_strategies_diagram", "national_program_diagram"], []),
+        ("create_improved_pptx_with_npcdcs.py", "npcdcs",
+         "Diabetes_Enhanced_With_Comprehensive_NPCDCS_Presentation.pptx", [], []),
+    ]
+    for script, spec, output, diagrams, sources in decks:
+        targets.append(Target(
+            f"pptx:{Path(output).stem}",
+            inputs=[script, f"decks/{spec}.py"] + DECK_RENDERER_SOURCES + sources
+                   + [f"visualizations/{diagram}.png" for diagram in diagrams],
+            outputs=[output],
+            command=[f"{PROJECT_DIR_NAME}/{script}"],
+        ))
+    return targets
+
+
+def project_workspace():
+    """Directory from which 'TLM_Diabetes_Mellitus/...' resolves to this checkout"""
+    if REPO_ROOT.name == PROJECT_DIR_NAME:
+        return REPO_ROOT.parent
+    workspace = BUILD_DIR / "workspace"
+    link = workspace / PROJECT_DIR_NAME
+    if not link.exists():
+        workspace.mkdir(parents=True, exist_ok=True)
+        try:
+            os.symlink(REPO_ROOT, link, target_is_directory=True)
+        except OSError as e:
+            raise RuntimeError(
+                f"Could not link {link} -> {REPO_ROOT} ({e}). "
+                f"Check the project out into a folder named {PROJECT_DIR_NAME} instead."
+            )
+    return workspace
+
+
+class BuildGraph:
+    def __init__(self, targets=None, state_file=STATE_FILE, daemon=False):
+        """daemon=True renders diagrams in the pre-warmed render_daemon.py process"""
+        self.targets = {target.name: target for target in (targets or default_targets())}
+        self.daemon = daemon
+        self.state_file = Path(state_file)
+        self.state = {"files": {}, "targets": {}}
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (OSError, ValueError):
+            pass
+        self.producers = {output: target.name for target in self.targets.values() for output in target.outputs}
+
+    def fingerprint(self, relative_path):
+        """Content hash of a repo file, re-hashed only when its mtime or size changes"""
+        path = REPO_ROOT / relative_path
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        known = self.state["files"].get(relative_path)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["digest"]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        self.state["files"][relative_path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+        return digest
+
+    def snapshot(self, target):
+        """Fingerprints of everything that decides whether target is up to date"""
+        return {
+            "recipe": target.recipe(),
+            "inputs": {path: self.fingerprint(path) for path in target.inputs},
+            "outputs": {path: self.fingerprint(path) for path in target.outputs},
+        }
+
+    def is_stale(self, target):
+        snapshot = self.snapshot(target)
+        if None in snapshot["outputs"].values() or None in snapshot["inputs"].values():
+            return True
+        return self.state["targets"].get(target.name) != snapshot
+
+    def order(self, names=None):
+        """Targets in dependency order; names restricts to those targets and their upstream"""
+        ordered = []
+        visiting = set()
+
+        def visit(name):
+            if name in ordered:
+                return
+            if name in visiting:
+                raise RuntimeError(f"Dependency cycle through {name}")
+            visiting.add(name)
+            for path in self.targets[name].inputs:
+                if path in self.producers:
+                    visit(self.producers[path])
+            visiting.discard(name)
+            ordered.append(name)
+
+        for name in names or self.targets:
+            if name not in self.targets:
+                raise KeyError(f"Unknown target: {name}")
+            visit(name)
+        return [self.targets[name] for name in ordered]
+
+    def run(self, target):
+        cwd = project_workspace() if target.cwd == "project" else REPO_ROOT
+        command = list(target.command)
+        if self.daemon and command[0] == "render_diagrams.py":
+            # Not part of the recipe: the daemon renders byte-identical output
+            command.append("--daemon")
+        result = subprocess.run([sys.executable] + command, cwd=cwd,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            print(result.stdout[-2000:])
+            print(result.stderr[-2000:])
+        return result.returncode == 0
+
+    def rebuilt_upstream(self, target, rebuilt):
+        """Names in rebuilt that produce one of target's inputs"""
+        return [self.producers[path] for path in target.inputs if self.producers.get(path) in rebuilt]
+
+    def build(self, names=None, force=False, dry_run=False):
+        """Rebuild stale targets in order; returns (built, skipped, failed) name lists.
+
+        A dry run cannot see the outputs an upstream rebuild would write, so
+        it counts everything downstream of a would-be rebuild as stale too.
+        """
+        built, skipped, failed = [], [], []
+        for target in self.order(names):
+            upstream_failed = any(self.producers.get(path) in failed for path in target.inputs)
+            if upstream_failed:
+                print(f"⏭️  {target.name}: skipped (an input failed to build)")
+                failed.append(target.name)
+                continue
+            upstream = self.rebuilt_upstream(target, built) if dry_run else []
+            if not force and not upstream and not self.is_stale(target):
+                skipped.append(target.name)
+                continue
+            if dry_run:
+                reason = f" (after {', '.join(dict.fromkeys(upstream))})" if upstream else ""
+                print(f"🔨 {target.name}: would rebuild{reason}")
+                built.append(target.name)
+                continue
+
+            start = time.perf_counter()
+            ok = self.run(target)
+            elapsed = time.perf_counter() - start
+            if ok and None not in [self.fingerprint(path) for path in target.outputs]:
+                self.state["targets"][target.name] = self.snapshot(target)
+                built.append(target.name)
+                print(f"🔨 {target.name}: rebuilt in {elapsed:.2f}s")
+            else:
+                self.state["targets"].pop(target.name, None)
+                failed.append(target.name)
+                print(f"❌ {target.name}: failed after {elapsed:.2f}s")
+        if not dry_run:
+            self.save()
+        return built, skipped, failed
+
+    def save(self):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_file.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.state_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally rebuild the Diabetes TLM outputs")
+    parser.add_argument("targets", nargs="*", help="targets to build (default: all)")
+    parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+    parser.add_argument("--dry-run", action="store_true", help="only report what is stale")
+    parser.add_argument("--list", action="store_true", help="list targets and their status")
+    parser.add_argument("--daemon", action="store_true",
+                        help="render diagrams in the long-lived render_daemon.py process")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = BuildGraph(daemon=args.daemon)
+
+    if args.list:
+        stale = []
+        for target in graph.order(args.targets or None):
+            if graph.rebuilt_upstream(target, stale) or graph.is_stale(target):
+                stale.append(target.name)
+            status = "stale" if target.name in stale else "up to date"
+            print(f"{target.name:<60} {status}")
+        return 0
+
+    print("🏗️  DIABETES TLM BUILD")
+    print("=" * 50)
+    built, skipped, failed = graph.build(args.targets or None, force=args.force, dry_run=args.dry_run)
+    print("=" * 50)
+    print(f"✅ Rebuilt: {len(built)}  ⏩ Up to date: {len(skipped)}  ❌ Failed: {len(failed)}")
+    print(f"⏱️  Total: {time.perf_counter() - start:.3f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
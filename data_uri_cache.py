@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Data URI Cache
+Content-addressed on-disk cache of base64 data URIs shared by the embedders
+"""
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".embed_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB of encoded payloads
+DEFAULT_BLOCK_SIZE = 3 * 64 * 1024  # multiple of 3 so base64 blocks concatenate
+
+
+def encode_file_to_base64(image_path):
+    """Read a file and return (sha256 digest, base64 text); safe to run in a worker process"""
+    with open(image_path, 'rb') as f:
+        data = f.read()
+    return hashlib.sha256(data).hexdigest(), base64.b64encode(data).decode('ascii')
+
+
+def iter_file_blocks(image_path, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield raw blocks of a file; block_size should be a multiple of 3"""
+    with open(image_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            yield block
+
+
+def stream_file_base64(image_path, write, block_size=DEFAULT_BLOCK_SIZE):
+    """Base64-encode a file through write() one block at a time, without caching"""
+    for raw in iter_file_blocks(image_path, block_size):
+        write(base64.b64encode(raw).decode('ascii'))
+
+
+class DataUriCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.index_file = self.cache_dir / "index.json"
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._dirty = False
+        self._load_index()
+        self._evict()
+
+    def _load_index(self):
+        """Load the file index and the content entries from disk"""
+        # files:   absolute path -> {"mtime_ns", "size", "digest"}
+        # entries: digest -> {"bytes", "last_used"}
+        self.files = {}
+        self.entries = {}
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            self.files = index.get("files", {})
+            self.entries = index.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    def _entry_path(self, digest):
+        return self.cache_dir / f"{digest}.b64"
+
+    def _file_digest(self, path, stat):
+        """Content hash for path, reusing the stored one if mtime and size match"""
+        key = str(path)
+        known = self.files.get(key)
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["digest"], None
+
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        self.files[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+        self._dirty = True
+        return digest, data
+
+    def get_data_uri(self, image_path, mime_type=None):
+        """Return the data URI for image_path, encoding only on a cache miss"""
+        path = Path(image_path).resolve()
+        stat = path.stat()
+        if mime_type is None:
+            mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+        digest, data = self._file_digest(path, stat)
+        entry = self.entries.get(digest)
+        if entry is not None:
+            try:
+                with open(self._entry_path(digest), 'r', encoding='ascii') as f:
+                    encoded = f.read()
+                self.hits += 1
+                entry["last_used"] = time.time()
+                self._dirty = True
+                return f"data:{mime_type};base64,{encoded}"
+            except OSError:
+                del self.entries[digest]
+
+        self.misses += 1
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        encoded = base64.b64encode(data).decode('ascii')
+        self._store(digest, encoded)
+        return f"data:{mime_type};base64,{encoded}"
+
+    def _known_digest(self, path, stat):
+        """Digest of a cached payload for path if mtime and size still match"""
+        known = self.files.get(str(path))
+        if known and known["mtime_ns"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            if known["digest"] in self.entries:
+                return known["digest"]
+        return None
+
+    def _touch(self, digest):
+        self.hits += 1
+        self.entries[digest]["last_used"] = time.time()
+        self._dirty = True
+
+    def lookup(self, image_path, mime_type=None):
+        """Return the cached data URI without reading the image, or None.
+
+        Only succeeds when the file's mtime and size match a known entry;
+        anything else counts as a miss and should be encoded and add()-ed.
+        """
+        path = Path(image_path).resolve()
+        digest = self._known_digest(path, path.stat())
+        if digest is not None:
+            try:
+                with open(self._entry_path(digest), 'r', encoding='ascii') as f:
+                    encoded = f.read()
+            except OSError:
+                del self.entries[digest]
+            else:
+                self._touch(digest)
+                if mime_type is None:
+                    mime_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+                return f"data:{mime_type};base64,{encoded}"
+        self.misses += 1
+        return None
+
+    def stream_base64(self, image_path, write, block_size=DEFAULT_BLOCK_SIZE):
+        """Write the base64 payload of image_path through write() in fixed-size blocks.
+
+        A hit copies the cached payload; a miss encodes the image block by block
+        and tees the output into the cache. Memory use is one block either way.
+        """
+        path = Path(image_path).resolve()
+        stat = path.stat()
+        digest = self._known_digest(path, stat)
+        if digest is not None:
+            try:
+                cached = open(self._entry_path(digest), 'r', encoding='ascii')
+            except OSError:
+                del self.entries[digest]
+            else:
+                with cached:
+                    for block in iter(lambda: cached.read(block_size), ''):
+                        write(block)
+                self._touch(digest)
+                return
+
+        self.misses += 1
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / f"stream.tmp{os.getpid()}"
+        hasher = hashlib.sha256()
+        encoded_bytes = 0
+        try:
+            with open(tmp_path, 'w', encoding='ascii') as tee:
+                for raw in iter_file_blocks(path, block_size):
+                    hasher.update(raw)
+                    block = base64.b64encode(raw).decode('ascii')
+                    encoded_bytes += len(block)
+                    write(block)
+                    tee.write(block)
+
+            digest = hasher.hexdigest()
+            if encoded_bytes > self.max_bytes:
+                return
+            os.replace(tmp_path, self._entry_path(digest))
+        finally:
+            # A write() that raised, or a payload too big to keep, leaves no partial entry behind
+            if tmp_path.exists():
+                tmp_path.unlink()
+        self.files[str(path)] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+        self.entries[digest] = {"bytes": encoded_bytes, "last_used": time.time()}
+        self._dirty = True
+        self._evict()
+
+    def add(self, image_path, digest, encoded):
+        """Record a payload encoded elsewhere (e.g. by a worker process)"""
+        path = Path(image_path).resolve()
+        stat = path.stat()
+        self.files[str(path)] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "digest": digest}
+        self._store(digest, encoded)
+
+    def _store(self, digest, encoded):
+        """Write one encoded payload and evict old entries past max_bytes"""
+        if len(encoded) > self.max_bytes:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._entry_path(digest).with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, 'w', encoding='ascii') as f:
+            f.write(encoded)
+        os.replace(tmp_path, self._entry_path(digest))
+        self.entries[digest] = {"bytes": len(encoded), "last_used": time.time()}
+        self._dirty = True
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        total = sum(entry["bytes"] for entry in self.entries.values())
+        for digest in sorted(self.entries, key=lambda d: self.entries[d]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            total -= self.entries.pop(digest)["bytes"]
+            self._dirty = True
+            try:
+                self._entry_path(digest).unlink()
+            except OSError:
+                pass
+            self.evictions += 1
+
+    def save(self):
+        """Persist the index atomically (no-op when nothing changed)"""
+        if not self._dirty:
+            return
+        live = set(self.entries)
+        self.files = {key: info for key, info in self.files.items() if info["digest"] in live}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_file.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"files": self.files, "entries": self.entries}, f)
+        os.replace(tmp_path, self.index_file)
+        self._dirty = False
+
+    def clear(self):
+        """Remove every cached payload and the index"""
+        for digest in list(self.entries):
+            try:
+                self._entry_path(digest).unlink()
+            except OSError:
+                pass
+        self.files = {}
+        self.entries = {}
+        self._dirty = True
+        self.save()
+
+    def stats(self):
+        """Hit/miss counters for this process plus the on-disk footprint"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "total_bytes": sum(entry["bytes"] for entry in self.entries.values()),
+            "max_bytes": self.max_bytes,
+        }
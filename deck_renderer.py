@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Deck Renderer
+Compiles the slide specs in decks/ to PPTX, every deck in one process
+"""
+import copy
+import dataclasses
+import functools
+import importlib
+import sys
+import time
+from pathlib import Path
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.text import MSO_ANCHOR, MSO_AUTO_SIZE
+from pptx.oxml.ns import qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.text.text import Font as TextFont
+from pptx.util import Inches, Pt
+
+from decks import DECKS
+from pptx_optimizer import DEFAULT_DPI, PptxOptimizer
+from slide_specs import TITLE_ONLY_LAYOUT, Chart, Font, Paragraph, Picture, Placeholder, Table, TextBox
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+# What the untouched python-pptx template gives text boxes and titles (tx1 is black, both theme fonts Calibri)
+TEMPLATE_TEXT = Font(18, bold=False, italic=False, color=(0, 0, 0), name="Calibri")
+TEMPLATE_TITLE = Font(44, bold=False, italic=False, color=(0, 0, 0), name="Calibri")
+
+# Chart.builder -> "module:function" drawing into (slide, left, top, width, height)
+CHART_BUILDERS = {
+    "epidemiology": "pptx_charts:add_epidemiology_charts",
+}
+
+
+def load_deck(name):
+    """The Deck spec of decks/<name>.py"""
+    if name not in DECKS:
+        raise ValueError(f"Unknown deck: {name}")
+    return importlib.import_module(f"decks.{name}").DECK
+
+
+def chart_builder(name):
+    module_name, function = CHART_BUILDERS[name].split(":")
+    return getattr(importlib.import_module(module_name), function)
+
+
+@functools.lru_cache(maxsize=None)
+def override(font, style, template):
+    """The part of font that text inheriting style still has to set itself, or None
+
+    Attributes font leaves as None mean what the untouched template shows (template), so
+    text keeps its look when the theme moves a style into the master.
+    """
+    changes = {}
+    for attribute in (field.name for field in dataclasses.fields(Font)):
+        default = getattr(template, attribute)
+        value = getattr(font, attribute) if font is not None else None
+        value = default if value is None else value
+        inherited = getattr(style, attribute)
+        if value != (default if inherited is None else inherited):
+            changes[attribute] = value
+    return Font(**changes) if changes else None
+
+
+def set_font(element, font):
+    """Write the attributes font specifies onto a <a:defRPr>/<a:rPr> element"""
+    text_font = TextFont(element)
+    if font.size is not None:
+        text_font.size = Pt(font.size)
+    if font.bold is not None:
+        text_font.bold = font.bold
+    if font.italic is not None:
+        text_font.italic = font.italic
+    if font.color is not None:
+        text_font.color.rgb = RGBColor(*font.color)
+    if font.name is not None:
+        text_font.name = font.name
+
+
+class DeckRenderer:
+    def __init__(self, root=REPO_ROOT, optimizer=None):
+        """
+        root      -- folder that Picture paths are relative to and decks are written to
+        optimizer -- PptxOptimizer run on every saved deck (default: PptxOptimizer());
+                     False keeps decks exactly as python-pptx writes them
+        """
+        self.root = Path(root)
+        self.optimizer = PptxOptimizer() if optimizer is None else optimizer or None
+        # (tag, Font) -> resolved character properties element, copied onto each paragraph
+        self.fonts = {}
+        self.report = []
+
+    def font_element(self, tag, font):
+        """Fresh copy of the <a:defRPr>/<a:rPr> for font, resolved only once per style"""
+        element = self.fonts.get((tag, font))
+        if element is None:
+            element = OxmlElement(tag)
+            set_font(element, font)
+            self.fonts[(tag, font)] = element
+        return copy.deepcopy(element)
+
+    def apply_theme(self, prs, theme):
+        """Write the deck theme into the template once, before any slide is added"""
+        body = override(theme.body, Font(), TEMPLATE_TEXT)
+        if body is not None:
+            # Text boxes take the presentation default text style; the master's otherStyle mirrors it
+            styles = [prs.part._element.find(qn("p:defaultTextStyle")),
+                      prs.slide_master._element.find(qn("p:txStyles")).find(qn("p:otherStyle"))]
+            for style in styles:
+                for level in style:
+                    if level.tag != qn("a:defPPr"):
+                        set_font(level.find(qn("a:defRPr")), body)
+
+        # The title-only layout's title becomes the usual top-left heading text box
+        title = prs.slide_layouts[TITLE_ONLY_LAYOUT].placeholders.get(idx=0)
+        title.left, title.top, title.width, title.height = (Inches(value) for value in theme.title_box)
+        title.text_frame.word_wrap = False
+        title.text_frame.auto_size = MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
+        title.text_frame.vertical_anchor = MSO_ANCHOR.TOP
+        level = OxmlElement("a:lvl1pPr")
+        level.set("algn", "l")
+        title_font = override(theme.title, Font(), TEMPLATE_TITLE)
+        if title_font is not None:
+            level.append(self.font_element("a:defRPr", title_font))
+        title._element.txBody.find(qn("a:lstStyle")).append(level)
+
+    def fill_text(self, text_frame, paragraphs, style=None, template=None):
+        """Paragraphs into text_frame; given the style the frame inherits, fonts only keep what differs"""
+        for index, paragraph in enumerate(paragraphs):
+            if isinstance(paragraph, str):
+                paragraph = Paragraph(paragraph)
+            p = text_frame.paragraphs[0] if index == 0 else text_frame.add_paragraph()
+            p.text = paragraph.text
+            font = paragraph.font if style is None else override(paragraph.font, style, template)
+            if font is not None:
+                p._p.get_or_add_pPr()._insert_defRPr(self.font_element("a:defRPr", font))
+            if paragraph.level:
+                p.level = paragraph.level
+
+    def add_text_box(self, slide, spec, theme):
+        shape = slide.shapes.add_textbox(*(Inches(value) for value in spec.box))
+        self.fill_text(shape.text_frame, spec.paragraphs, theme.body, TEMPLATE_TEXT)
+
+    def add_placeholder(self, slide, spec, layout, theme):
+        placeholder = slide.placeholders[spec.idx]
+        themed_title = layout == TITLE_ONLY_LAYOUT and spec.idx == 0
+        if spec.box is not None and not (themed_title and tuple(spec.box) == tuple(theme.title_box)):
+            placeholder.left, placeholder.top, placeholder.width, placeholder.height = (
+                Inches(value) for value in spec.box)
+        if themed_title:
+            self.fill_text(placeholder.text_frame, spec.paragraphs, theme.title, TEMPLATE_TITLE)
+        else:
+            self.fill_text(placeholder.text_frame, spec.paragraphs)
+
+    def add_picture(self, slide, spec, theme):
+        path = self.root / spec.path
+        if path.exists():
+            slide.shapes.add_picture(str(path), *(Inches(value) for value in spec.box))
+        else:
+            for text_box in spec.fallback:
+                self.add_text_box(slide, text_box, theme)
+
+    def add_table(self, slide, spec, theme):
+        table = slide.shapes.add_table(len(spec.rows) + 1, len(spec.headers),
+                                       *(Inches(value) for value in spec.box)).table
+        header_font = override(spec.header_font, theme.body, TEMPLATE_TEXT)
+        cell_font = override(None, theme.body, TEMPLATE_TEXT)
+        for col, header in enumerate(spec.headers):
+            cell = table.cell(0, col)
+            cell.text = header
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = RGBColor(*spec.header_fill)
+            if header_font is not None:
+                for paragraph in cell.text_frame.paragraphs:
+                    for run in paragraph.runs:
+                        run._r._remove_rPr()
+                        run._r._insert_rPr(self.font_element("a:rPr", header_font))
+        for row_idx, row in enumerate(spec.rows, 1):
+            for col, value in enumerate(row):
+                cell = table.cell(row_idx, col)
+                cell.text = str(value)
+                if cell_font is not None:
+                    for paragraph in cell.text_frame.paragraphs:
+                        paragraph._p.get_or_add_pPr()._insert_defRPr(self.font_element("a:defRPr", cell_font))
+                if spec.band_fill is not None and row_idx % 2 == 0:
+                    cell.fill.solid()
+                    cell.fill.fore_color.rgb = RGBColor(*spec.band_fill)
+
+    def add_slide(self, prs, spec, theme):
+        slide = prs.slides.add_slide(prs.slide_layouts[spec.layout])
+        if spec.background is not None:
+            fill = slide.background.fill
+            fill.gradient()
+            fill.gradient_angle = 270  # counter-clockwise from 3 o'clock, so top to bottom
+            for stop, color in zip(fill.gradient_stops, spec.background):
+                stop.color.rgb = RGBColor(*color)
+        for shape in spec.shapes:
+            if isinstance(shape, TextBox):
+                self.add_text_box(slide, shape, theme)
+            elif isinstance(shape, Placeholder):
+                self.add_placeholder(slide, shape, spec.layout, theme)
+            elif isinstance(shape, Picture):
+                self.add_picture(slide, shape, theme)
+            elif isinstance(shape, Chart):
+                chart_builder(shape.builder)(slide, *(Inches(value) for value in shape.box))
+            elif isinstance(shape, Table):
+                self.add_table(slide, shape, theme)
+            else:
+                raise TypeError(f"Unknown shape spec: {type(shape).__name__}")
+        return slide
+
+    def render(self, deck):
+        """Presentation for a Deck spec"""
+        prs = Presentation()
+        prs.slide_width = Inches(deck.width)
+        prs.slide_height = Inches(deck.height)
+        self.apply_theme(prs, deck.theme)
+        for spec in deck.slides:
+            self.add_slide(prs, spec, deck.theme)
+        return prs
+
+    def build(self, deck, output_dir=None):
+        """Render, save and optimise one deck; returns (output path, Presentation as rendered)"""
+        start = time.perf_counter()
+        prs = self.render(deck)
+        rendered = time.perf_counter()
+        output_path = Path(output_dir or self.root) / deck.output
+        prs.save(output_path)
+        saved = time.perf_counter()
+        raw_bytes = output_path.stat().st_size
+        if self.optimizer is not None:
+            self.optimizer.optimize(output_path)
+        self.report.append({
+            "deck": deck.output,
+            "slides": len(prs.slides),
+            "render_seconds": rendered - start,
+            "save_seconds": saved - rendered,
+            "optimize_seconds": time.perf_counter() - saved,
+            "raw_bytes": raw_bytes,
+            "bytes": output_path.stat().st_size,
+        })
+        return output_path, prs
+
+    def print_report(self):
+        """Per-deck table of slides, render, save and optimise time and file size before and after"""
+        if not self.report:
+            return
+        print(f"{'Deck':<62} {'Slides':>6} {'Render s':>9} {'Save s':>7} {'Opt s':>6} {'Raw KB':>9} {'KB':>7}")
+        for row in self.report:
+            print(f"{row['deck']:<62} {row['slides']:>6} {row['render_seconds']:>9.3f} "
+                  f"{row['save_seconds']:>7.3f} {row['optimize_seconds']:>6.2f} "
+                  f"{row['raw_bytes'] / 1024:>9.0f} {row['bytes'] / 1024:>7.0f}")
+
+
+def main():
+    import argparse  # only the CLI needs it; the create_*_pptx.py scripts import this module for DeckRenderer
+
+    parser = argparse.ArgumentParser(description="Build the TLM PowerPoint decks from their slide specs")
+    parser.add_argument("decks", nargs="*", help=f"decks to build (default: all of {', '.join(DECKS)})")
+    parser.add_argument("--output-dir", help="where the .pptx files go (default: next to this script)")
+    parser.add_argument("--dpi", type=float, default=DEFAULT_DPI,
+                        help=f"resolution pictures keep at their size on the slide (default: {DEFAULT_DPI})")
+    parser.add_argument("--no-optimize", action="store_true",
+                        help="keep the decks as python-pptx saves them: full-size pictures, every layout")
+    args = parser.parse_args()
+
+    unknown = set(args.decks) - set(DECKS)
+    if unknown:
+        raise SystemExit(f"Unknown decks: {', '.join(sorted(unknown))}")
+
+    if args.output_dir:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    print("📊 DIABETES TLM - DECK RENDERER")
+    print("=" * 50)
+    start = time.perf_counter()
+    renderer = DeckRenderer(optimizer=False if args.no_optimize else PptxOptimizer(dpi=args.dpi))
+    for name in args.decks or DECKS:
+        output_path, _ = renderer.build(load_deck(name), args.output_dir)
+        print(f"✅ {name}: {output_path}")
+    print("=" * 50)
+    renderer.print_report()
+    print(f"⏱️  {time.perf_counter() - start:.2f}s ({len(renderer.fonts)} resolved styles)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
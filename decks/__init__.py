@@ -0,0 +1,14 @@
+"""
+Slide specs of the TLM decks
+
+Each module exposes DECK, a slide_specs.Deck that deck_renderer.py compiles
+to PPTX. Its theme picks the title and body styles the slide master carries,
+so slides only spell out fonts that differ from them.
+"""
+
+DECKS = [
+    "comprehensive",
+    "tlm",
+    "control_prevention",
+    "npcdcs",
+]
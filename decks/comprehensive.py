@@ -0,0 +1,625 @@
+"""
+Comprehensive deck: definitions through epidemiology, management, prevention and NPCDCS
+"""
+from slide_specs import (
+    AMBER, BLUE, DARK_GREEN, GREEN, GREY, NAVY, PURPLE, RED, SLATE, TITLE_AND_CONTENT_LAYOUT, Chart, Deck, Font,
+    Paragraph, Picture, Placeholder, Slide, TextBox, Theme, note, section, title, title_slide,
+)
+
+
+TITLE = title_slide(
+    "title",
+    "Diabetes Mellitus: Comprehensive Teaching Learning Material",
+    Font(44, bold=True, color=NAVY),
+    "Epidemiology, Pathophysiology, Management & Prevention\nMBBS Medical Education | Latest Research 2024-2025",
+    Font(20, color=SLATE),
+)
+
+
+OVERVIEW = Slide([
+    Placeholder(0, [
+        Paragraph("Comprehensive Diabetes Overview", Font(36, bold=True, color=NAVY)),
+    ]),
+    Placeholder(1, [
+        "",
+        Paragraph("• DEFINITION & CLASSIFICATION - ADA/WHO Criteria 2024", Font(18, color=SLATE)),
+        Paragraph("• GLOBAL EPIDEMIOLOGY - 537M cases, 11.3% prevalence", Font(18, color=SLATE)),
+        Paragraph("• PATHOGENESIS - β-cell dysfunction, insulin resistance", Font(18, color=SLATE)),
+        Paragraph("• CLINICAL FEATURES - Symptoms, complications spectrum", Font(18, color=SLATE)),
+        Paragraph("• DIAGNOSIS - FPG, OGTT, HbA1c thresholds", Font(18, color=SLATE)),
+        Paragraph("• MANAGEMENT - Lifestyle, pharmacological, technology", Font(18, color=SLATE)),
+        Paragraph("• CONTROL STRATEGIES - Glycemic targets, monitoring", Font(18, color=SLATE)),
+        Paragraph("• PREVENTION - DPP model, lifestyle intervention", Font(18, color=SLATE)),
+        Paragraph("• NATIONAL PROGRAMME - NPCDCS implementation", Font(18, color=SLATE)),
+        Paragraph("• FUTURE DIRECTIONS - Precision medicine, AI, stem cells", Font(18, color=SLATE)),
+    ]),
+    note((0.5, 5.5, 9, 1.5), "LEARNING OBJECTIVES: Define, diagnose, manage diabetes comprehensively; Apply evidence-based prevention strategies; Understand national programmes and future innovations", Font(12, bold=True, color=RED)),
+], layout=TITLE_AND_CONTENT_LAYOUT, name="overview")
+
+
+DEFINITIONS = Slide([
+    title("Diabetes Mellitus: Definition & Classification (ADA 2024)"),
+    section((0.5, 1.2, 4.25, 2), "WORLD HEALTH ORGANIZATION DEFINITION", Font(16, bold=True, color=BLUE), [
+        "• Chronic hyperglycemia due to defects in:",
+        "  - Insulin secretion (β-cell dysfunction)",
+        "  - Insulin action (insulin resistance)",
+        "  - Both mechanisms",
+        "• Characterized by disturbances in:",
+        "  - Carbohydrate, fat, and protein metabolism",
+    ], Font(12)),
+    section((5, 1.2, 4.25, 2), "ADA CLASSIFICATION SYSTEM", Font(16, bold=True, color=GREEN), [
+        "• Type 1 DM: Autoimmune β-cell destruction",
+        "• Type 2 DM: Insulin resistance + relative insulin deficiency",
+        "• Gestational DM: Glucose intolerance in pregnancy",
+        "• Other specific types: Monogenic, drug-induced, etc.",
+        "• Prediabetes: IFG, IGT, or both",
+    ], Font(12)),
+    note((0.5, 3.8, 9, 1.5), "HISTORICAL EVOLUTION: Ancient descriptions → 1921 Insulin discovery → 1950s Oral agents → 1980s HbA1c → 2020s CGM/Precision medicine", Font(14, bold=True, color=NAVY)),
+], name="definitions")
+
+
+TYPES_DIABETES = Slide([
+    title("Classification of Diabetes Mellitus"),
+    TextBox((0.5, 1.2, 2.2, 4), [
+        Paragraph("TYPE 1 DM", Font(14, bold=True, color=RED)),
+        "(5-10%)",
+        Paragraph("• Age: Usually <30 years", Font(10)),
+        Paragraph("• Onset: Acute/rapid", Font(10)),
+        Paragraph("• Autoantibodies: GAD, IA2", Font(10)),
+        Paragraph("• C-peptide: Low/absent", Font(10)),
+        Paragraph("• HLA association: DR3/4", Font(10)),
+        Paragraph("• Complications: Ketoacidosis common", Font(10)),
+    ]),
+    TextBox((2.9, 1.2, 2.2, 4), [
+        Paragraph("TYPE 2 DM", Font(14, bold=True, color=BLUE)),
+        "(90-95%)",
+        Paragraph("• Age: Usually >40 years", Font(10)),
+        Paragraph("• Onset: Insidious/gradual", Font(10)),
+        Paragraph("• Insulin resistance: Primary", Font(10)),
+        Paragraph("• C-peptide: Initially normal", Font(10)),
+        Paragraph("• Obesity: Common", Font(10)),
+        Paragraph("• Family history: Strong", Font(10)),
+    ]),
+    section((5.3, 1.2, 2.2, 4), "OTHER SPECIFIC TYPES", Font(14, bold=True, color=PURPLE), [
+        "• MODY: Maturity onset",
+        "• LADA: Latent autoimmune",
+        "• Neonatal DM",
+        "• Drug-induced (steroids)",
+        "• Pancreatic diseases",
+        "• Genetic syndromes",
+    ], Font(10)),
+    section((7.7, 1.2, 2.2, 4), "GESTATIONAL & PREDIABETES", Font(14, bold=True, color=GREEN), [
+        "• GDM: Pregnancy onset",
+        "• Prediabetes: IFG/IGT",
+        "• Risk of T2DM: High",
+        "• Screening: Universal",
+        "• Management: Lifestyle ± metformin",
+        "• Postpartum monitoring",
+    ], Font(10)),
+], name="types_diabetes")
+
+
+EPIDEMIOLOGY_GLOBAL = Slide([
+    title("Global Diabetes Epidemiology (IDF 2021)"),
+    section((0.5, 1.2, 4.25, 4), "GLOBAL BURDEN STATISTICS", Font(16, bold=True, color=RED), [
+        "• 537 MILLION adults with diabetes (2021)",
+        "• 1 in 10 adults affected worldwide",
+        "• 541 million in prediabetes stage",
+        "• 75% live in low- and middle-income countries",
+        "• 6.7 million deaths annually",
+        "• $966 billion healthcare expenditure",
+        "• Projected: 783 million by 2045",
+    ], Font(12, bold=True)),
+    section((5, 1.2, 4.25, 4), "REGIONAL PREVALENCE (%)", Font(16, bold=True, color=PURPLE), [
+        "• Middle East & North Africa: 14.0%",
+        "• North America: 11.7%",
+        "• South & Central America: 9.9%",
+        "• South Asia: 8.8%",
+        "• East Asia & Pacific: 8.4%",
+        "• Western Europe: 5.4%",
+        "• Sub-Saharan Africa: 3.3%",
+    ], Font(12)),
+    note((2, 5.8, 6, 0.8), "TREND: 3-fold increase since 1980; Slowing growth in high-income countries; Rapid rise in LMICs", Font(12, bold=True, color=NAVY)),
+], name="epidemiology_global")
+
+
+EPIDEMIOLOGY_INDIA = Slide([
+    title("Diabetes Epidemiology in India"),
+    section((0.5, 1.2, 4.25, 3), "INDIA DIABETES BURDEN (2021)", Font(16, bold=True, color=DARK_GREEN), [
+        "• 101.2 MILLION people with diabetes",
+        "• 11.4% prevalence (20-79 years)",
+        "• Second highest globally after China",
+        "• 136 million with prediabetes",
+        "• Annual cost: INR 2.5-3 lakh crores",
+        "• Projected: 140 million by 2030",
+    ], Font(12, bold=True)),
+    section((5, 1.2, 4.25, 3), "REGIONAL VARIATIONS IN INDIA", Font(16, bold=True, color=BLUE), [
+        "• Kerala, Punjab, Tamil Nadu: >15%",
+        "• Andhra Pradesh, Karnataka: 13-15%",
+        "• Maharashtra, Gujarat: 10-13%",
+        "• Rural areas: Lower prevalence",
+        "• Urban-rural ratio: 2:1",
+    ], Font(12)),
+    note((0.5, 5, 9, 2), "KEY CONTRIBUTING FACTORS: Urbanization, lifestyle changes, genetic predisposition, low birth weight, dietary transition, physical inactivity", Font(12, bold=True, color=NAVY)),
+], name="epidemiology_india")
+
+
+EPIDEMIOLOGY_VISUAL = Slide([
+    title("Diabetes Trends: Global vs India"),
+    Chart("epidemiology", (0.5, 1.2, 9, 5.5)),
+], name="epidemiology_visual")
+
+
+PATHOPHYSIOLOGY = Slide([
+    title("Pathophysiology of Diabetes Mellitus"),
+    section((0.5, 1.2, 2.6, 2.5), "NORMAL GLUCOSE METABOLISM", Font(14, bold=True, color=GREEN), [
+        "• Insulin secretion (β-cells)",
+        "• Insulin action (target tissues)",
+        "• Glucose uptake (GLUT4 translocation)",
+        "• Glycogen synthesis",
+        "• Gluconeogenesis suppression",
+    ], Font(11)),
+    section((3.3, 1.2, 2.6, 2.5), "TYPE 1 DM PATHOGENESIS", Font(14, bold=True, color=RED), [
+        "• Autoimmune destruction of β-cells",
+        "• Genetic susceptibility (HLA-DR3/4)",
+        "• Environmental triggers (virus?)",
+        "• Insulitis → absolute insulin deficiency",
+        "• Ketoacidosis risk high",
+    ], Font(11)),
+    section((6.1, 1.2, 2.6, 2.5), "TYPE 2 DM PATHOGENESIS", Font(14, bold=True, color=BLUE), [
+        "• Insulin resistance (primary defect)",
+        "• β-cell dysfunction (secondary)",
+        "• Increased gluconeogenesis",
+        "• Decreased insulin secretion",
+        "• Chronic inflammation",
+    ], Font(11)),
+], name="pathophysiology")
+
+
+PATHOPHYSIOLOGY_VISUAL = Slide([
+    title("Molecular Mechanisms in Diabetes Pathogenesis"),
+    Picture("visualizations/pathophysiology_diagram.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1, 1.5, 8, 4.5), "KEY PATHOGENIC MECHANISMS:", Font(12, color=NAVY), [
+            "",
+            "1. INSULIN RESISTANCE:",
+            "   • Impaired IRS-1/PI3K signaling",
+            "   • Increased FFA flux (adipose tissue)",
+            "   • Inflammation (TNF-α, IL-6)",
+            "   • Mitochondrial dysfunction",
+            "",
+            "2. β-CELL DYSFUNCTION:",
+            "   • Amyloid deposition",
+            "   • Oxidative stress",
+            "   • Glucotoxicity & lipotoxicity",
+            "   • Impaired insulin processing",
+            "",
+            "3. LIVER: Increased gluconeogenesis (PEPCK, G6Pase upregulation)",
+            "",
+            "4. MUSCLE: Reduced GLUT4 translocation, glycogen synthesis",
+            "",
+            "5. ADIPOSE: Adipokine imbalance (↓adiponectin, ↑leptin resistance)",
+        ]),
+    ]),
+], name="pathophysiology_visual")
+
+
+RISK_FACTORS = Slide([
+    title("Risk Factors for Diabetes Mellitus"),
+    section((0.5, 1.2, 3, 2.5), "NON-MODIFIABLE RISK FACTORS", Font(14, bold=True, color=RED), [
+        "• Age >45 years",
+        "• Family history (first-degree)",
+        "• Genetics (T2DM: polygenic)",
+        "• Ethnicity (South Asians high risk)",
+        "• Previous GDM",
+        "• Low birth weight",
+    ], Font(11)),
+    section((3.8, 1.2, 3, 2.5), "MODIFIABLE LIFESTYLE FACTORS", Font(14, bold=True, color=BLUE), [
+        "• Obesity (BMI >25 kg/m²)",
+        "• Central obesity (waist ≥90cm M, ≥80cm F)",
+        "• Physical inactivity (<150 min/week)",
+        "• Unhealthy diet (high refined carbs)",
+        "• Smoking and alcohol excess",
+        "• Sleep deprivation (<7 hours)",
+    ], Font(11)),
+    section((7, 1.2, 2.75, 2.5), "MEDICAL CONDITIONS", Font(14, bold=True, color=GREEN), [
+        "• Polycystic ovary syndrome",
+        "• Metabolic syndrome",
+        "• Hypertension",
+        "• Dyslipidemia",
+        "• NAFLD",
+        "• Psychiatric disorders",
+    ], Font(11)),
+    note((0.5, 4.2, 9, 1), "INDIAN DIABETES RISK SCORE (IDRS): Age + BMI + Waist + FH + Activity. Score ≥60 = High risk. Validated for Asian Indians.", Font(12, bold=True, color=NAVY)),
+], name="risk_factors")
+
+
+RISK_FACTORS_VISUAL = Slide([
+    title("Risk Factor Interactions & Prevention Opportunities"),
+    Picture("visualizations/risk_factor_diagram.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1.5, 2, 7, 4), "RISK FACTOR MODEL:", Font(16), [
+            "",
+            "  Genetics + Environment → Insulin Resistance",
+            "                ↓",
+            "β-cell Compensation → Failure → Hyperglycemia",
+            "                ↓",
+            "T2DM Development → Micro/Macrovascular Complications",
+            "",
+            "PREVENTION OPPORTUNITIES:",
+            "• Primary: Lifestyle intervention at risk stage",
+            "• Secondary: Early detection and intervention",
+            "• Tertiary: Optimal control to prevent complications",
+        ], Font(16)),
+    ]),
+], name="risk_factors_visual")
+
+
+CLINICAL_FEATURES = Slide([
+    title("Clinical Features of Diabetes Mellitus"),
+    section((0.5, 1.2, 3, 2.5), "CLASSIC SYMPTOMS (3P's)", Font(14, bold=True, color=RED), [
+        "• Polyuria (increased urination)",
+        "• Polydipsia (increased thirst)",
+        "• Polyphagia (increased hunger)",
+        "• Unexplained weight loss",
+        "• Fatigue and weakness",
+        "• Blurred vision",
+    ], Font(11)),
+    section((3.8, 1.2, 3, 2.5), "ASYMPTOMATIC PRESENTATION", Font(14, bold=True, color=BLUE), [
+        "• Routine screening detection",
+        "• Incidental hyperglycemia",
+        "• Complications presentation",
+        "• Associated conditions",
+        "• Type 2 DM common pattern",
+        "• Delayed diagnosis risks",
+    ], Font(11)),
+    section((7, 1.2, 2.75, 2.5), "PHYSICAL EXAMINATION", Font(14, bold=True, color=PURPLE), [
+        "• BMI and waist circumference",
+        "• Blood pressure measurement",
+        "• Signs of dehydration",
+        "• Insulin resistance markers",
+        "• Foot examination",
+        "• Oral health assessment",
+    ], Font(11)),
+    note((0.5, 4.2, 9, 1.5), "DIFFERENTIAL PRESENTATION: T1DM often acute with DKA risk; T2DM usually insidious with complications; GDM detected during pregnancy screening; MODY may present with mild symptoms", Font(12, bold=True, color=NAVY)),
+], name="clinical_features")
+
+
+DIAGNOSIS_CRITERIA = Slide([
+    title("Diagnosis of Diabetes Mellitus (ADA 2024)"),
+    section((0.5, 1.2, 4, 4), "DIAGNOSTIC THRESHOLDS", Font(16, bold=True, color=BLUE), [
+        "• HbA1c ≥ 6.5% (NGSP certified)",
+        "• FPG ≥ 126 mg/dL (8.0 mmol/L)",
+        "• 2h-PG ≥ 200 mg/dL (11.1 mmol/L)",
+        "• Random PG ≥ 200 mg/dL + symptoms",
+        "• OGTT: 75g glucose load",
+        "• Repeat testing for confirmation",
+    ], Font(12)),
+    section((5, 1.2, 4, 4), "PREDIABETES CRITERIA", Font(16, bold=True, color=GREEN), [
+        "• IFG: FPG 100-125 mg/dL (5.6-6.9 mmol/L)",
+        "• IGT: 2h-PG 140-199 mg/dL (7.8-11.0 mmol/L)",
+        "• HbA1c 5.7-6.4% (may be included)",
+        "• High risk for T2DM progression",
+        "• Requires lifestyle intervention",
+        "• Annual monitoring recommended",
+    ], Font(12)),
+    note((0.5, 5.8, 9, 0.8), "SPECIAL SITUATIONS: Pregnancy (IADPSG criteria), children (pediatric thresholds), symptomatic patients (random glucose)", Font(12, bold=True, color=NAVY)),
+], name="diagnosis_criteria")
+
+
+TREATMENT_OVERVIEW = Slide([
+    title("Management of Diabetes Mellitus"),
+    section((0.5, 1.2, 3.5, 3), "NON-PHARMACOLOGICAL MANAGEMENT", Font(14, bold=True, color=GREEN), [
+        "• Diabetes Self-Management Education (DSME)",
+        "• Medical Nutrition Therapy (MNT)",
+        "• Physical Activity (150 min/week)",
+        "• Weight Management (5-10% weight loss)",
+        "• Smoking Cessation",
+        "• Problem Solving Support",
+    ], Font(11)),
+    section((4.5, 1.2, 5, 3), "PHARMACOLOGICAL MANAGEMENT", Font(14, bold=True, color=BLUE), [
+        "• Metformin: First-line for T2DM",
+        "• SGLT2i: CV and renal benefits (empagliflozin)",
+        "• GLP-1 RA: Weight loss and CV protection (semaglutide)",
+        "• DPP-4i: Low hypoglycemia risk (sitagliptin)",
+        "• Insulin: Essential for T1DM, progressive T2DM",
+        "• TZDs: Insulin sensitizers (pioglitazone)",
+    ], Font(11)),
+    note((0.5, 4.8, 9, 2), "INSULIN THERAPY: Basal (long-acting) + Bolus (rapid-acting). Regimens: Basal-bolus, premixed, basal-plus. Individualized based on needs, lifestyle, and response.", Font(12, bold=True, color=NAVY)),
+], name="treatment_overview")
+
+
+TREATMENT_ALGORITHM = Slide([
+    title("ADA Treatment Algorithm for Type 2 Diabetes"),
+    Picture("visualizations/treatment_algorithm.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1, 1.5, 8, 4.5), "ADA TREATMENT ALGORITHM FOR T2DM:", Font(12, color=NAVY), [
+            "",
+            "1. Diagnosis → Lifestyle + Metformin",
+            "",
+            "2. Metformin monotherapy → Add second agent:",
+            "   • CV risk high: SGLT2i or GLP-1 RA",
+            "   • CV risk low + weight concern: GLP-1 RA",
+            "   • No weight concern: DPP-4i or SGLT2i",
+            "",
+            "3. Triple therapy → Add insulin if needed",
+            "",
+            "4. Insulin → Intensive regimen (basal-bolus)",
+            "",
+            "5. Consider comorbidities: CKD (avoid metformin), HF (SGLT2i)",
+        ]),
+    ]),
+], name="treatment_algorithm")
+
+
+CONTROL_TARGETS = Slide([
+    title("Glycemic Control Targets (ADA 2024)"),
+    section((0.5, 1.2, 4.25, 3), "GENERAL TARGETS", Font(18, bold=True, color=BLUE), [
+        "• HbA1c: <7.0% (most adults)",
+        "• Preprandial glucose: 80-130 mg/dL",
+        "• Peak postprandial: <180 mg/dL",
+        "• Bedtime glucose: 100-140 mg/dL",
+        "• TIR (Time in Range): >70%",
+    ], Font(16)),
+    section((5, 1.2, 4.25, 3), "INDIVIDUALIZED TARGETS", Font(18, bold=True, color=GREEN), [
+        "• Young patients (<40): HbA1c <6.5-7.0%",
+        "• Elderly (≥65): HbA1c 7.5-8.0%",
+        "• Longstanding DM (>10y): More liberal",
+        "• High CV risk: Stringent control",
+        "• Frequent hypoglycemia: Relaxed targets",
+    ], Font(16)),
+    note((0.5, 4.5, 9, 2), "LATEST EVIDENCE (2024): TIR >70% and HbA1c <7% balance benefits vs. hypoglycemia. GRADE study: Intensive control (HbA1c <6.5%) prevents complications but increases hypoglycemia. Personalized targets based on CGM, comorbidities, and patient preferences.", Font(14, color=NAVY)),
+], name="control_targets")
+
+
+MONITORING = Slide([
+    title("Diabetes Monitoring Strategies (2024)"),
+    section((0.5, 1.2, 2.8, 2.5), "SELF-MONITORING OF BLOOD GLUCOSE", Font(14, bold=True, color=BLUE), [
+        "• T2DM oral agents: 1-2x daily",
+        "• T2DM on insulin: 2-4x daily",
+        "• T1DM: 4-6x daily (basal-bolus)",
+        "• Pre/postprandial monitoring",
+        "• Pattern recognition",
+    ], Font(11)),
+    section((3.5, 1.2, 2.8, 2.5), "CONTINUOUS GLUCOSE MONITORING", Font(14, bold=True, color=PURPLE), [
+        "• TIR (>70%): Primary outcome",
+        "• TBR (<4%): Minimize hypo",
+        "• TAR (<25%): Manage hyper",
+        "• AGP analysis",
+        "• Real-time vs. intermittent",
+    ], Font(11)),
+    section((6.3, 1.2, 3, 2.5), "COMPREHENSIVE MONITORING", Font(14, bold=True, color=GREEN), [
+        "• HbA1c: Every 3-6 months",
+        "• Lipid profile: Annual",
+        "• Kidney function: eGFR, ACR",
+        "• Eye examination: Annual",
+        "• Foot assessment: Annual",
+    ], Font(11)),
+    note((0.5, 4.2, 9, 1.5), "2024 ADVANCES: AI-powered CGM with predictive alerts, integrated digital platforms, remote monitoring capabilities, automated insulin delivery systems", Font(12, bold=True, color=NAVY)),
+], name="monitoring")
+
+
+PREVENTION_OVERVIEW = Slide([
+    title("Diabetes Prevention: Evidence-Based Strategies"),
+    TextBox((0.5, 1.2, 2.8, 2.5), [
+        Paragraph("PRIMARY PREVENTION", Font(14, bold=True, color=RED)),
+        "(Prevent Onset)",
+        Paragraph("• Target: High-risk prediabetics", Font(10)),
+        Paragraph("• DPP model: 58% reduction", Font(10)),
+        Paragraph("• Intensive lifestyle intervention", Font(10)),
+        Paragraph("• 5-7% weight loss", Font(10)),
+        Paragraph("• 150 min/week activity", Font(10)),
+        Paragraph("• Metformin optional (BMI ≥35)", Font(10)),
+    ]),
+    TextBox((3.5, 1.2, 2.8, 2.5), [
+        Paragraph("SECONDARY PREVENTION", Font(14, bold=True, color=AMBER)),
+        "(Delay Progression)",
+        Paragraph("• Prediabetes management", Font(10)),
+        Paragraph("• IFG: 100-125 mg/dL", Font(10)),
+        Paragraph("• IGT: 140-199 mg/dL (2h)", Font(10)),
+        Paragraph("• Lifestyle first-line", Font(10)),
+        Paragraph("• Metformin if BMI ≥35", Font(10)),
+        Paragraph("• Annual monitoring", Font(10)),
+    ]),
+    TextBox((6.3, 1.2, 2.8, 2.5), [
+        Paragraph("TERTIARY PREVENTION", Font(14, bold=True, color=DARK_GREEN)),
+        "(Prevent Complications)",
+        Paragraph("• Established diabetes", Font(10)),
+        Paragraph("• Optimal glycemic control", Font(10)),
+        Paragraph("• Complication screening", Font(10)),
+        Paragraph("• CV risk management", Font(10)),
+        Paragraph("• Multidisciplinary care", Font(10)),
+        Paragraph("• Lifestyle reinforcement", Font(10)),
+    ]),
+    note((0.5, 4.2, 9, 1.5), "EVIDENCE: DPP trial showed 58% diabetes prevention with lifestyle alone. Da Qing study: 46% reduction in China. Indian DPP study: 28.5% reduction with lifestyle intervention.", Font(12, bold=True, color=NAVY)),
+], name="prevention_overview")
+
+
+PREVENTION_FLOWCHART = Slide([
+    title("Diabetes Prevention Decision Flowchart"),
+    Picture("visualizations/prevention_flowchart.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1, 1.5, 8, 4.5), "PREVENTION DECISION ALGORITHM:", Font(12, color=NAVY), [
+            "",
+            "1. RISK ASSESSMENT",
+            "   • IDRS >60 or prediabetes criteria met",
+            "",
+            "2. PRIMARY PREVENTION (High-risk individuals)",
+            "   • Intensive lifestyle intervention (DPP model)",
+            "   • 16 sessions in 24 weeks",
+            "   • 5-7% weight loss + 150 min/week activity",
+            "   • Metformin if BMI ≥35 kg/m²",
+            "",
+            "3. SECONDARY PREVENTION (Prediabetes)",
+            "   • Lifestyle modification",
+            "   • Metformin if indicated",
+            "   • Annual glucose monitoring",
+            "",
+            "4. MONITORING & FOLLOW-UP",
+            "   • Quarterly metabolic assessments",
+            "   • Reinforce lifestyle changes",
+            "   • Address barriers to adherence",
+        ]),
+    ]),
+], name="prevention_flowchart")
+
+
+NATIONAL_PROGRAM = Slide([
+    title("National Programme for Prevention & Control of Diabetes", 28),
+    note((0.5, 0.9, 9, 0.3), "NPCDCS - Ministry of Health & Family Welfare, India (2010-ongoing)", Font(14, color=GREY)),
+    section((0.5, 1.3, 3.5, 2), "KEY OBJECTIVES", Font(14, bold=True, color=BLUE), [
+        "• 25% reduction in premature mortality",
+        "• Early diagnosis and treatment",
+        "• Health promotion and prevention",
+        "• Capacity building of healthcare workers",
+        "• Improved quality of life for patients",
+    ], Font(11)),
+    section((4.5, 1.3, 3.5, 2), "PROGRAM COMPONENTS", Font(14, bold=True, color=GREEN), [
+        "• NCD clinics at district level",
+        "• Population-based screening",
+        "• Free diagnostic services",
+        "• Drug procurement and distribution",
+        "• Health promotion activities",
+        "• Training and IEC activities",
+    ], Font(11)),
+    note((0.5, 3.8, 9, 1.8), "IMPLEMENTATION: Multi-tier approach (National-State-District-Community). Key achievements: 355 operational NCD clinics, over 4 crore screenings, oral drug distribution to 50 lakh patients. Integration with Ayushman Bharat and health wellness centres.", Font(12, bold=True, color=NAVY)),
+], name="national_program")
+
+
+NATIONAL_PROGRAM_VISUAL = Slide([
+    title("NPCDCS Implementation Framework"),
+    Picture("visualizations/national_program_diagram.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1, 1.5, 8, 4.5), "NPCDCS IMPLEMENTATION FRAMEWORK:", Font(12, color=NAVY), [
+            "",
+            "NATIONAL LEVEL",
+            "• Policy formulation, resource allocation",
+            "• Technical guidelines development",
+            "• Monitoring and evaluation",
+            "",
+            "STATE LEVEL",
+            "• State programme implementation",
+            "• Human resource development",
+            "• Quality assurance",
+            "",
+            "DISTRICT LEVEL",
+            "• NCD clinics establishment",
+            "• Screening camps organization",
+            "• Referral systems setup",
+            "",
+            "COMMUNITY LEVEL",
+            "• ASHA/ANM worker training",
+            "• Village health and nutrition days",
+            "• Health education campaigns",
+            "",
+            "INTEGRATED APPROACH",
+            "• Screening → Diagnosis → Treatment → Follow-up",
+            "• Free drugs and diagnostics",
+            "• Community participation",
+        ]),
+    ]),
+], name="national_program_visual")
+
+
+FUTURE_DIRECTIONS = Slide([
+    title("Future Directions in Diabetes Care (2024-2030)"),
+    section((0.5, 1.2, 3, 2.5), "PRECISION MEDICINE", Font(15, bold=True, color=BLUE), [
+        "• Genetic profiling for therapy",
+        "• Biomarker development",
+        "• Targeted therapies",
+        "• Individualized targets",
+        "• Pharmacogenomics",
+    ], Font(11)),
+    section((3.8, 1.2, 3, 2.5), "ADVANCED TECHNOLOGIES", Font(15, bold=True, color=PURPLE), [
+        "• Closed-loop systems",
+        "• Stem cell therapy",
+        "• Gene therapy (CRISPR)",
+        "• AI-driven predictions",
+        "• Digital therapeutics",
+    ], Font(11)),
+    section((7, 1.2, 2.75, 2.5), "HEALTH SYSTEM TRANSFORMATION", Font(14, bold=True, color=GREEN), [
+        "• Multidisciplinary teams",
+        "• Digital health integration",
+        "• Population health approach",
+        "• Health economics focus",
+        "• Community-based care",
+    ], Font(11)),
+    note((0.5, 4.2, 9, 1.5), "CHALLENGES: Cost of new technologies, equitable access, workforce training, data privacy. OPPORTUNITIES: Prevention focus shift, AI integration, global collaborations, personalized approaches.", Font(12, bold=True, color=NAVY)),
+], name="future_directions")
+
+
+CHALLENGES_SOLUTIONS = Slide([
+    title("Challenges in Diabetes Control & Prevention"),
+    section((0.5, 1.2, 4.25, 3), "KEY CHALLENGES", Font(18, bold=True, color=RED), [
+        "• Therapeutic inertia (delayed treatment intensification)",
+        "• Long-term lifestyle adherence issues",
+        "• Hypoglycemia risk with intensive control",
+        "• Resource constraints in LMICs",
+        "• Cultural and behavioral barriers",
+        "• Socioeconomic disparities in access to care",
+    ], Font(12)),
+    section((5, 1.2, 4.25, 3), "STRATEGIC SOLUTIONS", Font(18, bold=True, color=DARK_GREEN), [
+        "• Treatment algorithm audits and standardization",
+        "• Behavioral support and digital health tools",
+        "• CGM-guided therapy adjustments",
+        "• Task shifting to trained non-physicians",
+        "• Culturally adapted health education",
+        "• Community-based peer support programs",
+    ], Font(12)),
+    note((0.5, 4.8, 9, 1), "MEASURING SUCCESS: Process indicators (screening rates, timely intensification), outcome indicators (HbA1c targets, complication rates), patient-reported outcomes", Font(11, bold=True, color=NAVY)),
+], name="challenges_solutions")
+
+
+CONCLUSION = Slide([
+    title("Conclusion & Key Takeaways"),
+    TextBox((0.5, 1.2, 9, 4.5), [
+        Paragraph("EPIDEMIOLOGY & BURDEN", Font(16, bold=True, color=BLUE)),
+        Paragraph("• 537M adults with diabetes globally, 101M in India", Font(11)),
+        Paragraph("• Projected growth to 783M (2045) and 160M (India)", Font(11)),
+        Paragraph("• South Asia faces highest proportional increase", Font(11)),
+        Paragraph("• LMICs bear disproportionate burden", Font(11)),
+        Paragraph("• Economic cost: $966B globally, INR 2.5-3 lakh crores in India", Font(11)),
+        Paragraph("PATHOGENESIS & CLASSIFICATION", Font(16, bold=True, color=GREEN)),
+        Paragraph("• T2DM: Insulin resistance + β-cell dysfunction", Font(11)),
+        Paragraph("• T1DM: Autoimmune destruction of β-cells", Font(11)),
+        Paragraph("• Prediabetes affects 541M globally", Font(11)),
+        Paragraph("• Genetic-environment interaction crucial", Font(11)),
+        Paragraph("• Early intervention prevents progression", Font(11)),
+        Paragraph("MANAGEMENT & PREVENTION", Font(16, bold=True, color=PURPLE)),
+        Paragraph("• Individualized targets: HbA1c <7% generally", Font(11)),
+        Paragraph("• Metformin first-line, early combination therapy", Font(11)),
+        Paragraph("• CGM/TIR important for personalized control", Font(11)),
+        Paragraph("• DPP lifestyle intervention: 58% prevention", Font(11)),
+        Paragraph("• Multidisciplinary, technology-integrated approach", Font(11)),
+        Paragraph("FUTURE DIRECTIONS", Font(16, bold=True, color=NAVY)),
+        Paragraph("• Precision medicine and AI-driven care", Font(11)),
+        Paragraph("• Stem cell and gene therapies", Font(11)),
+        Paragraph("• Closed-loop automated systems", Font(11)),
+        Paragraph("• Population health and prevention focus", Font(11)),
+        Paragraph("• Global collaboration for equitable care", Font(11)),
+    ]),
+    note((0.5, 6.2, 9, 0.8), "CALL TO ACTION: Early screening, intensive lifestyle intervention, comprehensive management, technology adoption, health system strengthening", Font(12, bold=True, color=RED)),
+], name="conclusion")
+
+
+DECK = Deck("Diabetes_Comprehensive_TLM_Presentation.pptx", [
+    TITLE,
+    OVERVIEW,
+    DEFINITIONS,
+    TYPES_DIABETES,
+    EPIDEMIOLOGY_GLOBAL,
+    EPIDEMIOLOGY_INDIA,
+    EPIDEMIOLOGY_VISUAL,
+    PATHOPHYSIOLOGY,
+    PATHOPHYSIOLOGY_VISUAL,
+    RISK_FACTORS,
+    RISK_FACTORS_VISUAL,
+    CLINICAL_FEATURES,
+    DIAGNOSIS_CRITERIA,
+    TREATMENT_OVERVIEW,
+    TREATMENT_ALGORITHM,
+    CONTROL_TARGETS,
+    MONITORING,
+    PREVENTION_OVERVIEW,
+    PREVENTION_FLOWCHART,
+    NATIONAL_PROGRAM,
+    NATIONAL_PROGRAM_VISUAL,
+    FUTURE_DIRECTIONS,
+    CHALLENGES_SOLUTIONS,
+    CONCLUSION,
+], theme=Theme(body=Font(11)))
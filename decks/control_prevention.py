@@ -0,0 +1,240 @@
+"""
+Control strategies, prevention and national programme deck
+"""
+from slide_specs import (
+    AMBER, BLUE, DARK_GREEN, GREEN, GREY, NAVY, PURPLE, RED, TITLE_AND_CONTENT_LAYOUT, Deck, Font, Paragraph,
+    Picture, Placeholder, Slide, TextBox, Theme, note, section, title, title_slide,
+)
+
+
+TITLE = title_slide(
+    "title",
+    "Diabetes Mellitus Control, Prevention & National Programme",
+    Font(38, bold=True, color=NAVY),
+    "Comprehensive Strategies for Diabetes Management in India\nMBBS Teaching Learning Material",
+)
+
+
+OVERVIEW = Slide([
+    Placeholder(0, [
+        Paragraph("Presentation Overview", Font(32, bold=True, color=NAVY)),
+    ]),
+    Placeholder(1, [
+        "",
+        Paragraph("• Diabetes Control Strategies - Glycemic targets, monitoring, technology", Font(20)),
+        Paragraph("• Prevention Framework - Primary, secondary, and tertiary prevention", Font(20)),
+        Paragraph("• National Programme (NPCDCS) - India's diabetes control initiative", Font(20)),
+        Paragraph("• Implementation Strategies - Multidisciplinary approach", Font(20)),
+        Paragraph("• Evidence-based Interventions - Lifestyle, pharmacological, behavioral", Font(20)),
+        Paragraph("• Outcome Measures - Process and outcome indicators", Font(20)),
+    ]),
+], layout=TITLE_AND_CONTENT_LAYOUT, name="overview")
+
+
+CONTROL_TARGETS = Slide([
+    title("Glycemic Control Targets (ADA 2024)"),
+    section((0.5, 1.2, 4.25, 3), "GENERAL TARGETS", Font(18, bold=True, color=BLUE), [
+        "• HbA1c: <7.0% (most adults)",
+        "• Preprandial glucose: 80-130 mg/dL",
+        "• Peak postprandial: <180 mg/dL",
+        "• Bedtime glucose: 100-140 mg/dL",
+        "• TIR (Time in Range): >70%",
+    ], Font(16)),
+    section((5, 1.2, 4.25, 3), "INDIVIDUALIZED TARGETS", Font(18, bold=True, color=GREEN), [
+        "• Young patients (<40): HbA1c <6.5-7.0%",
+        "• Elderly (≥65): HbA1c 7.5-8.0%",
+        "• Longstanding DM (>10y): More liberal",
+        "• High CV risk: Stringent control",
+        "• Frequent hypoglycemia: Relaxed targets",
+    ], Font(16)),
+    note((0.5, 4.5, 9, 2), "Key Considerations: Age, comorbidities, life expectancy, hypoglycmia risk, and patient preferences should guide target setting. SMBG/CGM data crucial for pattern management.", Font(14, color=NAVY)),
+], name="control_targets")
+
+
+MONITORING = Slide([
+    title("Diabetes Monitoring Strategies"),
+    section((0.5, 1.2, 4.25, 2.5), "SELF-MONITORING OF BLOOD GLUCOSE", Font(16, bold=True, color=BLUE), [
+        "• Type 2 DM on oral agents: 1-2x daily",
+        "• Type 2 DM on insulin: 2-4x daily",
+        "• Type 1 DM: 4-6x daily (basal-bolus)",
+        "• Pre/postprandial monitoring essential",
+        "• Pattern recognition for dose adjustment",
+    ], Font(14)),
+    section((5, 1.2, 4.25, 2.5), "CONTINUOUS GLUCOSE MONITORING", Font(16, bold=True, color=PURPLE), [
+        "• TIR (>70%): Primary outcome measure",
+        "• TBR (<4%): Minimize hypoglycemia",
+        "• TAR (<25%): Manage hyperglycemia",
+        "• Ambulatory Glucose Profile analysis",
+        "• Real-time vs. intermittently scanned",
+    ], Font(14)),
+    note((2.5, 4, 5, 1), "HbA1c: Every 3-6 months (clinically meaningful change: 0.5%)", Font(16, bold=True, color=NAVY)),
+], name="monitoring")
+
+
+PREVENTION_LEVELS = Slide([
+    title("Levels of Diabetes Prevention"),
+    TextBox((0.5, 1.2, 2.8, 4), [
+        Paragraph("PRIMARY PREVENTION", Font(18, bold=True, color=RED)),
+        "(Prevent Diabetes Onset)",
+        Paragraph("• Target: High-risk individuals (prediabetes)", Font(12)),
+        Paragraph("• DPP model: 58% incidence reduction", Font(12)),
+        Paragraph("• Intensive lifestyle intervention", Font(12)),
+        Paragraph("• 5-7% weight loss + 150 min/week activity", Font(12)),
+        Paragraph("• Metformin in selected cases (BMI ≥35)", Font(12)),
+        Paragraph("• Health promotion campaigns", Font(12)),
+    ]),
+    TextBox((3.5, 1.2, 2.8, 4), [
+        Paragraph("SECONDARY PREVENTION", Font(18, bold=True, color=AMBER)),
+        "(Delay Progression)",
+        Paragraph("• Target: Prediabetes management", Font(12)),
+        Paragraph("• IFG: 100-125 mg/dL", Font(12)),
+        Paragraph("• IGT: 140-199 mg/dL (2h PG)", Font(12)),
+        Paragraph("• Lifestyle modification first-line", Font(12)),
+        Paragraph("• Metformin optional (BMI ≥35)", Font(12)),
+        Paragraph("• Annual monitoring for progression", Font(12)),
+    ]),
+    TextBox((6.5, 1.2, 2.8, 4), [
+        Paragraph("TERTIARY PREVENTION", Font(18, bold=True, color=DARK_GREEN)),
+        "(Prevent Complications)",
+        Paragraph("• Target: Established diabetes", Font(12)),
+        Paragraph("• Optimal glycemic control", Font(12)),
+        Paragraph("• Complication screening (annual)", Font(12)),
+        Paragraph("• Cardiovascular risk management", Font(12)),
+        Paragraph("• Multidisciplinary care approach", Font(12)),
+        Paragraph("• Rehabilitation and support", Font(12)),
+    ]),
+], name="prevention_levels")
+
+
+CONTROL_STRATEGIES_VISUAL = Slide([
+    title("Diabetes Control Strategies Pyramid"),
+    Picture("visualizations/control_strategies_diagram.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1.5, 2, 7, 4), "Control strategies build hierarchically:", Font(16), [
+            "",
+            "1. Glycemic targets & monitoring",
+            "2. Lifestyle interventions",
+            "3. Pharmacological management",
+            "4. Technology integration",
+            "5. Behavioral support",
+            "",
+            "Foundation: Comprehensive multidisciplinary care",
+        ], Font(16)),
+    ]),
+], name="control_strategies_visual")
+
+
+NATIONAL_PROGRAM = Slide([
+    title("National Programme for Prevention & Control of Diabetes", 28),
+    note((0.5, 0.9, 9, 0.3), "NPCDCS - Ministry of Health & Family Welfare, India (2010-ongoing)", Font(14, color=GREY)),
+    section((0.5, 1.3, 4.25, 2.5), "KEY OBJECTIVES", Font(16, bold=True, color=BLUE), [
+        "• 25% reduction in premature mortality",
+        "• Early diagnosis and treatment",
+        "• Health promotion and prevention",
+        "• Capacity building of healthcare workers",
+        "• Improved quality of life for patients",
+    ], Font(12)),
+    section((5, 1.3, 4.25, 2.5), "PROGRAM COMPONENTS", Font(16, bold=True, color=GREEN), [
+        "• NCD clinics at district level",
+        "• Population-based screening",
+        "• Free diagnostic services",
+        "• Drug procurement & distribution",
+        "• Health promotion activities",
+    ], Font(12)),
+    note((0.5, 4, 9, 1.5), "IMPLEMENTATION: National → State → District → Community (ASHA/ANM workers)", Font(14, bold=True, color=NAVY)),
+], name="national_program")
+
+
+NATIONAL_PROGRAM_VISUAL = Slide([
+    title("NPCDCS Implementation Framework"),
+    Picture("visualizations/national_program_diagram.png", (0.5, 1.2, 9, 5.5), fallback=[
+        section((1.5, 2, 7, 4), "National → State → District → Community", Font(16), [
+            "",
+            "Primary Prevention: Health promotion",
+            "Secondary Prevention: Early diagnosis",
+            "Tertiary Prevention: Complication management",
+            "",
+            "Key Components: NCD clinics, screening camps, training, drugs, IEC activities",
+        ], Font(16)),
+    ]),
+], name="national_program_visual")
+
+
+DIET_EXERCISE = Slide([
+    title("Diet & Physical Activity for Diabetes Control & Prevention", 28),
+    section((0.5, 1.2, 4.25, 3), "DIETARY RECOMMENDATIONS", Font(18, bold=True, color=BLUE), [
+        "• Mediterranean/DASH diets preferred",
+        "• Low glycemic index carbohydrates",
+        "• Increased fiber intake (25-30g/day)",
+        "• Plant-based proteins (pulses, legumes)",
+        "• Reduced saturated/trans fats (<7% energy)",
+        "• Portion control and mindful eating",
+    ], Font(12)),
+    section((5, 1.2, 4.25, 3), "PHYSICAL ACTIVITY PRESCRIPTION", Font(18, bold=True, color=PURPLE), [
+        "• 150 minutes/week moderate intensity",
+        "• Combination of aerobic + resistance training",
+        "• Yoga and flexibility exercises",
+        "• Walking/bicycling for commuting",
+        "• Sedentary behavior reduction",
+        "• Individualized based on fitness level",
+    ], Font(12)),
+    note((0.5, 4.5, 9, 1), "Evidence: DPP trial showed 58% reduction in diabetes incidence with lifestyle intervention alone.", Font(14, bold=True, color=NAVY)),
+], name="diet_exercise")
+
+
+CHALLENGES = Slide([
+    title("Challenges in Diabetes Control & Prevention"),
+    section((0.5, 1.2, 4.25, 3), "KEY CHALLENGES", Font(18, bold=True, color=RED), [
+        "• Therapeutic inertia (delay in treatment intensification)",
+        "• Adherence to lifestyle changes long-term",
+        "• Hypoglycemia risk with intensive control",
+        "• Resource constraints in low-income settings",
+        "• Cultural and behavioral barriers",
+        "• Socioeconomic disparities in access",
+    ], Font(12)),
+    section((5, 1.2, 4.25, 3), "STRATEGIC SOLUTIONS", Font(18, bold=True, color=DARK_GREEN), [
+        "• Regular treatment algorithm audits",
+        "• Behavioral support and counseling",
+        "• CGM-guided therapy adjustments",
+        "• Task shifting to trained non-physicians",
+        "• Culturally adapted health education",
+        "• Community-based peer support groups",
+    ], Font(12)),
+], name="challenges")
+
+
+CONCLUSION = Slide([
+    title("Conclusion & Key Takeaways"),
+    TextBox((0.5, 1.2, 9, 4), [
+        Paragraph("CONTROL STRATEGIES", Font(20, bold=True, color=BLUE)),
+        Paragraph("• Individualized glycemic targets based on patient characteristics (age, comorbidities, hypoglycemia risk)", Font(14)),
+        Paragraph("• Comprehensive monitoring: SMBG/CGM + HbA1c every 3-6 months", Font(14)),
+        Paragraph("• Lifestyle intervention as foundation + metformin first-line pharmacological therapy", Font(14)),
+        Paragraph("• Multidisciplinary team approach with regular complication screening", Font(14)),
+        Paragraph("• Technology utilization (CGM, pumps) and behavioral support for optimal outcomes", Font(14)),
+        Paragraph("PREVENTION FRAMEWORK", Font(20, bold=True, color=GREEN)),
+        Paragraph("• Primary prevention: DPP model (58% reduction) - lifestyle intervention for high-risk individuals", Font(14)),
+        Paragraph("• Secondary prevention: Prediabetes management with lifestyle ± metformin", Font(14)),
+        Paragraph("• Tertiary prevention: Optimal control and complication management in established diabetes", Font(14)),
+        Paragraph("• Population-based approaches combined with high-risk individual strategies", Font(14)),
+        Paragraph("NATIONAL PROGRAMME (NPCDCS)", Font(20, bold=True, color=PURPLE)),
+        Paragraph("• Comprehensive government initiative for diabetes and NCD control", Font(14)),
+        Paragraph("• Multi-level implementation: National → State → District → Community", Font(14)),
+        Paragraph("• Key components: Screening, treatment, health promotion, capacity building", Font(14)),
+        Paragraph("• Focus on prevention, early diagnosis, and comprehensive management", Font(14)),
+    ]),
+], name="conclusion")
+
+
+DECK = Deck("Diabetes_Control_Prevention_Presentation.pptx", [
+    TITLE,
+    OVERVIEW,
+    CONTROL_TARGETS,
+    MONITORING,
+    PREVENTION_LEVELS,
+    CONTROL_STRATEGIES_VISUAL,
+    NATIONAL_PROGRAM,
+    NATIONAL_PROGRAM_VISUAL,
+    DIET_EXERCISE,
+    CHALLENGES,
+    CONCLUSION,
+], theme=Theme(body=Font(12)))
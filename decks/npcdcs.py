@@ -0,0 +1,432 @@
+"""
+Enhanced deck with the comprehensive NPCDCS section
+"""
+from datetime import datetime
+
+from slide_specs import (
+    BLUE, DARK_BLUE, DARK_GREEN, DARK_ORANGE, DARK_PURPLE, DARK_RED, GREEN, GREY, LIGHT_GREY, NAVY, PURPLE, RED,
+    WHITE, Deck, Font, Paragraph, Slide, TextBox, Theme, note, section, title, title_slide,
+)
+
+
+TITLE = title_slide(
+    "title",
+    "Diabetes Mellitus: Comprehensive Management & NPCDCS Implementation",
+    Font(48, bold=True, color=WHITE),
+    "Epidemiology • Pathophysiology • Management • National Programme for Prevention & Control\nMedical Education Resource | Latest Guidelines 2024-2025",
+    Font(24, bold=False, color=LIGHT_GREY),
+    shapes=[
+        note((0.5, 6, 9, 0.6), f"Created by: Dr. Siddalingaiah H S | Shridevi Institute of Medical Sciences | {datetime.now().year}", Font(14, italic=True, color=LIGHT_GREY)),
+    ],
+    background=(NAVY, BLUE),
+)
+
+
+OVERVIEW = Slide([
+    title("Comprehensive Diabetes TLM Overview", 36),
+    TextBox((0.5, 1.2, 2, 1.4), [
+        Paragraph("Global Cases", Font(14, bold=True, color=BLUE)),
+        "537 Million",
+        Paragraph("2021 IDF Data", Font(10)),
+    ]),
+    TextBox((2.7, 1.2, 2, 1.4), [
+        Paragraph("India Cases", Font(14, bold=True, color=BLUE)),
+        "101 Million",
+        Paragraph("11.4% Prevalence", Font(10)),
+    ]),
+    TextBox((4.9, 1.2, 2, 1.4), [
+        Paragraph("Economic Cost", Font(14, bold=True, color=BLUE)),
+        "$966 Billion",
+        Paragraph("Annual Global Burden", Font(10)),
+    ]),
+    TextBox((7.1, 1.2, 2, 1.4), [
+        Paragraph("NPCDCS Clinics", Font(14, bold=True, color=BLUE)),
+        "697 Districts",
+        Paragraph("National Coverage", Font(10)),
+    ]),
+    section((0.5, 3, 2.8, 1.2), "Epidemiology & Burden", Font(12, bold=True, color=DARK_GREEN), [
+        "Global trends, Indian statistics, urban-rural disparities...",
+    ], Font(9, color=GREY)),
+    section((3.6, 3, 2.8, 1.2), "Pathophysiology & Mechanisms", Font(12, bold=True, color=DARK_GREEN), [
+        "β-cell dysfunction, insulin resistance, glucotoxicity...",
+    ], Font(9, color=GREY)),
+    section((6.7, 3, 2.8, 1.2), "Diagnosis & Classification", Font(12, bold=True, color=DARK_GREEN), [
+        "ADA criteria, OGTT, HbA1c thresholds, prediabetes...",
+    ], Font(9, color=GREY)),
+    section((0.5, 4.5, 2.8, 1.2), "Management Strategies", Font(12, bold=True, color=DARK_GREEN), [
+        "Pharmacotherapy algorithms, insulin regimens, monitoring...",
+    ], Font(9, color=GREY)),
+    section((3.6, 4.5, 2.8, 1.2), "Prevention Framework", Font(12, bold=True, color=DARK_GREEN), [
+        "DPP model, lifestyle intervention, pharmacological preventio...",
+    ], Font(9, color=GREY)),
+    section((6.7, 4.5, 2.8, 1.2), "National Programme (NPCDCS)", Font(12, bold=True, color=DARK_GREEN), [
+        "Implementation framework, screening, drug distribution, trai...",
+    ], Font(9, color=GREY)),
+    note((0.5, 6, 9, 0.8), "Learning Objectives: Master diabetes epidemiology, apply NPCDCS guidelines, implement evidence-based management, promote prevention strategies", Font(12, bold=True, color=RED)),
+], name="overview")
+
+
+EPIDEMIOLOGY_GLOBAL = Slide([
+    title("🌍 Global Epidemiological Panorama", size=40, top=0.2, color=BLUE),
+    section((0.5, 1.2, 4, 1.4), "📈 Total Cases 537 MILLION", Font(16, bold=True, color=RED), [
+        "Adults 20-79 years",
+    ], Font(10)),
+    section((5, 1.2, 4, 1.4), "📊 Prediabetes 541 MILLION", Font(16, bold=True, color=RED), [
+        "At risk of T2DM",
+    ], Font(10)),
+    section((0.5, 3, 4, 1.4), "💀 Annual Deaths 6.7 MILLION", Font(16, bold=True, color=RED), [
+        "Diabetes-related mortality",
+    ], Font(10)),
+    section((5, 3, 4, 1.4), "💰 Healthcare Cost $966 BILLION", Font(16, bold=True, color=RED), [
+        "9.3% of global expenditure",
+    ], Font(10)),
+    section((0.5, 4.2, 9, 2.8), "📍 Regional Prevalence Distribution (Adults 20-79 years)", None, [
+        "• Middle East & North Africa: 14.0% - Highest globally",
+        "• North America: 11.7% - Developed nations",
+        "• South Asia: 10.2% - Rapidly increasing",
+        "• Western Europe: 5.4% - Stable/preventable",
+        "• Sub-Saharan Africa: 3.3% - Emerging epidemic",
+    ], Font(12)),
+], name="epidemiology_global")
+
+
+EPIDEMIOLOGY_INDIA = Slide([
+    title("🇮🇳 Diabetes in India: The Asian Epidemic", size=40, top=0.2, color=DARK_ORANGE),
+    section((2, 1.2, 6, 1.6), "🆘 INDIAN DIABETES CRISIS", Font(24, bold=True, color=DARK_RED), [
+        "🎯 101.2 MILLION people with diabetes",
+        "🎯 136 MILLION with prediabetes",
+        "🎯 11.4% adult prevalence",
+        "🎯 Second highest burden globally",
+    ], Font(14, bold=True)),
+    section((0.5, 3.2, 4, 3.2), "📊 State-wise Prevalence (Adults 20-79 years)", None, [
+        "🔴 Kerala: 19.2%",
+        "🔴 Goa: 17.8%",
+        "🔴 Punjab: 14.8%",
+        "🔴 Tamil Nadu: 14.6%",
+    ], Font(11)),
+    section((5, 3.2, 4.5, 1.4), "🏙️ URBAN vs RURAL INDIA", None, [
+        "• Urban: 15.2% prevalence",
+        "• Rural: 9.5% prevalence",
+        "• Ratio: 2:1 (industrialization effect)",
+    ]),
+    section((5, 5, 4.5, 1.2), "₹ ECONOMIC BURDEN", None, [
+        "₹2.5-3 lakh crore annual cost",
+        "Represents 10-15% healthcare budget",
+        "Life expectancy reduced 8-10 years",
+    ]),
+], name="epidemiology_india")
+
+
+PATHOPHYSIOLOGY = Slide([
+    title("🧬 Pathophysiology: Molecular Mechanisms of Diabetes", size=40, top=0.2, color=DARK_GREEN),
+    section((0.5, 1.2, 2.8, 2.2), "✅ NORMAL GLUCOSE HOMEOSTASIS", Font(14, bold=True, color=DARK_GREEN), [
+        "• Insulin secretion (β-cells)",
+        "• Insulin receptor signaling",
+        "• GLUT4 translocation",
+        "• Glycogen synthesis & gluconeogenesis",
+        "• Balanced fuel metabolism",
+    ], Font(10)),
+    section((3.5, 1.2, 2.8, 2.2), "🔴 TYPE 1 DM: AUTOIMMUNE DESTRUCTION", Font(14, bold=True, color=RED), [
+        "• HLA-DR3/DR4 genetic susceptibility",
+        "• Autoantibodies (ICA, GADA, IA-2)",
+        "• T-cell mediated β-cell destruction",
+        "• Progressive insulin deficiency",
+        "• Absolute dependence on insulin",
+    ], Font(10)),
+    section((6.5, 1.2, 2.8, 2.2), "🟡 TYPE 2 DM: RESISTANCE + FAILURE", Font(14, bold=True, color=DARK_ORANGE), [
+        "• Primary: Peripheral insulin resistance",
+        "• Secondary: β-cell functional decline",
+        "• Compensatory hyperinsulinemia",
+        "• Glucotoxicity & lipotoxicity",
+        "• Genetic-environment interaction",
+    ], Font(10)),
+    TextBox((0.5, 3.8, 9, 2.8), [
+        "🔬 KEY PATHOGENIC PATHWAYS & MECHANISMS",
+        Paragraph("Insulin Resistance:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• Impaired IRS-1/PI3K signaling", Font(10), level=1),
+        Paragraph("• TNF-α inflammation", Font(10), level=1),
+        Paragraph("• Mitochondrial dysfunction", Font(10), level=1),
+        Paragraph("• Adipokine imbalance", Font(10), level=1),
+        Paragraph("β-Cell Dysfunction:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• Progressive insulin secretion decline", Font(10), level=1),
+        Paragraph("• Amyloid deposition", Font(10), level=1),
+        Paragraph("• Oxidative stress", Font(10), level=1),
+        Paragraph("• Dedifferentiation", Font(10), level=1),
+        Paragraph("Liver Metabolism:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• ↑ Gluconeogenesis (PEPCK, G6Pase)", Font(10), level=1),
+        Paragraph("• ↓ Glycogen synthesis", Font(10), level=1),
+        Paragraph("• Impaired suppression by insulin", Font(10), level=1),
+        Paragraph("Adipose Tissue:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• ↑ Free fatty acid release", Font(10), level=1),
+        Paragraph("• Cytokine production (IL-6, resistin)", Font(10), level=1),
+        Paragraph("• ↓ Adiponectin secretion", Font(10), level=1),
+    ]),
+], name="pathophysiology")
+
+
+MANAGEMENT = Slide([
+    title("💉 ADA 2024: Diabetes Management Algorithm", size=36, top=0.2),
+    note((0.5, 1.2, 8, 0.5), "🎯 DIAGNOSIS → HbA1c ≥6.5% or FPG ≥126 or symptoms + RBG ≥200", Font(11, bold=True)),
+    note((0.5, 1.9, 8, 0.5), "🍎 LIFESTYLE ALL PATIENTS → Medical nutrition, activity 150 min/week, weight loss 5-7%", Font(11, bold=True)),
+    note((0.5, 2.6, 8, 0.5), "💊 METFORMIN FIRST-LINE → 500-1000 mg BID, monitor renal function", Font(11, bold=True)),
+    note((0.5, 3.3, 8, 0.5), "➕ ADD SECOND AGENT → Based on comorbidities: SGLT2i (CV), GLP-1 (weight), DPP4 (hypo risk)", Font(11, bold=True)),
+    note((0.5, 4, 8, 0.5), "💉 TRIPLE THERAPY → Three oral agents + consider insulin if HbA1c >7%", Font(11, bold=True)),
+    note((0.5, 4.7, 8, 0.5), "🔄 INTENSIFY INSULIN → Basal-bolus regimens, CGM-guided titration", Font(11, bold=True)),
+    note((0.5, 5.2, 9, 1.3), "PHARMACOLOGY ARSENAL: Metformin (weight neutral, CV benefits), SGLT2i (empagliflozin: HF/CV indication), GLP-1 RA (semaglutide: superior weight loss), DPP4i (low hypoglycemia), Insulin (multiple regimens)", Font(11, bold=True, color=BLUE)),
+], name="management")
+
+
+PREVENTION = Slide([
+    title("🛡️ Diabetes Prevention: DPP Model & Lifestyle Intervention", size=36, top=0.2, color=DARK_GREEN),
+    section((0.5, 1.2, 4, 2.5), "🏆 DIABETES PREVENTION PROGRAM EVIDENCE", Font(16, bold=True, color=GREEN), [
+        "• Intensive lifestyle: 58% diabetes prevention",
+        "• Metformin alone: 31% reduction",
+        "• Cost-effective intervention",
+        "• Sustained benefits (10+ years)",
+        "• Lifestyle superior to metformin",
+    ], Font(12)),
+    section((5, 1.2, 4.5, 2.5), "🎯 PREVENTION HIERARCHY", None, [
+        "➤ Primary: Prevent diabetes in at-risk individuals (58% DPP reduction)",
+        "➤ Secondary: Delay progression from prediabetes (IFG/IGT management)",
+        "➤ Tertiary: Prevent complications in diagnosed (Optimal glycemic control)",
+    ], Font(11, bold=True)),
+    section((0.5, 4.2, 9, 2.5), "🥗 DPP LIFESTYLE INTERVENTION CORE COMPONENTS", None, [
+        "💪 Caloric Restriction: 500-750 kcal deficit daily, 5-7% weight loss target, slow steady approach",
+        "💪 Physical Activity: Minimum 150 min/week moderate activity, resistance training 2x/week, walking preferred",
+        "💪 Dietary Composition: Low glycemic load, increased fiber, Mediterranean/DASH patterns, portion control",
+        "💪 Behavioral Support: 16 intensive sessions in first 6 months, quarterly follow-up, self-monitoring",
+        "💪 Long-term Maintenance: Emphasis on habit formation, relapse prevention, social support",
+    ], Font(10, bold=True)),
+], name="prevention")
+
+
+NPCDCS_OVERVIEW = Slide([
+    title("NPCDCS: India's Flagship NCD Control Programme", size=38, top=0.2, color=DARK_PURPLE),
+    section((2, 1, 7, 1.2), "National Programme for Prevention & Control of", Font(16, bold=True, color=GREY), [
+        "Cancer, Diabetes, Cardiovascular Diseases & Stroke",
+    ]),
+    TextBox((0.5, 2.6, 4, 1.1), [
+        Paragraph("📅 Launch Year", Font(12, color=BLUE)),
+        Paragraph("2010", Font(14, bold=True)),
+        "Ministry of Health & FW",
+    ]),
+    TextBox((5, 2.6, 4, 1.1), [
+        Paragraph("🏥 Districts Covered", Font(12, color=BLUE)),
+        Paragraph("697", Font(14, bold=True)),
+        "Pan-India implementation",
+    ]),
+    TextBox((0.5, 4, 4, 1.1), [
+        Paragraph("👥 Beneficiaries", Font(12, color=BLUE)),
+        Paragraph("50+ Million", Font(14, bold=True)),
+        "Screened & treated",
+    ]),
+    TextBox((5, 4, 4, 1.1), [
+        Paragraph("💊 Free Drugs", Font(12, color=BLUE)),
+        Paragraph("Essential NCD", Font(14, bold=True)),
+        "Distributed nationwide",
+    ]),
+    section((0.5, 4.8, 4.5, 2), "🎯 PRIMARY OBJECTIVES", None, [
+        "• 25% reduction in premature mortality",
+        "• Early diagnosis through screening",
+        "• Free essential drug distribution",
+        "• Healthcare worker capacity building",
+        "• Health promotion & awareness",
+        "• Referral system strengthening",
+    ], Font(11)),
+    section((5.5, 4.8, 4, 2), "🏗️ PROGRAMME COMPONENTS", None, [
+        "• NCD clinics establishment",
+        "• Population screening camps",
+        "• Drug procurement systems",
+        "• Training programmes",
+        "• Monitoring & evaluation",
+        "• Community mobilization",
+    ], Font(11)),
+], name="npcdcs_overview")
+
+
+NPCDCS_FRAMEWORK = Slide([
+    title("🏛️ NPCDCS Implementation Framework: Multi-Tier Approach", size=36, top=0.2, color=DARK_BLUE),
+    section((1, 1.2, 8, 4.5), "", Font(8, name="Courier New"), [
+        "┌─────────────────────────────────────────────────────────────────┐",
+        "│                          NATIONAL LEVEL                         │",
+        "├─────────────────────────────────────────────────────────────────┤",
+        "│ ▶ Ministry of Health & Family Welfare                           │",
+        "│ ▶ NPCDCS Division & Technical Support Units                     │",
+        "│ ▶ National NCD monitoring & surveillance                        │",
+        "│ ▶ Resource allocation & policy guidelines                       │",
+        "│ ▶ Integration with NHM & Ayushman Bharat                        │",
+        "└─────────────────────────────┬───────────────────────────────────┘",
+        "                              │",
+        "    ┌───────────────────────┼───────────────────────┐",
+        "    │                       │                       │",
+        "┌───▼────────────────────┐ ┌─▼────────────────────┐ ┌▼────────────────────┐",
+        "│     STATE LEVEL        │ │   DISTRICT LEVEL      │ │  BLOCK/PHC LEVEL     │",
+        "├────────────────────────┤ ├──────────────────────┤ ├─────────────────────┤",
+        "│ • State NCD Cell       │ │ • NCD Clinics         │ │ • NCD Corner         │",
+        "│ • Drug procurement     │ │ • CHWs/ASHAs          │ │ • Weekly NCD clinics │",
+        "│ • Training programmes  │ │ • Weekly clinics      │ │ • Outreach camps     │",
+        "│ • Programme monitoring │ │ • Screening activities │ │ • Village volunteers │",
+        "│ • Public awareness     │ │ • Referral linkages    │ └─────────────────────┘",
+        "└────────────────────────┘ └──────────────────────┘",
+        "         │                        │",
+        "         └────────────────────────┴─────────────────────────┐",
+        "                                                           │",
+        "                                                ┌─────────▼─────────┐",
+        "                                                │ COMMUNITY LEVEL   │",
+        "                                                │ • Household visits │",
+        "                                                │ • Health education │",
+        "                                                │ • Early detection  │",
+        "                                                │ • Treatment adherence│",
+        "                                                │ • Follow-up support │",
+        "                                                └───────────────────┘",
+        "    ",
+    ]),
+    note((0.5, 5.8, 9, 0.8), "⚡ PHased Implementation (2010-2014): Kerala, Tamil Nadu, Karnataka → Full rollout (2014-2017): All states → Scale-up (2017-present): Integration with existing systems", Font(11, bold=True, color=NAVY)),
+], name="npcdcs_framework")
+
+
+NPCDCS_SCREENING = Slide([
+    title("🔍 NPCDCS Screening & Detection Strategy", size=36, top=0.2, color=PURPLE),
+    section((0.5, 1.2, 3, 2), "🎯 TARGET POPULATION", None, [
+        "",
+        "• Adults aged 30+ years",
+        "• High-risk groups:",
+        "  - Family history",
+        "  - Obesity",
+        "  - Sedentary lifestyle",
+        "",
+        "• Facility-based screening",
+        "• Community outreach camps",
+    ]),
+    section((4, 1.2, 3, 2), "🛠️ SCREENING TOOLS", None, [
+        "",
+        "• Blood pressure",
+        "• Random blood glucose",
+        "• HbA1c for confirmation",
+        "• Oral cancer screening",
+        "• Breast cancer (clinical)",
+        "",
+        "• Referral thresholds well-defined",
+    ]),
+    section((7, 1.2, 2.5, 2), "🏆 ACHIEVEMENTS", None, [
+        "",
+        "• 4+ crore screenings",
+        "• Early detection of",
+        "  millions of cases",
+        "• Improved health",
+        "  outcomes",
+        "• Cost savings through",
+        "  prevention",
+    ]),
+    TextBox((0.5, 3.8, 9, 2.8), [
+        "🏥 NCD Clinics & Treatment Services",
+        Paragraph("Infrastructure:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• 697 district NCD clinics", Font(10), level=1),
+        Paragraph("• Staff: Physician, nurse, pharmacist", Font(10), level=1),
+        Paragraph("• Equipment: ECG, analyzers, ophthalmoscope", Font(10), level=1),
+        Paragraph("Treatment Services:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• Hypertension & diabetes management", Font(10), level=1),
+        Paragraph("• CVD prevention & treatment", Font(10), level=1),
+        Paragraph("• Cancer early detection", Font(10), level=1),
+        Paragraph("• Mental health screening", Font(10), level=1),
+        Paragraph("Drug Distribution:", Font(12, bold=True, color=BLUE)),
+        Paragraph("• Free essential medicines", Font(10), level=1),
+        Paragraph("• Regular supply chain", Font(10), level=1),
+        Paragraph("• Treatment compliance monitoring", Font(10), level=1),
+        Paragraph("• Generic drug promotion", Font(10), level=1),
+    ]),
+], name="npcdcs_screening")
+
+
+NPCDCS_TRAINING = Slide([
+    title("👨‍⚕️ NPCDCS Capacity Building & Training", size=36, top=0.2, color=DARK_GREEN),
+    section((0.5, 1.2, 4, 1.4), "👩‍💼 Medical Officers", Font(12, bold=True, color=BLUE), [
+        "Clinical management, NCD complications, referral g...",
+    ], Font(9)),
+    section((5, 1.2, 4, 1.4), "👩‍💼 Nursing Staff", Font(12, bold=True, color=BLUE), [
+        "Patient counseling, drug administration, vital sig...",
+    ], Font(9)),
+    section((0.5, 3, 4, 1.4), "👩‍💼 CHWs/ASHAs", Font(12, bold=True, color=BLUE), [
+        "Household screening, health promotion, referral li...",
+    ], Font(9)),
+    section((5, 3, 4, 1.4), "👩‍💼 Pharmacists", Font(12, bold=True, color=BLUE), [
+        "Drug dispensing, side effect monitoring, storage g...",
+    ], Font(9)),
+    section((0.5, 4.8, 4, 1.4), "👩‍💼 Community Leaders", Font(12, bold=True, color=BLUE), [
+        "Health awareness, stigma reduction, community mobi...",
+    ], Font(9)),
+    section((0.5, 5.2, 4.5, 1.6), "📊 MONITORING & EVALUATION", None, [
+        "• Web-based MIS platform",
+        "• Key performance indicators",
+        "• Regular progress reviews",
+        "• Quality assurance mechanisms",
+        "• Evidence-based decision making",
+    ]),
+    section((5.5, 5.2, 4, 1.6), "🌟 KEY ACHIEVEMENTS", None, [
+        "• Improved early detection",
+        "• Better treatment outcomes",
+        "• Reduced NCD mortality",
+        "• Enhanced health system capacity",
+        "• Community awareness increased",
+    ]),
+], name="npcdcs_training")
+
+
+NPCDCS_OUTCOMES = Slide([
+    title("🎯 NPCDCS: India's NCD Control Success", size=38, top=0.2, color=DARK_RED),
+    section((0.5, 1.2, 4, 1.2), "📈 Early Detection Rate: 60%", Font(14, bold=True, color=GREEN), [
+        "Improved screening",
+    ]),
+    section((5, 1.2, 4, 1.2), "📈 Treatment Coverage: 75%", Font(14, bold=True, color=GREEN), [
+        "Accessible healthcare",
+    ]),
+    section((0.5, 2.8, 4, 1.2), "📈 Patient Follow-up: 85%", Font(14, bold=True, color=GREEN), [
+        "Community support",
+    ]),
+    section((5, 2.8, 4, 1.2), "📈 Drug Availability: 90%", Font(14, bold=True, color=GREEN), [
+        "Supply chain management",
+    ]),
+    section((0.5, 4.2, 9, 2.5), "🚀 NPCDCS FUTURE DIRECTIONS", None, [
+        "",
+        "• 📱 Digital integration with telemedicine",
+        "• 🏥 Integration with Ayushman Bharat network",
+        "• 🔬 Advanced diagnostics & AI-driven care",
+        "• 👥 Expanded community-based prevention",
+        "• 📊 Big data for outcome monitoring",
+        "• 🎓 Continuous professional development",
+        "",
+        "💎 CONCLUSION: NPCDCS represents India's comprehensive approach to NCD control, demonstrating the power of integrated health systems, community participation, and evidence-based interventions in tackling chronic diseases at scale.",
+    ]),
+], name="npcdcs_outcomes")
+
+
+CONCLUSION = Slide([
+    title("🎓 Diabetes Mellitus: Knowledge to Action", size=38, top=0.2),
+    section((0.5, 1.2, 9, 4), "📚 ESSENTIAL TAKEAWAYS", None, [
+        "🌍 Epidemiological Crisis: 537M global cases, India 101M, explosive growth in LMICs, economic burden $966B annually",
+        "🧬 Pathogenic Complexity: T1DM autoimmune destruction, T2DM insulin resistance + β-cell failure, genetic-environment interplay",
+        "🔬 Precision Management: ADA 2024 algorithm, individualized targets, metformin first-line, CV risk-guided therapies",
+        "🛡️ Prevention Paradigm: DPP model 58% prevention, lifestyle first-line, tertiary prevention critical, NPCDCS integral",
+        "🏥 Systems Approach: Multidisciplinary care, technology integration, community participation, NPCDCS scale",
+        "🔮 Future Vision: AI-driven care, stem cells, closed loops, precision medicine, global NCD control",
+    ], Font(11, bold=True, color=BLUE)),
+    note((0.5, 5.8, 9, 0.8), "🚀 ACTION IMPERATIVES: Screen universally at 35y, implement DPP lifestyle, intensify NPCDCS implementation, integrate digital health, foster prevention culture", Font(13, bold=True, color=DARK_RED)),
+    note((0.5, 6.8, 9, 0.3), "Prepared by Dr. Siddalingaiah H S | Professor, Community Medicine | Shridevi Institute of Medical Sciences & Research Hospital, Tumkur | Empowering Healthcare Education", Font(9, italic=True, color=GREY)),
+], name="conclusion")
+
+
+DECK = Deck("Diabetes_Enhanced_With_Comprehensive_NPCDCS_Presentation.pptx", [
+    TITLE,
+    OVERVIEW,
+    EPIDEMIOLOGY_GLOBAL,
+    EPIDEMIOLOGY_INDIA,
+    PATHOPHYSIOLOGY,
+    MANAGEMENT,
+    PREVENTION,
+    NPCDCS_OVERVIEW,
+    NPCDCS_FRAMEWORK,
+    NPCDCS_SCREENING,
+    NPCDCS_TRAINING,
+    NPCDCS_OUTCOMES,
+    CONCLUSION,
+], theme=Theme(title=Font(36, bold=True, color=NAVY), title_box=(0.5, 0.2, 9, 0.8)))
@@ -0,0 +1,157 @@
+"""
+Core TLM deck for MBBS students
+"""
+from slide_specs import (
+    BLUE, DARK_GREEN, GREEN, NAVY, ORANGE, Chart, Deck, Font, Paragraph, Picture, Slide, Table, TextBox, note,
+    section, title, title_slide,
+)
+
+
+TITLE = title_slide(
+    "title",
+    "Diabetes Mellitus",
+    Font(44, bold=True, color=NAVY),
+    "Teaching Learning Material for MBBS Students\nComprehensive Guide with India Focus",
+)
+
+
+DEFINITION = Slide([
+    title("Definition & Diagnostic Criteria"),
+    section((0.5, 1.2, 4.25, 5), "DEFINITION & CRITERIA", None, [
+        "• Type 1: Autoimmune β-cell destruction",
+        "• Type 2: Insulin resistance + β-cell failure",
+        "• Maturity-onset diabetes of young (MODY)",
+        "• Gestational diabetes mellitus",
+        "• Other specific types (drug-induced, genetic)",
+    ], Font(16)),
+    section((5, 1.2, 4.25, 5), "DIAGNOSTIC CRITERIA", None, [
+        "• Fasting Plasma Glucose (FPG): ≥126 mg/dL",
+        "• 2-hour Plasma Glucose (2hPG): ≥200 mg/dL",
+        "• Glycated Hemoglobin (HbA1c): ≥6.5%",
+        "• Random PG + symptoms: ≥200 mg/dL",
+        "• Asymptomatic: Confirmatory testing required",
+        "• ADA 2024 criteria with Indian adaptations",
+    ], Font(16)),
+], name="definition")
+
+
+EPIDEMIOLOGY = Slide([
+    title("Epidemiology & Disease Burden"),
+    Chart("epidemiology", (0.5, 1.2, 9, 4.5)),
+    note((0.5, 5.8, 9, 1), "• Global: 537M cases (2021) → 643M (2030)  • India: 101M cases • $966B healthcare cost • 6.7M annual deaths", Font(14, color=NAVY)),
+], name="epidemiology")
+
+
+PATHOPHYSIOLOGY = Slide([
+    title("Pathophysiology of Diabetes Mellitus"),
+    Picture("visualizations/pathophysiology_diagram.png", (0.5, 1.2, 9, 4.5), fallback=[
+        section((0.5, 1.2, 4.25, 2.5), "TYPE 1 DIABETES", None, [
+            "",
+            "• Autoimmune β-cell destruction",
+            "• HLA-DR3/DR4 genetic susceptibility",
+            "• GAD, IA-2, ICA antibodies",
+            "• Absolute insulin deficiency",
+            "• Ketosis-prone",
+        ]),
+        section((5, 1.2, 4.25, 2.5), "TYPE 2 DIABETES", None, [
+            "",
+            "• Insulin resistance + β-cell failure",
+            "• Polygenic inheritance",
+            "• Asian Indian phenotype",
+            "• Relative insulin deficiency",
+            "• Lifestyle modifiable",
+        ]),
+    ]),
+    note((0.5, 5.8, 9, 1), "• Type 1: Autoimmune β-cell destruction → Absolute insulin deficiency → Ketosis-prone • Type 2: Insulin resistance + β-cell failure → Relative insulin deficiency → Lifestyle modifiable", Font(12, color=NAVY)),
+], name="pathophysiology")
+
+
+RISK_FACTORS = Slide([
+    title("Risk Factors for Diabetes Mellitus"),
+    Picture("visualizations/risk_factor_diagram.png", (0.5, 1.2, 9, 4.5)),
+], name="risk_factors")
+
+
+DIAGNOSTIC_CRITERIA = Slide([
+    title("Diagnostic Criteria (ADA 2024)"),
+    Table((0.5, 1.2, 9, 5), ["Parameter", "Diabetes", "Prediabetes", "Normal"], [
+        ["FPG", "≥126 mg/dL", "100-125 mg/dL", "<100 mg/dL"],
+        ["2hPG", "≥200 mg/dL", "140-199 mg/dL", "<140 mg/dL"],
+        ["HbA1c", "≥6.5%", "5.7-6.4%", "<5.7%"],
+        ["Random PG", "≥200 mg/dL + symptoms", "-", "-"],
+    ]),
+], name="diagnostic_criteria")
+
+
+TREATMENT_ALGORITHM = Slide([
+    title("ADA Treatment Algorithm (2024)"),
+    Picture("visualizations/treatment_algorithm.png", (0.5, 1.2, 9, 4.5), fallback=[
+        TextBox((0.5, 1.2, 9, 5.5), [
+            "STEPWISE TREATMENT APPROACH",
+            "",
+            "",
+            Paragraph("1. DIAGNOSIS → Comprehensive evaluation", Font(14)),
+            Paragraph("2. LIFESTYLE + METFORMIN (first-line)", Font(14, bold=True, color=GREEN)),
+            Paragraph("3. DUAL THERAPY (if targets not met)", Font(14, bold=True, color=GREEN)),
+            Paragraph("4. TRIPLE THERAPY → Continue if not at target", Font(14, bold=True, color=GREEN)),
+            Paragraph("5. INSULIN INITIATION", Font(14, bold=True, color=GREEN)),
+            Paragraph("6. MONITORING & ADJUSTMENT", Font(14, bold=True, color=GREEN)),
+        ]),
+    ]),
+    note((0.5, 5.8, 9, 1), "• Lifestyle + Metformin first-line • Individualize based on patient factors • DPP-4i, SGLT2i, GLP-1 RA for dual therapy • Insulin initiation when needed", Font(12, color=NAVY)),
+], name="treatment_algorithm")
+
+
+PREVENTION = Slide([
+    title("Prevention of Diabetes Mellitus"),
+    Picture("visualizations/prevention_flowchart.png", (0.5, 1.2, 9, 4.5), fallback=[
+        TextBox((0.5, 1.2, 2.8, 2), [
+            Paragraph("PRIMARY PREVENTION", Font(bold=True, color=DARK_GREEN)),
+            "(High-Risk Individuals)",
+            Paragraph("• DPP Lifestyle Intervention", Font(12)),
+            Paragraph("• 5-7% weight loss", Font(12)),
+            Paragraph("• 150 min activity/week", Font(12)),
+            Paragraph("• Metformin 850mg BID (BMI ≥35)", Font(12)),
+            Paragraph("• 58% reduction in incidence", Font(12)),
+        ]),
+        section((3.5, 1.2, 2.8, 2), "SECONDARY PREVENTION", Font(bold=True, color=ORANGE), [
+            "(Prediabetes Management)",
+        ]),
+    ]),
+    note((0.5, 5.8, 9, 1), "• Primary: Prevent progression from prediabetes • Secondary: Lifestyle + metformin for prediabetes • Tertiary: Optimal management of established diabetes", Font(12, color=NAVY)),
+], name="prevention")
+
+
+LEARNING_OBJECTIVES = Slide([
+    title("Learning Objectives & Key Takeaways"),
+    section((0.5, 1.2, 4.25, 5), "LEARNING OBJECTIVES", Font(bold=True, color=BLUE), [
+        "• Master diabetes pathophysiology (T1DM vs T2DM)",
+        "• Apply ADA 2024 diagnostic criteria confidently",
+        "• Develop evidence-based treatment algorithms",
+        "• Understand India-specific epidemiological patterns",
+        "• Design comprehensive prevention strategies",
+        "• Recognize and manage complications",
+        "• Implement lifestyle interventions effectively",
+    ], Font(14)),
+    section((5, 1.2, 4.25, 5), "CLINICAL PEARLS", Font(bold=True, color=GREEN), [
+        "• Three P's: Polyuria, Polydipsia, Polyphagia",
+        "• Diabetes diagnostic: FPG≥126, 2hPG≥200, HbA1c≥6.5",
+        "• Lifestyle + metformin first-line therapy",
+        "• Individualize targets based on patient factors",
+        "• Prevention better than cure - focus on lifestyle",
+        "• Foot examination essential at every visit",
+    ], Font(14)),
+], name="learning_objectives")
+
+
+DECK = Deck("Diabetes_TLM_Presentation.pptx", [
+    TITLE,
+    DEFINITION,
+    EPIDEMIOLOGY,
+    PATHOPHYSIOLOGY,
+    RISK_FACTORS,
+    DIAGNOSTIC_CRITERIA,
+    TREATMENT_ALGORITHM,
+    PREVENTION,
+    LEARNING_OBJECTIVES,
+])
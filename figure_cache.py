@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Figure Cache
+Renders diagrams on demand and reuses identical renders across runs
+"""
+import hashlib
+import importlib
+import importlib.metadata
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".build" / "figures"
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from visualizations import SHARED_MODULES
+
+# rcParams for each output format: SVG keeps labels as <text> and gets stable ids
+FORMAT_RC = {
+    "svg": {"svg.fonttype": "none", "svg.hashsalt": "diabetes-tlm"},
+}
+
+
+class FigureCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, renderer=None):
+        """
+        renderer -- renderer(name, output, dpi=, size=, theme=, fmt=) used on a miss instead
+                    of importing the diagram here, e.g. render_daemon.RenderClient.render_to_file
+        """
+        self.cache_dir = Path(cache_dir)
+        self.renderer = renderer
+        self.hits = 0
+        self.misses = 0
+
+    def cache_key(self, name, fmt, dpi, size, theme):
+        """Hash of the diagram's source code, its shared data and every render parameter,
+        including the rcParams FORMAT_RC applies to fmt"""
+        # Read the version from package metadata; importing matplotlib costs ~0.2s
+        matplotlib_version = importlib.metadata.version("matplotlib")
+        source = b"".join((REPO_ROOT / "visualizations" / f"{module}.py").read_bytes()
+                          for module in [name] + SHARED_MODULES)
+        params = json.dumps([name, fmt, dpi, list(size) if size else None, theme,
+                             FORMAT_RC.get(fmt, {}), matplotlib_version], sort_keys=True)
+        return hashlib.sha256(source + params.encode('utf-8')).hexdigest()[:20]
+
+    def get_figure(self, name, output=None, dpi=300, size=None, theme=None, fmt="png"):
+        """Path to a render of diagram name with these parameters, rendering only on a miss.
+
+        When output is given the cached file is also copied there.
+        """
+        key = self.cache_key(name, fmt, dpi, size, theme)
+        cached = self.cache_dir / f"{name}.{key}.{fmt}"
+        if cached.exists():
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached.with_name(f"{name}.{key}.tmp{os.getpid()}.{fmt}")
+            if self.renderer:
+                self.renderer(name, tmp_path, dpi=dpi, size=size, theme=theme, fmt=fmt)
+            else:
+                import matplotlib
+
+                module = importlib.import_module(f"visualizations.{name}")
+                with matplotlib.rc_context(FORMAT_RC.get(fmt, {})):
+                    module.render(str(tmp_path), dpi=dpi, size=size, theme=theme)
+            os.replace(tmp_path, cached)
+
+        if output is not None:
+            output = Path(output)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if not output.exists() or output.read_bytes() != cached.read_bytes():
+                shutil.copyfile(cached, output)
+            return output
+        return cached
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
@@ -3,11 +3,42 @@
 Google Drive Image Link Generator
 Automatically create Google Drive shareable links and update HTML
 """
+import argparse
+import hashlib
+import io
 import os
 import re
+import runpy
+import shutil
+from collections import Counter
 from pathlib import Path
 import json
 
+from asset_server import HASH_LENGTH
+from html_image_rewriter import HtmlImageRewriter
+from responsive_images import RESPONSIVE_DIR_NAME, ResponsiveImages, parse_variant_name, responsive_image_tag
+
+# Content-hashed copies live in <images_dir>/hashed next to their manifest
+HASHED_DIR_NAME = "hashed"
+MANIFEST_NAME = "asset-manifest.json"
+# Where --update-html looks for the filled-in GOOGLE_DRIVE_URLS, first match wins
+URL_FILES = ["google_drive_urls.py", "google_drive_urls_template.py"]
+# Template entries nobody has filled in yet ("...&id=YOUR_TREATMENT_FILE_ID")
+UNFILLED_URL = re.compile(r'YOUR_\w*FILE_ID')
+
+
+def load_drive_urls(path=None):
+    """GOOGLE_DRIVE_URLS from path, or from the first of URL_FILES that exists"""
+    if path is None:
+        path = next((name for name in URL_FILES if Path(name).exists()), URL_FILES[0])
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Google Drive URL file not found: {path} (run without --update-html first)")
+    urls = runpy.run_path(str(path)).get("GOOGLE_DRIVE_URLS")
+    if not isinstance(urls, dict):
+        raise ValueError(f"{path} does not define a GOOGLE_DRIVE_URLS dict")
+    return urls
+
+
 class GoogleDriveHelper:
     def __init__(self, images_dir="visualizations", html_file="interactive/diabetes_interactive_tlm.html"):
         self.images_dir = Path(images_dir)
@@ -30,8 +61,116 @@ class GoogleDriveHelper:
             return f"https://drive.google.com/uc?export=view&id={file_id}"
         return shareable_link
 
-    def generate_url_template(self):
-        """Generate template for user to fill with their Google Drive links"""
+    def local_server_urls(self, base_url, manifest=None, variants=None):
+        """URL mapping pointing at asset_server.py instead of Google Drive.
+
+        With a manifest from build_asset_manifest() the URLs name the
+        content-hashed copies, which the server marks as immutable.
+        Resampled copies from build_responsive_images() are mapped too.
+        """
+        base_url = base_url.rstrip("/")
+        if manifest:
+            hashed_dir = (self.images_dir / HASHED_DIR_NAME).as_posix()
+            return {image_name: f"{base_url}/{hashed_dir}/{entry['file']}"
+                    for image_name, entry in manifest.items()}
+        urls = {image_name: f"{base_url}/{self.images_dir.as_posix()}/{image_name}"
+                for image_name in self.image_files}
+        responsive_dir = (self.images_dir / RESPONSIVE_DIR_NAME).as_posix()
+        for name in variants or {}:
+            urls[name] = f"{base_url}/{responsive_dir}/{name}"
+        return urls
+
+    def build_responsive_images(self, responsive=None):
+        """Resample every diagram for srcset; returns {variant name: path}.
+
+        Copies such as "epidemiology_chart-960w.webp" go in
+        <images_dir>/responsive and are hosted alongside the originals.
+        """
+        responsive = responsive or ResponsiveImages(output_dir=self.images_dir / RESPONSIVE_DIR_NAME)
+        for image_name in self.image_files:
+            source = self.images_dir / image_name
+            if source.exists():
+                responsive.build(source)
+        print(f"📱 Responsive copies: {len(responsive.variants)} in {responsive.output_dir}")
+        responsive.print_report()
+        return responsive.variants
+
+    def build_asset_manifest(self, variants=None):
+        """Copy each image to a content-hashed name and write the manifest.
+
+        Returns {logical name: {"file", "sha256", "bytes"}}, e.g.
+        "epidemiology_chart.png" -> "epidemiology_chart.3fa9c1b2d4.png".
+        An unchanged image keeps its hashed name, so caches and uploads can
+        skip it; copies left behind by older versions are removed.
+        variants ({name: path} from build_responsive_images()) are included.
+        """
+        hashed_dir = self.images_dir / HASHED_DIR_NAME
+        hashed_dir.mkdir(parents=True, exist_ok=True)
+        sources = [(image_name, self.images_dir / image_name) for image_name in self.image_files]
+        sources += sorted((variants or {}).items())
+        manifest = {}
+        for image_name, source in sources:
+            if not source.exists():
+                continue
+            with open(source, 'rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            stem, suffix = os.path.splitext(image_name)
+            hashed_name = f"{stem}.{digest[:HASH_LENGTH]}{suffix}"
+            target = hashed_dir / hashed_name
+            if not target.exists():
+                shutil.copyfile(source, target)
+            for stale in hashed_dir.glob(f"{stem}.*{suffix}"):
+                if stale.name != hashed_name:
+                    stale.unlink()
+            manifest[image_name] = {"file": hashed_name, "sha256": digest, "bytes": source.stat().st_size}
+
+        with open(hashed_dir / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        return manifest
+
+    def load_asset_manifest(self):
+        """Manifest written by the last build_asset_manifest(), or {}"""
+        try:
+            with open(self.images_dir / HASHED_DIR_NAME / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def hashed_drive_urls(self, url_mapping, manifest):
+        """Map URLs given per content-hashed file back to the logical names the HTML uses.
+
+        An entry may be keyed by the hashed copy ("epidemiology_chart.3fa9c1b2d4.png")
+        or by the logical name; returns (urls, logical names with no URL for
+        their current hashed copy, i.e. not uploaded since they changed).
+        """
+        urls, missing = {}, []
+        for image_name, entry in sorted(manifest.items()):
+            url = url_mapping.get(entry["file"]) or url_mapping.get(image_name)
+            if url:
+                urls[image_name] = url
+            else:
+                missing.append(image_name)
+        return urls, missing
+
+    def generate_url_template(self, manifest=None, variants=None):
+        """Generate template for user to fill with their Google Drive links
+
+        With a manifest the entries are keyed by the content-hashed file names,
+        so a changed image shows up as a new entry that needs uploading.
+        """
+        if manifest:
+            template = f"""# Upload these content-hashed copies from {(self.images_dir / HASHED_DIR_NAME).as_posix()}/
+# and replace the FILE_IDs with their Google Drive file IDs. A new name means the image
+# changed; unchanged names never need re-uploading. Then run:
+#   python google_drive_helper.py --update-html
+
+GOOGLE_DRIVE_URLS = {{
+"""
+            for _, entry in sorted(manifest.items()):
+                template += f'    "{entry["file"]}": "https://drive.google.com/uc?export=view&id=YOUR_FILE_ID",\n'
+            template += "}\n"
+            return template
+
         template = """# Copy this template and replace the FILE_IDs with your actual Google Drive file IDs
 # Get file IDs from your Google Drive shareable links:
 # https://drive.google.com/file/d/FILE_ID_HERE/view?usp=sharing
@@ -50,6 +189,13 @@ GOOGLE_DRIVE_URLS = {
 # Then your direct URL becomes:
 # https://drive.google.com/uc?export=view&id=1ABC123def456
 """
+        if variants:
+            template += f"""
+# Resampled copies for srcset (from {(self.images_dir / RESPONSIVE_DIR_NAME).as_posix()}/):
+# upload them too and add each one to GOOGLE_DRIVE_URLS under its own name
+"""
+            for name in sorted(variants):
+                template += f"#   {name}\n"
         return template
 
     def update_html_with_drive_urls(self, url_mapping):
@@ -60,75 +206,51 @@ GOOGLE_DRIVE_URLS = {
         with open(self.html_file, 'r', encoding='utf-8') as f:
             html_content = f.read()
 
-        replacements_made = 0
-
         # Convert Google Drive shareable links to direct links if needed
         processed_urls = {}
         for image_name, url in url_mapping.items():
-            if url and url.strip():
+            if url and UNFILLED_URL.search(url):
+                print(f"⚠️  Skipping {image_name}: its URL is still the template placeholder")
+            elif url and url.strip():
                 processed_urls[image_name] = self.convert_drive_link_to_direct(url.strip())
 
+        # Resampled copies ("epidemiology_chart-960w.webp") become srcset candidates
+        variant_urls = {name: processed_urls.pop(name) for name in list(processed_urls)
+                        if parse_variant_name(name)}
+
         print("🔄 Updating HTML with Google Drive URLs...")
         print("Images to process:", len(processed_urls))
 
-        # Replace standard img tags
-        for image_name, drive_url in processed_urls.items():
-            # Pattern for src attributes
-            src_pattern = re.compile(rf'src="[^"]*{re.escape(image_name)}"', re.IGNORECASE)
-            html_content = src_pattern.sub(f'src="{drive_url}"', html_content)
-
-            # Count replacements
-            matches = src_pattern.findall(html_content)
-            replacements_made += len(matches) if matches else 0
-
-            if matches:
-                print(f"✅ Updated src for: {image_name}")
-
-        # Replace placeholder divs (specific to Diabetes TLM structure)
-        for image_name, drive_url in processed_urls.items():
-            placeholder_img = f'<img src="{drive_url}" alt="{image_name.replace("_", " ").replace(".png", "").title()}" style="width: 100%; border-radius: 8px;">'
-
-            if image_name == "pathophysiology_diagram.png":
-                pattern = r'<div[^>]*style="[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#9b59b6[^"]*">[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div style="margin-bottom: 30px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced pathophysiology placeholder")
-
-            elif image_name == "epidemiology_chart.png":
-                pattern = r'<div[^>]*style="[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#3498db[^"]*">(?![\s\S]*?(?:Prevention|NPCDCS|Control))[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div style="margin-bottom: 20px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced epidemiology placeholder")
-
-            elif image_name == "treatment_algorithm.png":
-                pattern = r'<div[^>]*>[\s\S]*?Management Tab Diagram[\s\S]*?<\/div>\s*<div[^>]*style="[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#3498db[^"]*">[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div>Management Tab Diagram</div><div style="margin-bottom: 20px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced treatment algorithm placeholder")
-
-            elif image_name == "prevention_flowchart.png":
-                pattern = r'<div[^>]*style="[^"]*margin-top:\s*20px[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#3498db[^"]*"[^>]*>[\s\S]*?Prevention Flowchart[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div style="margin-top: 20px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced prevention flowchart placeholder")
-
-            elif image_name == "national_program_diagram.png":
-                pattern = r'<div[^>]*style="[^"]*margin-top:\s*20px[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#3498db[^"]*"[^>]*>[\s\S]*?NPCDCS[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div style="margin-top: 20px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced NPCDCS diagram placeholder")
-
-            elif image_name == "control_strategies_diagram.png":
-                pattern = r'<div[^>]*>[\s\S]*?Control Strategies[\s\S]*?<\/div>\s*<div[^>]*style="[^"]*background:\s*#f8f9fa[^"]*padding:\s*20px[^"]*border-radius:\s*8px[^"]*text-align:\s*center[^"]*border:\s*2px\s*dashed\s*#3498db[^"]*">[\s\S]*?<\/div>'
-                html_content = re.sub(pattern, f'<div>Control Strategies</div><div style="margin-bottom: 20px;">{placeholder_img}</div>', html_content, flags=re.DOTALL | re.IGNORECASE)
-                replacements_made += 1
-                print(f"🔄 Replaced control strategies placeholder")
+        # Rewrite every img tag and placeholder div in a single pass; image
+        # names are looked up by basename, so cost does not grow with their number
+        rewriter = HtmlImageRewriter(processed_urls, kinds=('src', 'placeholder'), whole_tags=True)
+        output = io.StringIO()
+        responsive_count = 0
+
+        def image_markup(slot):
+            nonlocal responsive_count
+            markup = responsive_image_tag(slot, variant_urls, processed_urls[slot.name])
+            responsive_count += ' srcset="' in markup
+            return markup
+
+        slots = rewriter.rewrite(html_content, image_markup, output.write)
+        html_content = output.getvalue()
+        replacements_made = len(slots)
+
+        src_counts = Counter(slot.name for slot in slots if slot.kind == 'src')
+        for image_name, count in src_counts.items():
+            print(f"✅ Updated src for: {image_name} ({count}x)")
+        for slot in slots:
+            if slot.kind == 'placeholder':
+                print(f"🔄 Replaced {slot.section or slot.name} placeholder with: {slot.name}")
 
         # Save updated HTML
         output_file = self.html_file.parent / f"{self.html_file.stem}_googledrive{self.html_file.suffix}"
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_content)
 
+        if responsive_count:
+            print(f"📱 srcset/sizes added to: {responsive_count} images")
         print(f"📊 Replacements made: {replacements_made}")
         print("🎉 Successfully updated HTML with Google Drive URLs!")
         print(f"Output file: {output_file}")
@@ -171,6 +293,7 @@ GOOGLE_DRIVE_URLS = {
         instructions += """
                     </ul>
                 </li>
+                <li>Next time, upload only what changed: <code>python asset_sync.py &lt;shared folder or upload URL&gt;</code></li>
             </ul>
         </div>
 
@@ -197,7 +320,7 @@ Example:<br>
 
         <div class="step">
             <h2>4. Update Python Script</h2>
-            <p>Edit <code>google_drive_urls.py</code> with your direct URLs:</p>
+            <p>Edit <code>google_drive_urls_template.py</code> (or save it as <code>google_drive_urls.py</code>) with your direct URLs:</p>
             <div class="code">
 GOOGLE_DRIVE_URLS = {
     "pathophysiology_diagram.png": "YOUR_DIRECT_URL_HERE",
@@ -238,13 +361,49 @@ python google_drive_helper.py --update-html
         print("📋 Generated setup instructions: google_drive_setup_instructions.html")
 
 def main():
+    parser = argparse.ArgumentParser(description="Point the TLM HTML at hosted copies of its images")
+    parser.add_argument("--update-html", nargs="?", const="", metavar="URLS_FILE",
+                        help="rewrite the HTML with the GOOGLE_DRIVE_URLS filled in to URLS_FILE "
+                             f"(default: the first of {', '.join(URL_FILES)})")
+    parser.add_argument("--local-server", metavar="URL",
+                        help="use asset_server.py at this base URL (e.g. http://192.168.1.10:8000) instead of Drive")
+    parser.add_argument("--hashed", action="store_true",
+                        help="publish content-hashed copies of the images; the Drive template lists them "
+                             "and --update-html / --local-server point the HTML at them")
+    parser.add_argument("--responsive", action="store_true",
+                        help="also publish copies resampled to several widths and emit srcset/sizes")
+    args = parser.parse_args()
+
     print("🚀 Google Drive Image Helper for Diabetes TLM")
     print("=" * 50)
 
     helper = GoogleDriveHelper()
 
+    variants = helper.build_responsive_images() if args.responsive else None
+
+    manifest = None
+    if args.hashed:
+        manifest = helper.build_asset_manifest(variants)
+        print(f"🔖 Asset manifest: {len(manifest)} images -> "
+              f"{helper.images_dir / HASHED_DIR_NAME / MANIFEST_NAME}")
+
+    if args.local_server:
+        helper.update_html_with_drive_urls(helper.local_server_urls(args.local_server, manifest, variants))
+        return
+
+    if args.update_html is not None:
+        url_mapping = load_drive_urls(args.update_html or None)
+        # Logical names resolve to the hashed copies published by the last --hashed run
+        manifest = manifest or helper.load_asset_manifest()
+        if manifest:
+            url_mapping, missing = helper.hashed_drive_urls(url_mapping, manifest)
+            for image_name in missing:
+                print(f"⚠️  No URL for {manifest[image_name]['file']} ({image_name}); upload it and add it")
+        helper.update_html_with_drive_urls(url_mapping)
+        return
+
     # Generate template for user
-    template = helper.generate_url_template()
+    template = helper.generate_url_template(manifest, variants)
 
     with open('google_drive_urls_template.py', 'w', encoding='utf-8') as f:
         f.write(template)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+HTML Image Rewriter
+Single-pass tokenizer that locates image references and placeholder divs
+"""
+import os
+import re
+from collections import namedtuple
+
+# One slot in the output where an image URI has to be written.
+# kind is 'src' (img tag), 'url' (CSS url()) or 'placeholder' (dashed div).
+# In whole-tag mode attrs holds the img attributes to keep, other than src
+ImageSlot = namedtuple('ImageSlot', ['name', 'kind', 'section', 'attrs'], defaults=(None,))
+
+# Where a slot sits in the source document: html[start:end] is what gets replaced
+SlotSpan = namedtuple('SlotSpan', ['slot', 'start', 'end'])
+
+SLOT_KINDS = ('src', 'url', 'placeholder')
+
+# Placeholder divs are mapped to diagrams by the tab section they sit in
+PLACEHOLDER_SECTIONS = {
+    'pathophysiology': 'pathophysiology_diagram.png',
+    'epidemiology': 'epidemiology_chart.png',
+    'management': 'treatment_algorithm.png',
+    'prevention': 'prevention_flowchart.png',
+    'npcdcs': 'national_program_diagram.png',
+    'control': 'control_strategies_diagram.png',
+}
+
+# Fallback for placeholders outside a known section: match on their label
+PLACEHOLDER_KEYWORDS = [
+    ('NPCDCS', 'national_program_diagram.png'),
+    ('Prevention', 'prevention_flowchart.png'),
+    ('Control Strateg', 'control_strategies_diagram.png'),
+    ('Epidemiology', 'epidemiology_chart.png'),
+    ('Management', 'treatment_algorithm.png'),
+    ('Treatment', 'treatment_algorithm.png'),
+    ('Pathophysiology', 'pathophysiology_diagram.png'),
+]
+
+TOKEN_PATTERN = re.compile(r'''
+      (?P<img><img\b[^>]*>)
+    | (?P<url>url\(\s*(?P<quote>["']?)(?P<url_path>[^"')\s]*\.png)(?P=quote)\s*\))
+    | (?P<section><section\b[^>]*>)
+    | (?P<div_open><div\b[^>]*>)
+    | (?P<div_close></div\s*>)
+''', re.IGNORECASE | re.VERBOSE)
+
+SRC_ATTR = re.compile(r'\bsrc\s*=\s*"([^"]*)"', re.IGNORECASE)
+CLASS_ATTR = re.compile(r'\bclass\s*=\s*"([^"]*)"', re.IGNORECASE)
+ID_ATTR = re.compile(r'\bid\s*=\s*"([^"]*)"', re.IGNORECASE)
+STYLE_ATTR = re.compile(r'\bstyle\s*=\s*"([^"]*)"', re.IGNORECASE)
+PLACEHOLDER_STYLE = re.compile(r'background:\s*#f8f9fa.*border:\s*2px\s+dashed', re.IGNORECASE)
+MARGIN_STYLE = re.compile(r'margin-(?:top|bottom):\s*\d+px;?', re.IGNORECASE)
+PLACEHOLDER_IMG_STYLE = "width: 100%; border-radius: 8px;"
+
+
+def image_alt_text(image_name):
+    """Human readable alt text for a diagram filename"""
+    return image_name.replace("_", " ").replace(".png", "").title()
+
+
+def write_value(write, value):
+    """Write a str as-is, or call value(write) to stream it"""
+    if callable(value):
+        value(write)
+    else:
+        write(value)
+
+
+def write_attributes(write, attributes):
+    for name, value in attributes.items():
+        write(f' {name}="')
+        write_value(write, value)
+        write('"')
+
+
+def write_image_tag(write, slot, img, sources=()):
+    """Write the markup for a whole-tag slot.
+
+    img maps the img element's attributes (src first) to their values; the
+    slot's own attrs follow them. sources is a list of attribute dicts for
+    <source> elements; with any, the img is wrapped in <picture> and stays
+    the fallback for browsers that support none of them. A value may be a
+    callable value(write) that streams it, e.g. a large data URI.
+    """
+    if sources:
+        write('<picture>')
+        for source in sources:
+            write('<source')
+            write_attributes(write, source)
+            write('>')
+    write('<img')
+    write_attributes(write, img)
+    write(f'{slot.attrs or ""}>')
+    if sources:
+        write('</picture>')
+
+
+def image_tag(slot, img, sources=()):
+    """write_image_tag() markup as a string"""
+    parts = []
+    write_image_tag(parts.append, slot, img, sources)
+    return ''.join(parts)
+
+
+class HtmlImageRewriter:
+    def __init__(self, image_names, kinds=SLOT_KINDS, whole_tags=False):
+        """
+        image_names -- diagram filenames that may be rewritten
+        kinds       -- slot kinds to report; others are left untouched
+        whole_tags  -- 'src' and 'placeholder' slots stand for a whole img tag
+                       (see write_image_tag) instead of just its URI
+        """
+        unknown = set(kinds) - set(SLOT_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown slot kinds: {', '.join(sorted(unknown))}")
+        self.image_names = set(image_names)
+        self.kinds = frozenset(kinds)
+        self.whole_tags = whole_tags
+        # Ids of sections marked class="... active" (visible on load), filled while scanning
+        self.active_sections = set()
+
+    def placeholder_image(self, section, placeholder_html):
+        """Decide which diagram a placeholder div stands for"""
+        image_name = PLACEHOLDER_SECTIONS.get(section)
+        if image_name is None:
+            for keyword, candidate in PLACEHOLDER_KEYWORDS:
+                if keyword in placeholder_html:
+                    image_name = candidate
+                    break
+        return image_name
+
+    def iter_slots(self, html):
+        """Scan html once, yielding a SlotSpan for every image slot found.
+
+        For 'src' and 'url' slots the span covers just the URI (the whole
+        img tag in whole-tag mode); for a placeholder it covers the whole
+        dashed div, nested divs included.
+        """
+        section = None
+        self.active_sections = set()
+        placeholder_start = None
+        depth = 0
+
+        for match in TOKEN_PATTERN.finditer(html):
+            kind = match.lastgroup
+            start, end = match.span()
+
+            if placeholder_start is not None:
+                # Inside a placeholder: only track div nesting until it closes
+                if kind == 'div_open':
+                    depth += 1
+                elif kind == 'div_close':
+                    depth -= 1
+                    if depth == 0:
+                        image_name = self.placeholder_image(section, html[placeholder_start:end])
+                        if image_name in self.image_names and 'placeholder' in self.kinds:
+                            attrs = None
+                            if self.whole_tags:
+                                attrs = f' alt="{image_alt_text(image_name)}" style="{PLACEHOLDER_IMG_STYLE}"'
+                            yield SlotSpan(ImageSlot(image_name, 'placeholder', section, attrs),
+                                           placeholder_start, end)
+                        placeholder_start = None
+                continue
+
+            if kind == 'img':
+                src = SRC_ATTR.search(html, start, end)
+                if src and 'src' in self.kinds:
+                    image_name = os.path.basename(src.group(1))
+                    if image_name in self.image_names and self.whole_tags:
+                        # Keep every other attribute; a self-closing slash is dropped
+                        before = html[start + len('<img'):src.start()].strip()
+                        after = html[src.end():end - 1].rstrip('/').strip()
+                        attrs = ''.join(f' {part}' for part in (before, after) if part)
+                        yield SlotSpan(ImageSlot(image_name, 'src', section, attrs), start, end)
+                    elif image_name in self.image_names:
+                        yield SlotSpan(ImageSlot(image_name, 'src', section), src.start(1), src.end(1))
+
+            elif kind == 'url':
+                image_name = os.path.basename(match.group('url_path'))
+                if image_name in self.image_names and 'url' in self.kinds:
+                    yield SlotSpan(ImageSlot(image_name, 'url', section),
+                                   match.start('url_path'), match.end('url_path'))
+
+            elif kind == 'section':
+                section_id = ID_ATTR.search(html, start, end)
+                section = section_id.group(1) if section_id else None
+                section_class = CLASS_ATTR.search(html, start, end)
+                if section and section_class and 'active' in section_class.group(1).split():
+                    self.active_sections.add(section)
+
+            elif kind == 'div_open':
+                style = STYLE_ATTR.search(html, start, end)
+                if style and PLACEHOLDER_STYLE.search(style.group(1)):
+                    placeholder_start = start
+                    depth = 1
+
+    def find_slots(self, html):
+        """List of SlotSpan offsets for every image slot in html"""
+        return list(self.iter_slots(html))
+
+    def iter_segments(self, html):
+        """Scan html once, yielding literal text (str) and ImageSlot markers.
+
+        Writing every str as-is and the URI (or, in whole-tag mode, the
+        write_image_tag() markup) for every ImageSlot reproduces the
+        document with all known images rewritten.
+        """
+        pos = 0
+        for slot, start, end in self.iter_slots(html):
+            yield html[pos:start]
+            if slot.kind == 'placeholder':
+                # Keep the placeholder's vertical spacing around the image
+                style = STYLE_ATTR.search(html, start, html.index('>', start) + 1)
+                margins = ' '.join(MARGIN_STYLE.findall(style.group(1))) or 'margin-bottom: 20px;'
+                if self.whole_tags:
+                    yield f'<div style="{margins}">'
+                    yield slot
+                    yield '</div>'
+                else:
+                    yield f'<div style="{margins}"><img src="'
+                    yield slot
+                    yield f'" alt="{image_alt_text(slot.name)}" style="{PLACEHOLDER_IMG_STYLE}"></div>'
+            else:
+                yield slot
+            pos = end
+        yield html[pos:]
+
+    def rewrite(self, html, resolve, write):
+        """Stream the rewritten document through write(); returns slots filled.
+
+        resolve(slot) must return the URI text for an ImageSlot, or its
+        whole markup in whole-tag mode (see image_tag()).
+        """
+        slots = []
+        for segment in self.iter_segments(html):
+            if isinstance(segment, ImageSlot):
+                write(resolve(segment))
+                slots.append(segment)
+            elif segment:
+                write(segment)
+        return slots
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Font Awesome Icon Inliner
+Subsets the Font Awesome webfont to the icons a page uses and inlines it
+"""
+import argparse
+import base64
+import io
+import re
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+from data_uri_cache import DEFAULT_CACHE_DIR
+
+try:
+    from fontTools import subset as font_subset
+    from fontTools.ttLib import TTFont
+except ImportError:  # fontTools is only needed when icons are inlined
+    font_subset = None
+    TTFont = None
+
+try:
+    import brotli  # noqa: F401 -- lets fontTools read and write WOFF2
+    WOFF2_AVAILABLE = True
+except ImportError:
+    WOFF2_AVAILABLE = False
+
+DEFAULT_FONTAWESOME_DIR = DEFAULT_CACHE_DIR / "fontawesome"
+
+FONTAWESOME_LINK = re.compile(
+    r'[ \t]*<link\b[^>]*\bhref\s*=\s*"(?P<href>[^"]*font-?awesome[^"]*/css/all(?:\.min)?\.css)"[^>]*>[ \t]*\r?\n?',
+    re.IGNORECASE)
+CLASS_ATTR = re.compile(r'\bclass\s*=\s*"([^"]*)"', re.IGNORECASE)
+# One CSS rule whose only declaration is an icon codepoint, e.g.
+# .fa-truck-medical:before,.fa-ambulance:before{content:"\f0f9"}
+ICON_RULE = re.compile(r'([^{}]+)\{content:\s*"\\([0-9a-fA-F]+)"\s*\}')
+ICON_SELECTOR = re.compile(r'^\.fa-([a-z0-9-]+):{1,2}before$')
+
+# Style class -> (webfont stem, font-family, font-weight); a bare "fa" is solid
+FONT_STYLES = {
+    "solid": ("fa-solid-900", "Font Awesome 6 Free", 900),
+    "regular": ("fa-regular-400", "Font Awesome 6 Free", 400),
+    "brands": ("fa-brands-400", "Font Awesome 6 Brands", 400),
+}
+STYLE_CLASSES = {
+    "fa": "solid", "fas": "solid", "fa-solid": "solid",
+    "far": "regular", "fa-regular": "regular",
+    "fab": "brands", "fa-brands": "brands",
+}
+
+# Sizing, animation and layout utilities: fa-* classes that are not icons
+MODIFIER_CLASSES = {
+    "fa-fw", "fa-border", "fa-inverse", "fa-li", "fa-ul", "fa-stack", "fa-stack-1x", "fa-stack-2x",
+    "fa-pull-left", "fa-pull-right", "fa-pull-start", "fa-pull-end",
+    "fa-spin", "fa-spin-pulse", "fa-spin-reverse", "fa-pulse", "fa-beat", "fa-beat-fade", "fa-bounce",
+    "fa-fade", "fa-flip", "fa-shake", "fa-rotate-90", "fa-rotate-180", "fa-rotate-270", "fa-rotate-by",
+    "fa-flip-horizontal", "fa-flip-vertical", "fa-flip-both", "fa-sr-only", "fa-sr-only-focusable",
+    "fa-width-auto", "fa-layers", "fa-layers-text", "fa-layers-counter",
+}
+SIZE_CLASS = re.compile(r'^fa-(?:\d+x|2xs|xs|sm|lg|xl|2xl)$')
+
+BASE_CSS = ("{selectors}{{-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;"
+            "display:inline-block;font-style:normal;font-variant:normal;line-height:1;text-rendering:auto}}")
+
+
+def is_modifier_class(cls):
+    """True for Font Awesome utility classes such as fa-2x, fa-fw or fa-spin"""
+    return cls in MODIFIER_CLASSES or bool(SIZE_CLASS.match(cls))
+
+
+def used_icon_classes(html_content):
+    """{style: set of icon names} for every element carrying fa-* icon classes"""
+    used = {}
+    for match in CLASS_ATTR.finditer(html_content):
+        classes = match.group(1).split()
+        styles = {STYLE_CLASSES[cls] for cls in classes if cls in STYLE_CLASSES}
+        icons = {cls[3:] for cls in classes
+                 if cls.startswith("fa-") and cls not in STYLE_CLASSES and not is_modifier_class(cls)}
+        if not styles or not icons:
+            continue
+        for style in styles:
+            used.setdefault(style, set()).update(icons)
+    return used
+
+
+def parse_icon_codepoints(css):
+    """{icon name: codepoint} from a Font Awesome stylesheet"""
+    codepoints = {}
+    for match in ICON_RULE.finditer(css):
+        codepoint = int(match.group(2), 16)
+        for selector in match.group(1).split(","):
+            name = ICON_SELECTOR.match(selector.strip())
+            if name:
+                codepoints[name.group(1)] = codepoint
+    return codepoints
+
+
+class FontAwesomeAssets:
+    def __init__(self, base_url, local_dir=None, cache_dir=DEFAULT_FONTAWESOME_DIR):
+        """
+        base_url  -- CDN folder holding css/ and webfonts/ (from the page's <link>)
+        local_dir -- unpacked Font Awesome release to use instead of the CDN
+        cache_dir -- downloads are kept here, one folder per release
+        """
+        self.base_url = base_url.rstrip("/")
+        self.local_dir = Path(local_dir) if local_dir else None
+        self.cache_dir = Path(cache_dir) / re.sub(r'[^A-Za-z0-9.-]+', '_', self.base_url.split("//")[-1])
+
+    def read(self, relative_path):
+        """Bytes of a release file, downloading it once when no local copy exists"""
+        if self.local_dir:
+            return (self.local_dir / relative_path).read_bytes()
+        cached = self.cache_dir / relative_path
+        if not cached.exists():
+            with urllib.request.urlopen(f"{self.base_url}/{relative_path}", timeout=30) as response:
+                data = response.read()
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached.with_suffix(cached.suffix + ".tmp")
+            tmp_path.write_bytes(data)
+            tmp_path.replace(cached)
+        return cached.read_bytes()
+
+
+class IconInliner:
+    def __init__(self, local_dir=None, cache_dir=DEFAULT_FONTAWESOME_DIR):
+        """
+        local_dir -- unpacked Font Awesome release (css/, webfonts/); default is the
+                     CDN named in the page, downloaded once into cache_dir
+        """
+        if font_subset is None:
+            raise ImportError("Icon inlining needs fontTools: pip install fonttools brotli")
+        self.local_dir = local_dir
+        self.cache_dir = cache_dir
+        self.report = None
+
+    def subset_font(self, assets, stem, codepoints):
+        """Subset one webfont to codepoints; returns (mime type, format, font bytes, cdn bytes)"""
+        # Browsers fetch the WOFF2; reading it needs brotli, the TTF does not
+        cdn_bytes = len(assets.read(f"webfonts/{stem}.woff2"))
+        source = f"webfonts/{stem}.woff2" if WOFF2_AVAILABLE else f"webfonts/{stem}.ttf"
+        font = TTFont(io.BytesIO(assets.read(source)))
+
+        options = font_subset.Options()
+        options.flavor = "woff2" if WOFF2_AVAILABLE else "woff"
+        options.layout_features = []
+        options.name_IDs = []
+        options.notdef_outline = True
+        subsetter = font_subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+
+        output = io.BytesIO()
+        font.flavor = options.flavor
+        font.save(output)
+        return f"font/{options.flavor}", options.flavor, output.getvalue(), cdn_bytes
+
+    def build_style(self, assets, used, codepoints):
+        """CSS rules replacing the CDN stylesheet, plus the icons that were not found"""
+        rules = []
+        icon_rules = {}
+        missing = set()
+        cdn_font_bytes = 0
+        for style in sorted(used):
+            stem, family, weight = FONT_STYLES[style]
+            found = {icon: codepoints[icon] for icon in used[style] if icon in codepoints}
+            missing.update(used[style] - set(found))
+            if not found:
+                continue
+            mime_type, fmt, font_bytes, cdn_bytes = self.subset_font(assets, stem, sorted(set(found.values())))
+            cdn_font_bytes += cdn_bytes
+            data_uri = f"data:{mime_type};base64,{base64.b64encode(font_bytes).decode('ascii')}"
+            rules.append(f'@font-face{{font-family:"{family}";font-style:normal;font-weight:{weight};'
+                         f'font-display:block;src:url({data_uri}) format("{fmt}")}}')
+            selectors = ",".join(f".{cls}" for cls, cls_style in STYLE_CLASSES.items() if cls_style == style)
+            rules.append(f'{selectors}{{font-family:"{family}";font-weight:{weight}}}')
+            for icon, codepoint in found.items():
+                icon_rules[icon] = f'.fa-{icon}:before{{content:"\\{codepoint:x}"}}'
+
+        style_classes = [cls for cls, cls_style in STYLE_CLASSES.items() if cls_style in used]
+        if style_classes:
+            rules.insert(0, BASE_CSS.format(selectors=",".join(f".{cls}" for cls in style_classes)))
+        rules.extend(icon_rules[icon] for icon in sorted(icon_rules))
+        return rules, sorted(icon_rules), sorted(missing), cdn_font_bytes
+
+    def inline(self, html_content):
+        """Replace the Font Awesome CDN <link> with an inline subset; returns the new HTML.
+
+        A page without the CDN link is returned unchanged, and so is one whose
+        Font Awesome release cannot be downloaded (report["error"] says why).
+        The byte accounting of the last call is kept in self.report.
+        """
+        link = FONTAWESOME_LINK.search(html_content)
+        if not link:
+            self.report = None
+            return html_content
+
+        href = link.group("href")
+        assets = FontAwesomeAssets(href.rsplit("/css/", 1)[0], self.local_dir, self.cache_dir)
+        css_path = "css/" + href.rsplit("/css/", 1)[1]
+        try:
+            css = assets.read(css_path)
+            codepoints = parse_icon_codepoints(css.decode("utf-8"))
+            used = used_icon_classes(html_content)
+            rules, icons, missing, cdn_font_bytes = self.build_style(assets, used, codepoints)
+        except (urllib.error.URLError, TimeoutError) as e:
+            # Offline: keep the CDN link rather than fail the whole build
+            self.report = {"error": f"{assets.base_url}: {getattr(e, 'reason', e)}"}
+            return html_content
+        newline = "\r\n" if link.group(0).endswith("\r\n") else "\n"
+        style_block = newline.join(["    <style>"] + [f"        {rule}" for rule in rules] + ["    </style>", ""])
+        modifiers = {cls for match in CLASS_ATTR.finditer(html_content)
+                     for cls in match.group(1).split() if is_modifier_class(cls)}
+        self.report = {
+            "icons": icons,
+            "missing": missing,
+            "modifiers": sorted(modifiers),
+            "cdn_bytes": len(css) + cdn_font_bytes,
+            "inline_bytes": len(style_block.encode("utf-8")),
+        }
+        return html_content[:link.start()] + style_block + html_content[link.end():]
+
+    def print_report(self):
+        if not self.report:
+            return
+        report = self.report
+        if "error" in report:
+            print(f"⚠️  Font Awesome not inlined, keeping the CDN link ({report['error']})")
+            return
+        saved = report["cdn_bytes"] - report["inline_bytes"]
+        print(f"🔣 Font Awesome: {len(report['icons'])} icons inlined, "
+              f"{report['cdn_bytes'] / 1024:.0f} KB from CDN -> {report['inline_bytes'] / 1024:.1f} KB inline "
+              f"({saved / 1024:.0f} KB saved)")
+        if report["missing"]:
+            print(f"⚠️  Not in this Font Awesome release: {', '.join('fa-' + icon for icon in report['missing'])}")
+        if report["modifiers"]:
+            print(f"⚠️  Utility classes without inline CSS (only icons are inlined): {', '.join(report['modifiers'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inline the Font Awesome icons an HTML page uses")
+    parser.add_argument("html_file", help="page that links Font Awesome from a CDN")
+    parser.add_argument("-o", "--output", help="output file (default: rewrite in place)")
+    parser.add_argument("--fontawesome-dir", help="unpacked Font Awesome release to use instead of the CDN")
+    args = parser.parse_args()
+
+    html_file = Path(args.html_file)
+    inliner = IconInliner(local_dir=args.fontawesome_dir)
+    with open(html_file, 'r', encoding='utf-8', newline='') as f:
+        html_content = inliner.inline(f.read())
+    if inliner.report is None:
+        print(f"No Font Awesome CDN link found in {html_file}")
+        return
+    if "error" in inliner.report:
+        inliner.print_report()
+        return 1
+    output = Path(args.output) if args.output else html_file
+    with open(output, 'w', encoding='utf-8', newline='') as f:
+        f.write(html_content)
+    inliner.print_report()
+    print(f"✅ Output file: {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
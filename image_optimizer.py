@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Image Optimizer
+Downscales and re-encodes diagrams before they are embedded into the HTML
+"""
+import hashlib
+import json
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow is only needed when optimisation is switched on
+    Image = None
+    features = None
+
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / ".embed_cache" / "optimized"
+
+# Pillow save options for each output format
+SAVE_OPTIONS = {
+    "png": {"format": "PNG", "optimize": True, "compress_level": 9},
+    "webp": {"format": "WEBP", "quality": 90, "method": 6},
+}
+# Encodings offered for embedding. PNG is always the <img> fallback; the others
+# go in <picture><source> elements in front of it
+EMBED_FORMATS = ("png", "webp")
+
+# Result of optimize(): the PNG every browser can show, plus {format: path}
+# for smaller alternative encodings
+OptimizedImage = namedtuple('OptimizedImage', ['fallback', 'alternatives'])
+
+
+class ImageOptimizer:
+    def __init__(self, target_width=None, quantize_colors=None, formats=("png",),
+                 output_dir=DEFAULT_OUTPUT_DIR):
+        """
+        target_width    -- downscale wider images to this many pixels (keeps aspect ratio)
+        quantize_colors -- reduce flat-colour diagrams to a palette of this many colours
+        formats         -- encodings out of EMBED_FORMATS; PNG is always the fallback and
+                           the others are kept as alternatives when smaller than it
+        """
+        if Image is None:
+            raise ImportError("Image optimisation needs Pillow: pip install pillow")
+        unknown = set(formats) - set(EMBED_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported image formats for embedding: {', '.join(sorted(unknown))}")
+        self.target_width = target_width
+        self.quantize_colors = quantize_colors
+        self.formats = tuple(dict.fromkeys(("png",) + tuple(formats)))
+        self.output_dir = Path(output_dir)
+        self.report = []
+
+    def available_formats(self):
+        """Requested formats this Pillow build can actually write"""
+        return [fmt for fmt in self.formats if fmt == "png" or features.check(fmt)]
+
+    def _fingerprint(self, source):
+        """Short key over the source file identity and the optimisation options"""
+        stat = source.stat()
+        key = json.dumps([str(source.resolve()), stat.st_mtime_ns, stat.st_size,
+                          self.target_width, self.quantize_colors, self.formats])
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+
+    def prepare(self, image):
+        """Apply downscaling and palette quantisation to a loaded image"""
+        if self.target_width and image.width > self.target_width:
+            height = round(image.height * self.target_width / image.width)
+            image = image.resize((self.target_width, height), Image.LANCZOS)
+        if self.quantize_colors:
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            image = image.quantize(colors=self.quantize_colors, method=Image.Quantize.FASTOCTREE)
+        return image
+
+    def optimize(self, source):
+        """Optimise one image; returns an OptimizedImage of the PNG fallback and alternatives"""
+        source = Path(source)
+        fingerprint = self._fingerprint(source)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        candidates = []
+        prepared = None
+        for fmt in self.available_formats():
+            target = self.output_dir / f"{source.stem}.{fingerprint}.{fmt}"
+            if not target.exists():
+                if prepared is None:
+                    with Image.open(source) as original:
+                        prepared = self.prepare(original.copy())
+                image = prepared
+                if fmt != "png" and image.mode == "P":
+                    image = image.convert("RGBA")
+                image.save(target, **SAVE_OPTIONS[fmt])
+            candidates.append(target)
+
+        original_bytes = source.stat().st_size
+        fallback = candidates[0]
+        # Never embed a PNG bigger than the original
+        if fallback.stat().st_size >= original_bytes:
+            fallback = source
+        fallback_bytes = fallback.stat().st_size
+        alternatives = {path.suffix.lstrip("."): path for path in candidates[1:]
+                        if path.stat().st_size < fallback_bytes}
+        # Both payloads end up in the page, so both count
+        optimized_bytes = fallback_bytes + sum(path.stat().st_size for path in alternatives.values())
+        self.report.append({
+            "name": source.name,
+            "format": "+".join(["png", *alternatives]),
+            "original_bytes": original_bytes,
+            "optimized_bytes": optimized_bytes,
+            "saved_bytes": original_bytes - optimized_bytes,
+        })
+        return OptimizedImage(fallback, alternatives)
+
+    def print_report(self):
+        """Per-image table of bytes saved"""
+        if not self.report:
+            return
+        print(f"{'Image':<34} {'Format':>8} {'Original KB':>12} {'Optimized KB':>13} {'Saved':>7}")
+        for row in self.report:
+            saved = row["saved_bytes"] / row["original_bytes"] * 100 if row["original_bytes"] else 0
+            print(f"{row['name']:<34} {row['format']:>8} {row['original_bytes'] / 1024:>12.0f} "
+                  f"{row['optimized_bytes'] / 1024:>13.0f} {saved:>6.0f}%")
+        original = sum(row["original_bytes"] for row in self.report)
+        optimized = sum(row["optimized_bytes"] for row in self.report)
+        print(f"{'Total':<34} {'':>8} {original / 1024:>12.0f} {optimized / 1024:>13.0f} "
+              f"{(original - optimized) / original * 100 if original else 0:>6.0f}%")
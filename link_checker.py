@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Link Checker
+Validates every external src/href in the generated HTML concurrently, with a TTL cache
+"""
+import argparse
+import asyncio
+import html
+import json
+import os
+import re
+import ssl
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+
+REPO_ROOT = Path(__file__).resolve().parent
+DEFAULT_CACHE_FILE = REPO_ROOT / ".build" / "link_cache.json"
+DEFAULT_SOURCES = ["*.html", "interactive/*.html", "presentation/*.html", "google_drive_urls_actual.py"]
+
+DEFAULT_TTL = 24 * 3600  # seconds a passing result is trusted
+DEFAULT_FAILURE_TTL = 3600  # failures are retried sooner
+MAX_REDIRECTS = 5
+
+# kind is 'image' (img src / CSS url / Drive mapping), 'src' (script, iframe...) or 'href'
+Link = namedtuple('Link', ['url', 'kind', 'source'])
+
+TAG_PATTERN = re.compile(r'<(?P<tag>[a-zA-Z][a-zA-Z0-9]*)\b[^>]*>')
+ATTR_PATTERN = re.compile(r'\b(?P<attr>src|href)\s*=\s*(?P<quote>["\'])(?P<url>https?://[^"\']+)(?P=quote)', re.IGNORECASE)
+CSS_URL_PATTERN = re.compile(r'url\(\s*(["\']?)(?P<url>https?://[^"\')\s]+)\1\s*\)', re.IGNORECASE)
+STRING_URL_PATTERN = re.compile(r'["\'](?P<url>https?://[^"\'\s]+)["\']')
+
+
+def extract_links(text, source):
+    """External links in one HTML page (or Python URL mapping), in document order"""
+    links = []
+    if source.endswith(".py"):
+        for match in STRING_URL_PATTERN.finditer(text):
+            links.append(Link(match.group('url'), 'image', source))
+        return links
+    for tag in TAG_PATTERN.finditer(text):
+        for attr in ATTR_PATTERN.finditer(tag.group(0)):
+            url = html.unescape(attr.group('url'))
+            if attr.group('attr').lower() == 'href':
+                kind = 'href'
+            else:
+                kind = 'image' if tag.group('tag').lower() == 'img' else 'src'
+            links.append(Link(url, kind, source))
+    for match in CSS_URL_PATTERN.finditer(text):
+        links.append(Link(html.unescape(match.group('url')), 'image', source))
+    return links
+
+
+def collect_links(patterns=DEFAULT_SOURCES, root=REPO_ROOT):
+    """{url: [Link, ...]} across every file matching patterns"""
+    found = {}
+    for pattern in patterns:
+        for path in sorted(Path(root).glob(pattern)):
+            text = path.read_text(encoding='utf-8', errors='replace')
+            for link in extract_links(text, str(path.relative_to(root))):
+                found.setdefault(link.url, []).append(link)
+    return found
+
+
+class LinkCache:
+    def __init__(self, cache_file=DEFAULT_CACHE_FILE, ttl=DEFAULT_TTL, failure_ttl=DEFAULT_FAILURE_TTL):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.hits = 0
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                self.results = json.load(f)
+        except (OSError, ValueError):
+            self.results = {}
+
+    def get(self, url, kind):
+        """Cached result for url if it is still fresh, else None"""
+        result = self.results.get(f"{kind} {url}")
+        if result is None:
+            return None
+        ttl = self.ttl if result["ok"] else self.failure_ttl
+        if time.time() - result["checked_at"] > ttl:
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, kind, result):
+        self.results[f"{kind} {result['url']}"] = result
+
+    def save(self):
+        now = time.time()
+        live = {key: result for key, result in self.results.items()
+                if now - result["checked_at"] <= max(self.ttl, self.failure_ttl)}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_file.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(live, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.cache_file)
+
+
+class ConnectionPool:
+    """Keep-alive connections per origin, capped overall and per host"""
+
+    def __init__(self, max_connections=64, per_host=8, timeout=10):
+        self.timeout = timeout
+        self.total = asyncio.Semaphore(max_connections)
+        self.per_host = per_host
+        self.host_limits = {}
+        self.idle = {}
+        self.opened = 0
+        self.ssl_context = ssl.create_default_context()
+
+    def _host_limit(self, origin):
+        if origin not in self.host_limits:
+            self.host_limits[origin] = asyncio.Semaphore(self.per_host)
+        return self.host_limits[origin]
+
+    async def acquire(self, origin, fresh=False):
+        """(reader, writer, reused) to origin; hold the returned slot until release().
+
+        reused is True for an idle keep-alive connection, which the server may
+        already have closed without this side having seen it; fresh=True
+        always opens a new one.
+        """
+        await self._host_limit(origin).acquire()
+        await self.total.acquire()
+        idle = self.idle.get(origin)
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = origin
+        try:
+            connection = await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=self.ssl_context if scheme == "https" else None),
+                self.timeout)
+        except BaseException:
+            self.total.release()
+            self._host_limit(origin).release()
+            raise
+        self.opened += 1
+        return (*connection, False)
+
+    def release(self, origin, connection, reusable):
+        if reusable:
+            self.idle.setdefault(origin, []).append(connection)
+        else:
+            connection[1].close()
+        self.total.release()
+        self._host_limit(origin).release()
+
+    def close(self):
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle = {}
+
+
+async def read_response(reader, method):
+    """(status, headers, keep_alive) of one response, consuming and discarding its body"""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial:
+            raise
+        raise ConnectionResetError("connection closed before the response started") from e
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    status = int(status_line.split(" ", 2)[1])
+    headers = {}
+    for line in header_lines:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    keep_alive = headers.get("connection", "").lower() != "close"
+
+    if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+        return status, headers, keep_alive
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+    else:
+        await reader.read()
+        keep_alive = False
+    return status, headers, keep_alive
+
+
+class LinkChecker:
+    def __init__(self, max_connections=64, per_host=8, timeout=10, cache=None):
+        """
+        max_connections -- open sockets allowed at once across all hosts
+        per_host        -- open sockets allowed per host (be polite to CDNs)
+        cache           -- LinkCache, or None to always re-check
+        """
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.checked = 0
+
+    async def request(self, pool, method, url):
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        origin = (parts.scheme, parts.hostname, port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        request = (f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nUser-Agent: tlm-link-checker\r\n"
+                   f"Accept: */*\r\n" + ("Range: bytes=0-0\r\n" if method == "GET" else "") + "\r\n")
+
+        for attempt in range(2):
+            reader, writer, reused = await pool.acquire(origin, fresh=attempt > 0)
+            reusable = False
+            try:
+                writer.write(request.encode("latin-1"))
+                await writer.drain()
+                status, headers, reusable = await asyncio.wait_for(read_response(reader, method), self.timeout)
+                return status, headers
+            except ConnectionError:
+                # An idle keep-alive connection the server dropped before answering: retry once
+                # on a new one; anything else is the URL's own failure
+                if not reused:
+                    raise
+            finally:
+                pool.release(origin, (reader, writer), reusable)
+
+    async def check(self, pool, url, kind):
+        """Result dict for one URL: status, final_url, content_type, ok, error"""
+        start = time.perf_counter()
+        result = {"url": url, "status": None, "final_url": url, "content_type": None, "ok": False, "error": None}
+        try:
+            current = url
+            for _ in range(MAX_REDIRECTS + 1):
+                status, headers = await self.request(pool, "HEAD", current)
+                if status in (403, 405, 501):
+                    # Some hosts (Drive among them) reject HEAD; ask for a single byte instead
+                    status, headers = await self.request(pool, "GET", current)
+                if status in (301, 302, 303, 307, 308) and "location" in headers:
+                    current = urljoin(current, headers["location"])
+                    continue
+                break
+            result.update(status=status, final_url=current, content_type=headers.get("content-type"))
+            if status >= 400 or status in (301, 302, 303, 307, 308):
+                result["error"] = f"HTTP {status}"
+            elif kind == 'image' and not (result["content_type"] or "").startswith("image/"):
+                result["error"] = f"not an image ({result['content_type'] or 'no content type'})"
+            else:
+                result["ok"] = True
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+            result["error"] = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+        result["elapsed"] = round(time.perf_counter() - start, 3)
+        result["checked_at"] = time.time()
+        self.checked += 1
+        return result
+
+    async def check_all_async(self, links):
+        """links is {url: kind}; returns {url: result}"""
+        results = {}
+        pending = {}
+        for url, kind in links.items():
+            cached = self.cache.get(url, kind) if self.cache else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending[url] = kind
+
+        pool = ConnectionPool(self.max_connections, self.per_host, self.timeout)
+        try:
+            checked = await asyncio.gather(*(self.check(pool, url, kind) for url, kind in pending.items()))
+        finally:
+            pool.close()
+        self.connections_opened = pool.opened
+        for (url, kind), result in zip(pending.items(), checked):
+            results[url] = result
+            if self.cache:
+                self.cache.put(kind, result)
+        if self.cache:
+            self.cache.save()
+        return results
+
+    def check_all(self, links):
+        return asyncio.run(self.check_all_async(links))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate external links and images in the generated HTML")
+    parser.add_argument("sources", nargs="*",
+                        help="files or glob patterns relative to the current directory "
+                             "(default: the generated HTML and Drive URL map)")
+    parser.add_argument("--concurrency", type=int, default=64, help="open connections across all hosts")
+    parser.add_argument("--per-host", type=int, default=8, help="open connections per host")
+    parser.add_argument("--timeout", type=float, default=10, help="seconds per request")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL, help="seconds a passing result is cached")
+    parser.add_argument("--no-cache", action="store_true", help="re-check every link")
+    args = parser.parse_args()
+
+    print("🔗 DIABETES TLM - LINK CHECKER")
+    print("=" * 50)
+    start = time.perf_counter()
+    found = collect_links(args.sources, Path.cwd()) if args.sources else collect_links()
+    # A URL used as an image anywhere must actually be an image
+    links = {url: 'image' if any(link.kind == 'image' for link in refs) else refs[0].kind
+             for url, refs in found.items()}
+    cache = None if args.no_cache else LinkCache(ttl=args.ttl)
+    checker = LinkChecker(args.concurrency, args.per_host, args.timeout, cache)
+    results = checker.check_all(links)
+
+    broken = {url: result for url, result in results.items() if not result["ok"]}
+    for url, result in sorted(broken.items()):
+        sources = sorted({link.source for link in found[url]})
+        print(f"❌ {result['error']}: {url}")
+        print(f"   in {', '.join(sources)}")
+    print("=" * 50)
+    print(f"✅ OK: {len(results) - len(broken)}  ❌ Broken: {len(broken)}  "
+          f"♻️  Cached: {cache.hits if cache else 0}  🌐 Checked: {checker.checked}")
+    print(f"⏱️  {time.perf_counter() - start:.2f}s")
+    return 1 if broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+PPTX Charts
+Native, editable PowerPoint charts built from the shared epidemiology dataset
+"""
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION
+from pptx.util import Emu, Pt
+
+from visualizations.epidemiology_data import (
+    YEARS, GLOBAL_CASES, INDIA_YEARS, INDIA_PREVALENCE, INDIA_CASES,
+    REGIONS, REGIONAL_PREVALENCE, REGION_COLORS,
+    GLOBAL_COLOR, INDIA_PREVALENCE_COLOR, INDIA_CASES_COLOR,
+)
+
+
+def hex_to_rgb(color):
+    """'#1976D2' -> RGBColor(0x19, 0x76, 0xD2)"""
+    return RGBColor.from_string(color.lstrip('#'))
+
+
+def add_category_chart(slide, chart_type, title, categories, values, color, left, top, width, height,
+                       number_format='General', point_colors=None):
+    """Add a single-series category chart styled like the matplotlib panels"""
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    chart_data.add_series(title, values, number_format)
+    chart = slide.shapes.add_chart(chart_type, left, top, width, height, chart_data).chart
+
+    chart.has_legend = False
+    chart.has_title = True
+    chart.chart_title.text_frame.text = title
+    title_font = chart.chart_title.text_frame.paragraphs[0].font
+    title_font.size = Pt(12)
+    title_font.bold = True
+    chart.font.size = Pt(9)
+    chart.value_axis.has_major_gridlines = True
+    chart.value_axis.major_gridlines.format.line.color.rgb = RGBColor(224, 224, 224)
+    chart.value_axis.tick_labels.number_format = number_format
+    chart.value_axis.tick_labels.number_format_is_linked = False
+
+    plot = chart.plots[0]
+    plot.has_data_labels = True
+    plot.data_labels.number_format = number_format
+    plot.data_labels.number_format_is_linked = False
+    plot.data_labels.font.bold = True
+    plot.data_labels.position = XL_LABEL_POSITION.ABOVE if chart_type == XL_CHART_TYPE.LINE_MARKERS \
+        else XL_LABEL_POSITION.OUTSIDE_END
+
+    series = plot.series[0]
+    if chart_type == XL_CHART_TYPE.LINE_MARKERS:
+        series.smooth = False
+        series.format.line.color.rgb = hex_to_rgb(color)
+        series.format.line.width = Pt(2.5)
+        series.marker.format.fill.solid()
+        series.marker.format.fill.fore_color.rgb = hex_to_rgb(color)
+        series.marker.format.line.color.rgb = hex_to_rgb(color)
+    else:
+        plot.gap_width = 60
+        series.format.fill.solid()
+        series.format.fill.fore_color.rgb = hex_to_rgb(color)
+        for index, point_color in enumerate(point_colors or []):
+            point = series.points[index]
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = hex_to_rgb(point_color)
+    return chart
+
+
+def add_epidemiology_charts(slide, left, top, width, height, gap=Emu(91440)):
+    """Lay out the four epidemiology panels as a 2x2 grid of native charts.
+
+    Mirrors visualizations/epidemiology_chart.py: global cases, India
+    prevalence, India cases and 2021 regional prevalence.
+    """
+    cell_width = (width - gap) // 2
+    cell_height = (height - gap) // 2
+    cells = [(left + col * (cell_width + gap), top + row * (cell_height + gap))
+             for row in range(2) for col in range(2)]
+    regions = [region.replace('\n', ' ') for region in REGIONS]
+
+    panels = [
+        (XL_CHART_TYPE.LINE_MARKERS, 'Global Diabetes Cases (Millions)', YEARS, GLOBAL_CASES,
+         GLOBAL_COLOR, 'General', None),
+        (XL_CHART_TYPE.LINE_MARKERS, 'India: Diabetes Prevalence (%)', INDIA_YEARS, INDIA_PREVALENCE,
+         INDIA_PREVALENCE_COLOR, '0.0"%"', None),
+        (XL_CHART_TYPE.COLUMN_CLUSTERED, 'India: Diabetes Cases (Millions)', INDIA_YEARS, INDIA_CASES,
+         INDIA_CASES_COLOR, '0.0', None),
+        (XL_CHART_TYPE.COLUMN_CLUSTERED, 'Regional Diabetes Prevalence (2021)', regions, REGIONAL_PREVALENCE,
+         REGION_COLORS[0], '0.0"%"', REGION_COLORS),
+    ]
+    charts = []
+    for (cell_left, cell_top), (chart_type, title, categories, values, color, number_format, point_colors) \
+            in zip(cells, panels):
+        charts.append(add_category_chart(slide, chart_type, title, categories, values, color,
+                                         cell_left, cell_top, cell_width, cell_height,
+                                         number_format=number_format, point_colors=point_colors))
+    return charts
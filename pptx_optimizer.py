@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+PPTX Optimizer
+Post-save pass over a deck: pictures resampled to their displayed size, unused layouts and
+orphaned parts dropped, and the ZIP rewritten with compression chosen per entry
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.util import Emu
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".build" / "pptx_media"
+# 13.33in slides on a 1920px projector are 144 px/in; 150 keeps diagrams sharp there
+DEFAULT_DPI = 150
+# Resample only when the picture carries this much more resolution than it is shown at
+RESAMPLE_SLACK = 1.1
+# zlib level 6 is within 0.5% of level 9 plus optimize on the diagrams, at a third of the time
+SAVE_OPTIONS = {
+    "PNG": {"format": "PNG", "compress_level": 6},
+    "JPEG": {"format": "JPEG", "quality": 88, "optimize": True, "progressive": True},
+}
+# Media that is already compressed (or is itself a ZIP); deflating it again only costs time
+STORED_EXTENSIONS = {".png", ".jpeg", ".jpg", ".gif", ".xlsx", ".mp4", ".m4a", ".mp3"}
+XML_COMPRESS_LEVEL = 9
+
+
+def iter_pictures(shapes):
+    """Picture shapes among shapes, including those inside groups"""
+    for shape in shapes:
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP:
+            yield from iter_pictures(shape.shapes)
+        elif shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+            yield shape
+
+
+def displayed_pixels(picture, dpi):
+    """(width, height) in pixels the whole image needs to show picture at dpi, crop included"""
+    visible_width = 1 - picture.crop_left - picture.crop_right
+    visible_height = 1 - picture.crop_top - picture.crop_bottom
+    return (Emu(picture.width).inches * dpi / max(visible_width, 0.01),
+            Emu(picture.height).inches * dpi / max(visible_height, 0.01))
+
+
+class PptxOptimizer:
+    def __init__(self, dpi=DEFAULT_DPI, quantize_colors=None, drop_layouts=True, drop_thumbnail=True,
+                 cache_dir=DEFAULT_CACHE_DIR):
+        """
+        dpi             -- resolution pictures keep at the size they are shown on the slide
+        quantize_colors -- reduce PNG pictures to a palette of this many colours (lossy, off by default)
+        drop_layouts    -- remove slide layouts no slide uses
+        drop_thumbnail  -- remove docProps/thumbnail.jpeg, which still shows the blank template
+        cache_dir       -- where resampled pictures are kept between runs; None resamples every time
+        """
+        self.dpi = dpi
+        self.quantize_colors = quantize_colors
+        self.drop_layouts = drop_layouts
+        self.drop_thumbnail = drop_thumbnail
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.report = []
+
+    def cache_key(self, image_part, size):
+        """Hash of the picture's bytes and every parameter its resampled copy depends on"""
+        params = json.dumps([image_part.sha1, [round(value) for value in size], RESAMPLE_SLACK,
+                             self.quantize_colors, SAVE_OPTIONS], sort_keys=True)
+        return hashlib.sha256(params.encode("utf-8")).hexdigest()[:20]
+
+    def cached_resample(self, image_part, size):
+        """resample(), reusing the result of an earlier run; an empty cache file means keep the original"""
+        if self.cache_dir is None:
+            return self.resample(image_part, size)
+        cached = self.cache_dir / f"{self.cache_key(image_part, size)}.{image_part.partname.ext}"
+        if cached.exists():
+            return cached.read_bytes() or None
+        blob = self.resample(image_part, size)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cached.with_name(f"{cached.name}.tmp{os.getpid()}")
+        tmp_path.write_bytes(blob or b"")
+        os.replace(tmp_path, cached)
+        return blob
+
+    def resample(self, image_part, size):
+        """Re-encoded blob for image_part at no more than size pixels, or None when that is not smaller"""
+        with Image.open(io.BytesIO(image_part.blob)) as image:
+            if image.format not in SAVE_OPTIONS:
+                return None
+            options = SAVE_OPTIONS[image.format]
+            if image.mode == "RGBA" and image.getextrema()[3][0] == 255:
+                # matplotlib writes an alpha channel even when nothing is transparent; without it
+                # the resize also skips premultiplying every pixel
+                image = image.convert("RGB")
+            scale = max(size[0] / image.width, size[1] / image.height)
+            if scale * RESAMPLE_SLACK < 1:
+                target = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+                # reducing_gap box-reduces first, then finishes with LANCZOS: same look, far faster
+                image = image.resize(target, Image.LANCZOS, reducing_gap=3.0)
+            if self.quantize_colors and options["format"] == "PNG":
+                image = image.quantize(colors=self.quantize_colors, method=Image.Quantize.FASTOCTREE)
+            output = io.BytesIO()
+            image.save(output, **options)
+        blob = output.getvalue()
+        return blob if len(blob) < len(image_part.blob) else None
+
+    def optimize_pictures(self, prs):
+        """Resample every image part to the largest size any slide shows it at"""
+        needed = {}
+        for slide in prs.slides:
+            for picture in iter_pictures(slide.shapes):
+                image_part = slide.part.related_part(picture._element.blip_rId)
+                width, height = displayed_pixels(picture, self.dpi)
+                current = needed.get(image_part, (0, 0))
+                needed[image_part] = (max(current[0], width), max(current[1], height))
+
+        pictures = []
+        for image_part, size in needed.items():
+            before = len(image_part.blob)
+            blob = self.cached_resample(image_part, size)
+            if blob is not None:
+                image_part._blob = blob
+            pictures.append((str(image_part.partname), before, len(image_part.blob)))
+        return pictures
+
+    def remove_unused_layouts(self, prs):
+        removed = []
+        for master in prs.slide_masters:
+            for layout in list(master.slide_layouts):
+                if not layout.used_by_slides:
+                    removed.append(layout.name)
+                    master.slide_layouts.remove(layout)
+        return removed
+
+    def remove_thumbnail(self, prs):
+        package = prs.part.package
+        for rId, rel in list(package._rels.items()):
+            if rel.reltype == RT.THUMBNAIL:
+                package.drop_rel(rId)
+                return True
+        return False
+
+    def rewrite_zip(self, data, path):
+        """Write the package in data to path, storing compressed media and deflating XML hard"""
+        temp_path = Path(path).with_name(Path(path).name + ".tmp")
+        with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(temp_path, "w") as target:
+            for info in source.infolist():
+                if Path(info.filename).suffix.lower() in STORED_EXTENSIONS:
+                    target.writestr(info.filename, source.read(info), compress_type=zipfile.ZIP_STORED)
+                else:
+                    target.writestr(info.filename, source.read(info), compress_type=zipfile.ZIP_DEFLATED,
+                                    compresslevel=XML_COMPRESS_LEVEL)
+        os.replace(temp_path, path)
+
+    def optimize(self, path):
+        """Optimise the saved deck at path in place; returns its report row"""
+        path = Path(path)
+        start = time.perf_counter()
+        original_bytes = path.stat().st_size
+        prs = Presentation(str(path))
+        with zipfile.ZipFile(path) as archive:
+            original_parts = len(archive.namelist())
+
+        pictures = self.optimize_pictures(prs)
+        layouts = self.remove_unused_layouts(prs) if self.drop_layouts else []
+        thumbnail = self.remove_thumbnail(prs) if self.drop_thumbnail else False
+
+        # python-pptx writes only the parts still reachable through relationships
+        buffer = io.BytesIO()
+        prs.save(buffer)
+        with zipfile.ZipFile(buffer) as archive:
+            parts = len(archive.namelist())
+        self.rewrite_zip(buffer.getvalue(), path)
+
+        row = {
+            "deck": path.name,
+            "original_bytes": original_bytes,
+            "optimized_bytes": path.stat().st_size,
+            "pictures": pictures,
+            "layouts_removed": layouts,
+            "thumbnail_removed": thumbnail,
+            "parts_removed": original_parts - parts,
+            "seconds": time.perf_counter() - start,
+        }
+        self.report.append(row)
+        return row
+
+    def print_report(self):
+        """Per-deck table of size before and after, parts dropped and time taken"""
+        if not self.report:
+            return
+        print(f"{'Deck':<62} {'Before KB':>10} {'After KB':>9} {'Saved':>6} {'Parts':>6} {'Seconds':>8}")
+        for row in self.report:
+            saved = 1 - row["optimized_bytes"] / row["original_bytes"] if row["original_bytes"] else 0
+            print(f"{row['deck']:<62} {row['original_bytes'] / 1024:>10.0f} {row['optimized_bytes'] / 1024:>9.0f} "
+                  f"{saved:>6.0%} {-row['parts_removed']:>6} {row['seconds']:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shrink saved PPTX decks in place")
+    parser.add_argument("decks", nargs="+", help=".pptx files to optimise")
+    parser.add_argument("--dpi", type=float, default=DEFAULT_DPI,
+                        help=f"picture resolution at displayed size (default: {DEFAULT_DPI})")
+    parser.add_argument("--quantize", type=int, metavar="COLORS",
+                        help="reduce PNG pictures to a palette of this many colours (e.g. 256)")
+    parser.add_argument("--keep-layouts", action="store_true", help="keep slide layouts no slide uses")
+    args = parser.parse_args()
+
+    print("🗜️  PPTX OPTIMIZER")
+    print("=" * 50)
+    optimizer = PptxOptimizer(dpi=args.dpi, quantize_colors=args.quantize, drop_layouts=not args.keep_layouts)
+    for deck in args.decks:
+        row = optimizer.optimize(deck)
+        print(f"✅ {deck}: {len(row['pictures'])} pictures, {len(row['layouts_removed'])} unused layouts removed")
+    print("=" * 50)
+    optimizer.print_report()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
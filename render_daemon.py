@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Render Daemon
+Long-lived, pre-warmed matplotlib process that renders diagrams on request
+"""
+import argparse
+import asyncio
+import importlib
+import io
+import json
+import os
+import secrets
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from visualizations import DIAGRAMS, SHARED_MODULES
+
+STATE_FILE = REPO_ROOT / ".build" / "render-daemon.json"
+DEFAULT_IDLE_TIMEOUT = 30 * 60  # seconds without a request before the daemon exits
+START_TIMEOUT = 30
+FORMATS = ("png", "svg")
+
+# Protocol: the client sends one JSON object per line, e.g.
+#   {"token": ..., "command": "render", "diagram": "treatment_algorithm", "fmt": "png", "dpi": 300}
+# and the daemon answers with one JSON header line, {"ok": true, "bytes": N, ...}
+# followed by exactly N bytes of image data (0 for ping and shutdown).
+
+
+def module_signature(names):
+    """mtime/size of the source files behind names; changes when any is edited"""
+    signature = []
+    for name in names:
+        stat = (REPO_ROOT / "visualizations" / f"{name}.py").stat()
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+class RenderDaemon:
+    def __init__(self, state_file=STATE_FILE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.state_file = Path(state_file)
+        self.idle_timeout = idle_timeout
+        self.token = secrets.token_hex(16)
+        self.modules = {}
+        self.shared_signature = None
+        self.renders = 0
+        self.last_request = time.monotonic()
+        self.server = None
+
+    def warm_up(self):
+        """Pay matplotlib's import, font cache and style loading once, up front"""
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        from matplotlib import font_manager
+
+        font_manager.fontManager.findfont("DejaVu Sans")
+        plt.style.library  # parses the bundled style sheets
+        fig, ax = plt.subplots(figsize=(2, 1))
+        for weight in ("normal", "bold"):
+            ax.text(0.5, 0.5, "Warm-up β ₂ ≥", fontweight=weight)
+        for fmt in FORMATS:
+            fig.savefig(io.BytesIO(), format=fmt)
+        plt.close(fig)
+        for name in DIAGRAMS:
+            self.module(name)
+
+    def module(self, name):
+        """Diagram module, re-imported when its source or the shared data changed"""
+        shared_signature = module_signature(SHARED_MODULES)
+        if shared_signature != self.shared_signature:
+            if self.shared_signature is not None:
+                for shared in SHARED_MODULES:
+                    module = sys.modules.get(f"visualizations.{shared}")
+                    if module:
+                        importlib.reload(module)
+                self.modules.clear()
+            self.shared_signature = shared_signature
+
+        signature = module_signature([name])
+        loaded = self.modules.get(name)
+        if loaded and loaded[1] == signature:
+            return loaded[0]
+        module_name = f"visualizations.{name}"
+        if module_name in sys.modules:
+            module = importlib.reload(sys.modules[module_name])
+        else:
+            module = importlib.import_module(module_name)
+        self.modules[name] = (module, signature)
+        return module
+
+    def render(self, request):
+        """Image bytes for one render request"""
+        from figure_cache import FORMAT_RC
+        import matplotlib
+
+        name = request.get("diagram")
+        fmt = request.get("fmt", "png")
+        if name not in DIAGRAMS:
+            raise ValueError(f"Unknown diagram: {name}")
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        size = tuple(request["size"]) if request.get("size") else None
+
+        module = self.module(name)
+        output = io.BytesIO()
+        with matplotlib.rc_context({"savefig.format": fmt, **FORMAT_RC.get(fmt, {})}):
+            module.render(output, dpi=request.get("dpi", 300), size=size, theme=request.get("theme"))
+        self.renders += 1
+        return output.getvalue()
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                self.last_request = time.monotonic()
+                start = time.perf_counter()
+                data = b""
+                try:
+                    request = json.loads(line)
+                    if not secrets.compare_digest(str(request.get("token", "")), self.token):
+                        raise PermissionError("Bad token")
+                    command = request.get("command", "render")
+                    if command == "render":
+                        data = self.render(request)
+                    elif command == "shutdown":
+                        self.server.close()
+                    elif command != "ping":
+                        raise ValueError(f"Unknown command: {command}")
+                    header = {"ok": True, "bytes": len(data), "renders": self.renders,
+                              "seconds": round(time.perf_counter() - start, 4)}
+                except Exception as e:
+                    header = {"ok": False, "bytes": 0, "error": f"{type(e).__name__}: {e}"}
+                writer.write(json.dumps(header).encode("utf-8") + b"\n" + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def watch_idle(self):
+        while self.server.is_serving():
+            await asyncio.sleep(min(self.idle_timeout, 30))
+            if time.monotonic() - self.last_request > self.idle_timeout:
+                self.server.close()
+
+    async def serve(self, host="127.0.0.1", port=0):
+        self.server = await asyncio.start_server(self.handle_connection, host, port)
+        port = self.server.sockets[0].getsockname()[1]
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_file.with_suffix(f".tmp{os.getpid()}")
+        # The token keeps other local users from driving the daemon
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump({"host": host, "port": port, "pid": os.getpid(), "token": self.token}, f)
+        os.replace(tmp_path, self.state_file)
+        print(f"🎨 Render daemon ready on {host}:{port} (pid {os.getpid()})", flush=True)
+
+        idle = asyncio.ensure_future(self.watch_idle())
+        try:
+            await self.server.wait_closed()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            idle.cancel()
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    if json.load(f).get("pid") == os.getpid():
+                        self.state_file.unlink()
+            except (OSError, ValueError):
+                pass
+
+
+class RenderClient:
+    """Synchronous client; one connection is reused for every request"""
+
+    def __init__(self, state_file=STATE_FILE, timeout=120):
+        with open(state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        self.token = state["token"]
+        self.sock = socket.create_connection((state["host"], state["port"]), timeout=timeout)
+        self.stream = self.sock.makefile("rb")
+
+    def request(self, command, **params):
+        """(header, data) of one request"""
+        message = dict(params, command=command, token=self.token)
+        self.sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+        line = self.stream.readline()
+        if not line:
+            raise ConnectionError("Render daemon closed the connection")
+        header = json.loads(line)
+        data = self.stream.read(header["bytes"]) if header["bytes"] else b""
+        if not header["ok"]:
+            raise RuntimeError(header["error"])
+        return header, data
+
+    def render(self, name, dpi=300, size=None, theme=None, fmt="png"):
+        """Image bytes of one diagram"""
+        _, data = self.request("render", diagram=name, fmt=fmt, dpi=dpi,
+                               size=list(size) if size else None, theme=theme)
+        return data
+
+    def render_to_file(self, name, output, dpi=300, size=None, theme=None, fmt="png"):
+        """Same signature as a diagram module's render(), plus the diagram name"""
+        Path(output).write_bytes(self.render(name, dpi=dpi, size=size, theme=theme, fmt=fmt))
+
+    def ping(self):
+        return self.request("ping")[0]
+
+    def shutdown(self):
+        self.request("shutdown")
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+def connect(state_file=STATE_FILE):
+    """RenderClient for a running daemon, or None"""
+    try:
+        client = RenderClient(state_file)
+    except (OSError, ValueError, KeyError):
+        return None
+    try:
+        client.ping()
+    except (OSError, ValueError, KeyError, RuntimeError):
+        # A stale state file, or a port now taken by something else: don't leak the socket
+        client.close()
+        return None
+    return client
+
+
+def ensure_daemon(state_file=STATE_FILE, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """RenderClient for the running daemon, starting one in the background if needed"""
+    client = connect(state_file)
+    if client:
+        return client
+    log_path = Path(state_file).with_suffix(".log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, 'ab') as log:
+        options = {"start_new_session": True} if os.name == "posix" else \
+            {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+        subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "serve",
+                          "--state-file", str(state_file), "--idle-timeout", str(idle_timeout)],
+                         stdin=subprocess.DEVNULL, stdout=log, stderr=log, cwd=REPO_ROOT, **options)
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.1)
+        client = connect(state_file)
+        if client:
+            return client
+    raise RuntimeError(f"Render daemon did not start; see {log_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-warmed matplotlib process that renders the TLM diagrams")
+    parser.add_argument("command", choices=["start", "serve", "stop", "status", "render"],
+                        help="start in the background, serve in the foreground, stop, status, or render diagrams")
+    parser.add_argument("diagrams", nargs="*", help="diagrams for the render command (default: all)")
+    parser.add_argument("--state-file", default=str(STATE_FILE), help="where the daemon publishes its port")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="seconds without requests before the daemon exits")
+    parser.add_argument("--format", choices=FORMATS, default="png", help="output format for render")
+    parser.add_argument("--dpi", type=int, default=300, help="output resolution for render")
+    parser.add_argument("--output-dir", default=str(REPO_ROOT / "visualizations"), help="where render writes")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        daemon = RenderDaemon(args.state_file, args.idle_timeout)
+        start = time.perf_counter()
+        daemon.warm_up()
+        print(f"🔥 Warmed up in {time.perf_counter() - start:.2f}s", flush=True)
+        asyncio.run(daemon.serve())
+        return 0
+
+    if args.command == "start":
+        start = time.perf_counter()
+        client = ensure_daemon(args.state_file, args.idle_timeout)
+        client.close()
+        print(f"✅ Render daemon running ({time.perf_counter() - start:.2f}s)")
+        return 0
+
+    client = connect(args.state_file)
+    if args.command == "status":
+        if client is None:
+            print("⏹️  Render daemon not running")
+            return 1
+        print(f"✅ Render daemon running, {client.ping()['renders']} renders served")
+    elif args.command == "stop":
+        if client is None:
+            print("⏹️  Render daemon not running")
+            return 0
+        client.shutdown()
+        print("⏹️  Render daemon stopped")
+    else:
+        client = client or ensure_daemon(args.state_file, args.idle_timeout)
+        unknown = set(args.diagrams) - set(DIAGRAMS)
+        if unknown:
+            raise SystemExit(f"Unknown diagrams: {', '.join(sorted(unknown))}")
+        for name in args.diagrams or DIAGRAMS:
+            start = time.perf_counter()
+            output = Path(args.output_dir) / f"{name}.{args.format}"
+            client.render_to_file(name, output, dpi=args.dpi, fmt=args.format)
+            print(f"🖼️  {name:<30} {time.perf_counter() - start:6.2f}s  -> {output}")
+    if client:
+        client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
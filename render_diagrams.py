@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Parallel Diagram Renderer
+Renders every visualizations/*.py diagram in a process pool with the Agg backend
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from figure_cache import FORMAT_RC, FigureCache
+from visualizations import DIAGRAMS
+
+
+def init_worker():
+    """Pin every worker to the non-interactive backend before pyplot loads"""
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_one(name, output_dir, dpi=300, size=None, theme=None, use_cache=True, fmt="png", renderer=None):
+    """Render one diagram and return (name, output, seconds, cached)
+
+    renderer -- optional stand-in for importing and running the diagram here,
+                e.g. render_daemon.RenderClient.render_to_file
+    """
+    start = time.perf_counter()
+    output = Path(output_dir) / f"{name}.{fmt}"
+    if use_cache:
+        cache = FigureCache(renderer=renderer)
+        cache.get_figure(name, output, dpi=dpi, size=size, theme=theme, fmt=fmt)
+        cached = cache.hits > 0
+    elif renderer:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        renderer(name, output, dpi=dpi, size=size, theme=theme, fmt=fmt)
+        cached = False
+    else:
+        import matplotlib
+
+        module = importlib.import_module(f"visualizations.{name}")
+        with matplotlib.rc_context(FORMAT_RC.get(fmt, {})):
+            module.render(str(output), dpi=dpi, size=size, theme=theme)
+        cached = False
+    return name, str(output), time.perf_counter() - start, cached
+
+
+def render_all(names=None, output_dir=REPO_ROOT / "visualizations", workers=None,
+               dpi=300, size=None, theme=None, use_cache=True, fmt="png", daemon=False):
+    """Render the given diagrams (default: all) in parallel; returns {name: seconds}
+
+    daemon=True sends them to the pre-warmed render_daemon.py instead (starting
+    it if needed), which skips matplotlib's start-up cost in every process.
+    """
+    names = list(names or DIAGRAMS)
+    unknown = set(names) - set(DIAGRAMS)
+    if unknown:
+        raise ValueError(f"Unknown diagrams: {', '.join(sorted(unknown))}")
+    workers = workers or min(len(names), os.cpu_count() or 1)
+    options = dict(dpi=dpi, size=size, theme=theme, use_cache=use_cache, fmt=fmt)
+
+    def report(name, output, seconds, cached):
+        timings[name] = seconds
+        status = "cached" if cached else "rendered"
+        print(f"🖼️  {name:<30} {seconds:6.2f}s  {status:<8} -> {output}")
+
+    timings = {}
+    if daemon:
+        from render_daemon import ensure_daemon
+
+        client = ensure_daemon()
+        try:
+            for name in names:
+                report(*render_one(name, output_dir, renderer=client.render_to_file, **options))
+        finally:
+            client.close()
+        return timings
+
+    if workers <= 1:
+        init_worker()
+        for name in names:
+            report(*render_one(name, output_dir, **options))
+        return timings
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        futures = [executor.submit(render_one, name, output_dir, **options) for name in names]
+        for future in as_completed(futures):
+            report(*future.result())
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render the TLM diagrams in parallel")
+    parser.add_argument("diagrams", nargs="*", help=f"diagrams to render (default: all of {', '.join(DIAGRAMS)})")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per diagram, up to CPU count)")
+    parser.add_argument("--output-dir", default=str(REPO_ROOT / "visualizations"), help="where to write the images")
+    parser.add_argument("--dpi", type=int, default=300, help="output resolution")
+    parser.add_argument("--size", type=float, nargs=2, metavar=("WIDTH", "HEIGHT"),
+                        help="figure size in inches (default: each diagram's own size)")
+    parser.add_argument("--theme", default=None, help="matplotlib style to draw with, e.g. seaborn-v0_8-whitegrid")
+    parser.add_argument("--format", choices=["png", "svg"], default="png",
+                        help="svg keeps labels as text (the flowcharts are a fraction of the PNG size)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="render in the long-lived render_daemon.py process (started on first use)")
+    parser.add_argument("--no-cache", action="store_true", help="always re-render instead of reusing cached figures")
+    args = parser.parse_args()
+
+    print("🎨 DIABETES TLM DIAGRAM RENDERER")
+    print("=" * 50)
+    start = time.perf_counter()
+    timings = render_all(args.diagrams, args.output_dir, args.workers, dpi=args.dpi,
+                         size=tuple(args.size) if args.size else None, theme=args.theme,
+                         use_cache=not args.no_cache, fmt=args.format,
+                         daemon=args.daemon)
+    wall = time.perf_counter() - start
+    print("=" * 50)
+    print(f"⏱️  Wall time: {wall:.2f}s  (slowest figure {max(timings.values()):.2f}s, "
+          f"sum of figures {sum(timings.values()):.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
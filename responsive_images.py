@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Responsive Images
+Resamples each rendered diagram to several widths for srcset/sizes markup
+"""
+import re
+from collections import namedtuple
+from pathlib import Path
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow is only needed when responsive images are built
+    Image = None
+    features = None
+
+from html_image_rewriter import image_tag
+from image_optimizer import EMBED_FORMATS, SAVE_OPTIONS, OptimizedImage
+
+RESPONSIVE_DIR_NAME = "responsive"
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parent / "visualizations" / RESPONSIVE_DIR_NAME
+
+DEFAULT_WIDTHS = (480, 960, 1440, 1920, 2640)
+# PNG copy used as the plain src, for browsers without srcset or the modern format
+FALLBACK_WIDTH = 1440
+FORMAT_PREFERENCE = ("webp", "png")
+
+# Diagrams fill the content column: .container is at most 1400px wide and
+# .content has 40px padding on each side
+CONTAINER_WIDTH = 1400
+CONTENT_PADDING = 80
+SIZES = f"(max-width: {CONTAINER_WIDTH}px) calc(100vw - {CONTENT_PADDING}px), {CONTAINER_WIDTH - CONTENT_PADDING}px"
+
+# CSS viewport width and device pixel ratio of the screens the TLM is shown on
+ViewportClass = namedtuple('ViewportClass', ['name', 'width', 'dpr'])
+VIEWPORT_CLASSES = [
+    ViewportClass("phone", 390, 3),
+    ViewportClass("tablet", 820, 2),
+    ViewportClass("laptop", 1366, 1),
+    ViewportClass("retina laptop", 1440, 2),
+    ViewportClass("projector", 1920, 1),
+]
+
+# One resampled copy, e.g. "epidemiology_chart-960w.webp"; AVIF copies from older
+# builds still parse, so build() can clean them up
+Variant = namedtuple('Variant', ['name', 'width', 'fmt'])
+VARIANT_NAME = re.compile(r'^(?P<stem>.+)-(?P<width>\d+)w\.(?P<fmt>png|webp|avif)$')
+
+
+def variant_name(image_name, width, fmt):
+    return f"{Path(image_name).stem}-{width}w.{fmt}"
+
+
+def parse_variant_name(name):
+    """(diagram name, Variant) for a resampled copy's name, or None"""
+    match = VARIANT_NAME.match(name)
+    if not match:
+        return None
+    return f"{match.group('stem')}.png", Variant(name, int(match.group('width')), match.group('fmt'))
+
+
+def group_variants(names):
+    """{diagram name: [Variant, ...] by width} for the resampled copies among names"""
+    grouped = {}
+    for name in names:
+        parsed = parse_variant_name(name)
+        if parsed:
+            grouped.setdefault(parsed[0], []).append(parsed[1])
+    for variants in grouped.values():
+        variants.sort(key=lambda variant: (variant.width, variant.fmt))
+    return grouped
+
+
+def slot_pixels(viewport):
+    """Device pixels across the content column on a viewport class"""
+    return (min(viewport.width, CONTAINER_WIDTH) - CONTENT_PADDING) * viewport.dpr
+
+
+def srcset_candidates(variants):
+    """The variants listed in srcset: every width in the preferred format"""
+    formats = {variant.fmt for variant in variants}
+    for fmt in FORMAT_PREFERENCE:
+        if fmt in formats:
+            return [variant for variant in variants if variant.fmt == fmt]
+    return []
+
+
+def pick_variant(candidates, pixels):
+    """The candidate a browser downloads: the narrowest one at least pixels wide"""
+    for candidate in sorted(candidates, key=lambda variant: variant.width):
+        if candidate.width >= pixels:
+            return candidate
+    return max(candidates, key=lambda variant: variant.width)
+
+
+def fallback_variant(variants):
+    """Widest PNG copy no wider than FALLBACK_WIDTH (else the narrowest PNG), or None"""
+    pngs = [variant for variant in variants if variant.fmt == "png"]
+    if not pngs:
+        return None
+    fitting = [variant for variant in pngs if variant.width <= FALLBACK_WIDTH]
+    if fitting:
+        return max(fitting, key=lambda variant: variant.width)
+    return min(pngs, key=lambda variant: variant.width)
+
+
+def responsive_image_tag(slot, urls, src):
+    """Whole-tag markup for an HtmlImageRewriter(whole_tags=True) slot.
+
+    urls maps variant names to their URLs; src is the img src when there is
+    no PNG fallback among them. PNG candidates go straight into the img's
+    srcset; WebP ones into a <picture><source>, with the PNG img behind it.
+    """
+    variants = group_variants(urls).get(slot.name, [])
+    candidates = srcset_candidates(variants)
+    if not candidates:
+        return image_tag(slot, {"src": src})
+    fallback = fallback_variant(variants)
+    if fallback:
+        src = urls[fallback.name]
+    srcset = {"srcset": ", ".join(f"{urls[variant.name]} {variant.width}w" for variant in candidates),
+              "sizes": SIZES}
+    fmt = candidates[0].fmt
+    if fmt == "png":
+        return image_tag(slot, {"src": src, **srcset})
+    return image_tag(slot, {"src": src}, [{"type": f"image/{fmt}", **srcset}])
+
+
+class ResponsiveImages:
+    def __init__(self, widths=DEFAULT_WIDTHS, fmt="webp", output_dir=DEFAULT_OUTPUT_DIR):
+        """
+        widths     -- pixel widths to resample to; widths beyond the source are skipped
+        fmt        -- encoding listed in srcset, out of EMBED_FORMATS; a PNG copy is always
+                      written as the fallback, and PNG is used when Pillow cannot write fmt
+        output_dir -- where the copies go; keep it inside a served folder for hosting
+        """
+        if Image is None:
+            raise ImportError("Responsive images need Pillow: pip install pillow")
+        if fmt not in EMBED_FORMATS:
+            raise ValueError(f"Unsupported image format: {fmt}")
+        self.widths = sorted(set(widths))
+        self.fmt = fmt if fmt == "png" or features.check(fmt) else "png"
+        self.output_dir = Path(output_dir)
+        # Filled by build(): diagram name -> source path, variant name -> path
+        self.sources = {}
+        self.variants = {}
+
+    def plan(self, image_name, source_width):
+        """Variant names to write for a diagram source_width pixels wide"""
+        widths = [width for width in self.widths if width < source_width] or [source_width]
+        names = [variant_name(image_name, width, self.fmt) for width in widths]
+        if self.fmt != "png":
+            fallback = max([width for width in widths if width <= FALLBACK_WIDTH] or widths[:1])
+            names.append(variant_name(image_name, fallback, "png"))
+        return names
+
+    def build(self, source):
+        """Write the resampled copies of one diagram; returns {variant name: path}.
+
+        Copies are rewritten only when the source is newer than them, and
+        copies for widths or formats no longer requested are removed.
+        """
+        source = Path(source)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        source_mtime = source.stat().st_mtime_ns
+
+        with Image.open(source) as image:
+            names = self.plan(source.name, image.width)
+            built = {}
+            for name in names:
+                _, variant = parse_variant_name(name)
+                target = self.output_dir / name
+                if not target.exists() or target.stat().st_mtime_ns < source_mtime:
+                    height = round(image.height * variant.width / image.width)
+                    resized = image.resize((variant.width, height), Image.LANCZOS, reducing_gap=3.0)
+                    tmp_path = target.with_name(f".{name}.tmp")
+                    resized.save(tmp_path, **SAVE_OPTIONS[variant.fmt])
+                    tmp_path.replace(target)
+                built[name] = target
+
+        for stale in self.output_dir.glob(f"{source.stem}-*w.*"):
+            if stale.name not in built and parse_variant_name(stale.name):
+                stale.unlink()
+        self.sources[source.name] = source
+        self.variants.update(built)
+        return built
+
+    def embed_variant(self, source):
+        """The copies worth embedding, as an OptimizedImage.
+
+        The alternative is the copy wide enough for the largest viewport
+        class; the fallback is the PNG from the srcset markup. In PNG mode
+        the wide copy is itself the fallback and there is no alternative.
+        """
+        built = self.build(source)
+        variants = [parse_variant_name(name)[1] for name in built]
+        candidates = srcset_candidates(variants)
+        pixels = max(slot_pixels(viewport) for viewport in VIEWPORT_CLASSES)
+        chosen = pick_variant(candidates, pixels)
+        if chosen.fmt == "png":
+            return OptimizedImage(built[chosen.name], {})
+        return OptimizedImage(built[fallback_variant(variants).name], {chosen.fmt: built[chosen.name]})
+
+    def transfer_report(self):
+        """Bytes each viewport class downloads for all diagrams, originals vs srcset"""
+        grouped = group_variants(self.variants)
+        rows = []
+        for viewport in VIEWPORT_CLASSES:
+            original = responsive = 0
+            for image_name, source in self.sources.items():
+                original_bytes = source.stat().st_size
+                candidates = srcset_candidates(grouped.get(image_name, []))
+                original += original_bytes
+                if candidates:
+                    chosen = pick_variant(candidates, slot_pixels(viewport))
+                    responsive += self.variants[chosen.name].stat().st_size
+                else:
+                    responsive += original_bytes
+            rows.append({
+                "viewport": viewport.name,
+                "pixels": slot_pixels(viewport),
+                "original_bytes": original,
+                "responsive_bytes": responsive,
+            })
+        return rows
+
+    def print_report(self):
+        """Per-viewport table of bytes transferred for the diagrams"""
+        if not self.sources:
+            return
+        print(f"{'Viewport':<16} {'Image px':>8} {'Original KB':>12} {'Responsive KB':>14} {'Saved':>7}")
+        for row in self.transfer_report():
+            saved = (row["original_bytes"] - row["responsive_bytes"]) / row["original_bytes"] * 100
+            print(f"{row['viewport']:<16} {row['pixels']:>8} {row['original_bytes'] / 1024:>12.0f} "
+                  f"{row['responsive_bytes'] / 1024:>14.0f} {saved:>6.0f}%")
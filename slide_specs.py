@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Slide Specs
+Declarative description of the TLM decks; deck_renderer.py compiles them to PPTX
+"""
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+# Slide layouts of the default python-pptx template
+TITLE_LAYOUT = 0
+TITLE_AND_CONTENT_LAYOUT = 1
+TITLE_ONLY_LAYOUT = 5
+BLANK_LAYOUT = 6
+
+# Colours used across the decks
+NAVY = (44, 62, 80)
+SLATE = (52, 73, 94)
+BLUE = (52, 152, 219)
+DARK_BLUE = (41, 128, 185)
+RED = (231, 76, 60)
+DARK_RED = (192, 57, 43)
+GREEN = (46, 204, 113)
+DARK_GREEN = (39, 174, 96)
+PURPLE = (155, 89, 182)
+DARK_PURPLE = (142, 68, 173)
+AMBER = (243, 156, 18)
+ORANGE = (230, 126, 34)
+DARK_ORANGE = (255, 140, 0)
+GREY = (127, 140, 141)
+LIGHT_GREY = (236, 240, 241)
+WHITE = (255, 255, 255)
+TABLE_BAND = (248, 249, 250)
+
+
+@dataclass(frozen=True)
+class Font:
+    """Character formatting; None leaves the attribute to the template"""
+    size: Optional[float] = None  # points
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    color: Optional[Tuple[int, int, int]] = None
+    name: Optional[str] = None
+
+
+@dataclass
+class Paragraph:
+    text: str
+    font: Optional[Font] = None
+    level: int = 0
+
+
+@dataclass
+class TextBox:
+    box: tuple  # (left, top, width, height) in inches
+    paragraphs: list  # Paragraph or plain str
+
+
+@dataclass
+class Placeholder:
+    """Text for a placeholder of the slide layout (0 is the title)"""
+    idx: int
+    paragraphs: list
+    box: Optional[tuple] = None  # moves the placeholder off its layout position
+
+
+@dataclass
+class Picture:
+    path: str  # relative to the repo root
+    box: tuple
+    fallback: list = field(default_factory=list)  # TextBoxes drawn instead when the image is missing
+
+
+@dataclass
+class Chart:
+    """Native charts drawn by a builder registered in deck_renderer.CHART_BUILDERS"""
+    builder: str
+    box: tuple
+
+
+@dataclass
+class Table:
+    box: tuple
+    headers: list
+    rows: list
+    header_fill: tuple = BLUE
+    header_font: Font = Font(bold=True, color=WHITE)
+    band_fill: Optional[tuple] = TABLE_BAND  # fill of every second data row
+
+
+@dataclass(frozen=True)
+class Theme:
+    """Styles written once into the slide master and layouts instead of onto every paragraph
+
+    Text only carries the attributes that differ from these; the rendered decks look the same
+    whatever the theme, it just decides which formatting is shared.
+    """
+    title: Font = Font(32, bold=True, color=NAVY)  # title placeholder of TITLE_ONLY_LAYOUT
+    title_box: tuple = (0.5, 0.3, 9, 0.8)
+    body: Font = Font()  # text boxes and table cells
+
+
+@dataclass
+class Slide:
+    shapes: list
+    layout: int = TITLE_ONLY_LAYOUT
+    name: str = ""
+    background: Optional[Tuple[tuple, tuple]] = None  # gradient stops, top to bottom
+
+
+@dataclass
+class Deck:
+    output: str  # file name, written next to the scripts
+    slides: list = field(default_factory=list)
+    width: float = 13.33  # inches, 16:9
+    height: float = 7.5
+    theme: Theme = Theme()
+
+
+def title(text, size=32, top=0.3, color=NAVY):
+    """Slide heading in the top-left title placeholder of TITLE_ONLY_LAYOUT"""
+    return Placeholder(0, [Paragraph(text, Font(size, bold=True, color=color))], box=(0.5, top, 9, 0.8))
+
+
+def note(box, text, font=None):
+    """Single-paragraph text box"""
+    return TextBox(box, [Paragraph(text, font)])
+
+
+def section(box, heading, heading_font, items, item_font=None):
+    """Text box with a heading paragraph followed by items in one font"""
+    return TextBox(box, [Paragraph(heading, heading_font)] + [Paragraph(item, item_font) for item in items])
+
+
+def title_slide(name, heading, heading_font, subtitle, subtitle_font=None, shapes=(), background=None):
+    """Title-layout slide; subtitle lines after the first keep the template style"""
+    subtitle_lines = subtitle.split("\n")
+    return Slide([
+        Placeholder(0, [Paragraph(heading, heading_font)]),
+        Placeholder(1, [Paragraph(subtitle_lines[0], subtitle_font)] + subtitle_lines[1:]),
+        *shapes,
+    ], layout=TITLE_LAYOUT, name=name, background=background)
@@ -3,16 +3,14 @@
 Script to embed PNG images as base64 data URIs in HTML
 """
 
-import base64
 import os
 
-def png_to_data_uri(png_path):
+from data_uri_cache import DataUriCache
+
+def png_to_data_uri(png_path, uri_cache):
     """Convert PNG file to base64 data URI"""
     try:
-        with open(png_path, 'rb') as file:
-            png_data = file.read()
-            b64_data = base64.b64encode(png_data).decode('utf-8')
-            return f'data:image/png;base64,{b64_data}'
+        return uri_cache.get_data_uri(png_path, 'image/png')
     except Exception as e:
         print(f"Error converting {png_path}: {e}")
         return None
@@ -20,6 +18,9 @@ def png_to_data_uri(png_path):
 def main():
     print("=== Converting PNG Images to Base64 Data URIs ===")
 
+    # Shares its on-disk cache with auto_embed_images.ImageEmbedder
+    uri_cache = DataUriCache()
+
     # List of PNG files to convert
     png_files = [
         'visualizations/pathophysiology_diagram.png',
@@ -37,7 +38,7 @@ def main():
     for png_file in png_files:
         if os.path.exists(png_file):
             print(f"✅ Converting {png_file}...")
-            data_uri = png_to_data_uri(png_file)
+            data_uri = png_to_data_uri(png_file, uri_cache)
             if data_uri:
                 # Store with the HTML image path
                 html_path = f"../{png_file}"
@@ -46,8 +47,12 @@ def main():
         else:
             print(f"❌ File not found: {png_file}")
 
+    uri_cache.save()
+    stats = uri_cache.stats()
+
     # Generate JavaScript object for HTML
     print(f"\n🎯 Generated {len(embedded_images)} embedded images")
+    print(f"♻️  Cache: {stats['hits']} hits, {stats['misses']} misses")
 
     # Create a JavaScript file for use in HTML
     js_content = """// Embedded image data URIs for standalone HTML
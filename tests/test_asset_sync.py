@@ -0,0 +1,168 @@
+"""plan_uploads()/sync() against the directory stand-in, and uploads to asset_server.py"""
+import asyncio
+import http.client
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import asset_server
+from asset_server import HASH_LENGTH, AssetServer
+from asset_sync import DirectoryBackend, HttpBackend, plan_uploads, sync
+from google_drive_helper import MANIFEST_NAME
+
+
+def write_hashed(hashed_dir, name, data, digest):
+    """Put one hashed copy in hashed_dir and return its manifest entry"""
+    stem, suffix = name.rsplit(".", 1)
+    hashed_name = f"{stem}.{digest[:HASH_LENGTH]}.{suffix}"
+    (hashed_dir / hashed_name).write_bytes(data)
+    return {"file": hashed_name, "sha256": digest, "bytes": len(data)}
+
+
+@pytest.fixture
+def hashed_dir(tmp_path):
+    directory = tmp_path / "hashed"
+    directory.mkdir()
+    return directory
+
+
+def test_plan_uploads_lists_new_and_changed_images():
+    local = {"a.png": {"sha256": "1" * 64}, "b.png": {"sha256": "2" * 64}, "c.png": {"sha256": "3" * 64}}
+    remote = {"a.png": {"sha256": "1" * 64}, "b.png": {"sha256": "f" * 64}}
+    assert plan_uploads(local, remote) == ["b.png", "c.png"]
+    assert plan_uploads(local, local) == []
+
+
+def test_sync_uploads_only_what_changed(tmp_path, hashed_dir):
+    manifest = {
+        "a.png": write_hashed(hashed_dir, "a.png", b"first", "a" * 64),
+        "b.png": write_hashed(hashed_dir, "b.png", b"second", "b" * 64),
+    }
+    backend = DirectoryBackend(tmp_path / "host", base_url="http://host/images")
+    mapping_file = tmp_path / "asset-urls.json"
+
+    result = sync(manifest, hashed_dir, backend, workers=2, mapping_file=mapping_file)
+    assert sorted(result.uploaded) == ["a.png", "b.png"]
+    assert result.failed == [] and result.unchanged == []
+    assert (tmp_path / "host" / manifest["a.png"]["file"]).read_bytes() == b"first"
+    assert backend.fetch_manifest() == manifest
+    assert json.loads(mapping_file.read_text(encoding="utf-8")) == {
+        name: f"http://host/images/{entry['file']}" for name, entry in manifest.items()
+    }
+
+    # Nothing changed: no uploads, the remote manifest is left alone
+    manifest_mtime = (tmp_path / "host" / MANIFEST_NAME).stat().st_mtime_ns
+    result = sync(manifest, hashed_dir, backend)
+    assert result.uploaded == [] and sorted(result.unchanged) == ["a.png", "b.png"]
+    assert (tmp_path / "host" / MANIFEST_NAME).stat().st_mtime_ns == manifest_mtime
+
+    # One image changed: only its new hashed copy goes up
+    manifest["b.png"] = write_hashed(hashed_dir, "b.png", b"second, edited", "c" * 64)
+    result = sync(manifest, hashed_dir, backend)
+    assert result.uploaded == ["b.png"] and result.unchanged == ["a.png"]
+    assert backend.fetch_manifest()["b.png"]["file"] == manifest["b.png"]["file"]
+    assert result.urls["b.png"] == f"http://host/images/{manifest['b.png']['file']}"
+
+
+@pytest.fixture
+def upload_server(tmp_path):
+    """asset_server.py accepting uploads into <tmp_path>/hosted, on a free loopback port"""
+    (tmp_path / "hosted").mkdir()
+    server = AssetServer(root=tmp_path, dirs=("hosted",), upload_dir="hosted", upload_token="secret",
+                         max_upload_bytes=1024)
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(asyncio.start_server(server.handle_connection, "127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield tmp_path / "hosted", listener.sockets[0].getsockname()[1]
+
+    async def shutdown():
+        listener.close()
+        handlers = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in handlers:
+            task.cancel()
+        await asyncio.gather(*handlers, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def put(port, name, data, token=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    connection.request("PUT", f"/hosted/{name}", body=data, headers=headers)
+    status = connection.getresponse().status
+    connection.close()
+    return status
+
+
+def test_upload_needs_token_and_respects_size_cap(upload_server):
+    hosted, port = upload_server
+    assert put(port, "a.png", b"data") == 401
+    assert put(port, "a.png", b"data", token="wrong") == 401
+    assert put(port, "a.png", b"x" * 2048, token="secret") == 413
+    assert not (hosted / "a.png").exists()
+    assert put(port, "a.png", b"data", token="secret") == 201
+    assert (hosted / "a.png").read_bytes() == b"data"
+
+
+def test_sync_over_http_backend(upload_server, hashed_dir):
+    hosted, port = upload_server
+    manifest = {"a.png": write_hashed(hashed_dir, "a.png", b"first", "a" * 64)}
+    backend = HttpBackend(f"http://127.0.0.1:{port}/hosted", token="secret")
+    try:
+        result = sync(manifest, hashed_dir, backend)
+    finally:
+        backend.close()
+    assert result.uploaded == ["a.png"] and result.failed == []
+    assert (hosted / manifest["a.png"]["file"]).read_bytes() == b"first"
+
+
+def test_http_backend_retries_once_when_the_server_dropped_an_idle_connection(upload_server, monkeypatch):
+    hosted, port = upload_server
+    monkeypatch.setattr(asset_server, "IDLE_TIMEOUT", 0.1)
+    backend = HttpBackend(f"http://127.0.0.1:{port}/hosted", token="secret")
+    try:
+        assert backend.fetch_manifest() == {}
+        time.sleep(0.3)  # the server closes the pooled connection meanwhile
+        backend.upload_bytes(b"data", "a.png")
+        assert backend.connections_opened == 2
+    finally:
+        backend.close()
+    assert (hosted / "a.png").read_bytes() == b"data"
+
+    # A fresh connection that fails is not retried
+    def dropped(connection):
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+    backend = HttpBackend(f"http://127.0.0.1:{port}/hosted", token="secret")
+    monkeypatch.setattr(http.client.HTTPConnection, "getresponse", dropped)
+    with pytest.raises(http.client.RemoteDisconnected):
+        backend.fetch_manifest()
+    assert backend.connections_opened == 1
+
+
+def test_only_manifest_style_hashed_names_are_immutable(upload_server):
+    hosted, port = upload_server
+    hashed = write_hashed(hosted, "a.png", b"first", "a" * 64)["file"]
+    (hosted / "report.20241017.png").write_bytes(b"dated, not hashed")
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        cache_control = {}
+        for name in (hashed, "report.20241017.png"):
+            connection.request("GET", f"/hosted/{name}")
+            response = connection.getresponse()
+            response.read()
+            cache_control[name] = response.getheader("Cache-Control")
+    finally:
+        connection.close()
+    assert "immutable" in cache_control[hashed]
+    assert cache_control["report.20241017.png"] == "no-cache"
@@ -0,0 +1,83 @@
+"""ImageEmbedder: stream mode pulls payloads through the bounded pipeline"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from auto_embed_images import ImageEmbedder
+
+PAGE = """<html><head><style>.hero { background-image: url("../vis/b.png"); }</style></head><body>
+<section id="overview" class="section active"><img src="../vis/a.png"><img src="../vis/b.png"></section>
+<section id="details" class="section"><img src="../vis/c.png"><img src="../vis/a.png"></section>
+</body></html>"""
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / "vis").mkdir()
+    (tmp_path / "html").mkdir()
+    for name in ("a.png", "b.png", "c.png"):
+        (tmp_path / "vis" / name).write_bytes(name.encode() * 50)
+    (tmp_path / "html" / "page.html").write_text(PAGE, encoding="utf-8")
+    return tmp_path
+
+
+def embed(site, output, mode="stream", lazy=False, **options):
+    embedder = ImageEmbedder(site / "vis", site / "html" / "page.html", disk_cache=False, **options)
+    embedder.create_embedded_html(site / "html" / output, mode=mode, lazy=lazy)
+    return (site / "html" / output).read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_bounded_stream_matches_other_modes(site, lazy):
+    bounded = embed(site, "bounded.html", lazy=lazy, workers=2, max_in_flight=1)
+    assert bounded == embed(site, "chunked.html", mode="chunked", lazy=lazy)
+    if not lazy:
+        assert bounded == embed(site, "regex.html", mode="regex")
+    assert "vis/" not in bounded
+
+
+def test_stream_pulls_payloads_in_document_order(site, monkeypatch):
+    requested = []
+    original = ImageEmbedder.iter_image_data_uris
+
+    def recording(self, names=None):
+        requested.append(names)
+        return original(self, names)
+
+    monkeypatch.setattr(ImageEmbedder, "iter_image_data_uris", recording)
+    embed(site, "lazy.html", lazy=True, max_in_flight=1)
+    # Stylesheet, then the visible tab, then the deferred payloads written before </body>
+    assert requested == [["b.png", "a.png", "c.png"]]
+
+
+def test_failed_image_keeps_a_link_to_the_file(site, monkeypatch):
+    encode = ImageEmbedder.encode_image_to_base64
+
+    def failing(self, image_path):
+        return None if Path(image_path).name == "b.png" else encode(self, image_path)
+
+    monkeypatch.setattr(ImageEmbedder, "encode_image_to_base64", failing)
+    html = embed(site, "page_embedded.html")
+    assert html.count('src="data:image/png;base64,') == 3
+    assert 'src="../vis/b.png"' in html and 'url("../vis/b.png")' in html
+
+
+def test_webp_alternatives_are_embedded_behind_a_png_fallback(site):
+    Image = pytest.importorskip("PIL.Image")
+    from image_optimizer import ImageOptimizer
+    for name in ("a.png", "b.png", "c.png"):
+        Image.effect_mandelbrot((400, 300), (-2, -1.2, 1, 1.2), 60).convert("RGB").save(site / "vis" / name)
+    optimizer = ImageOptimizer(formats=("webp",), output_dir=site / "optimized")
+
+    html = embed(site, "page_embedded.html", optimizer=optimizer)
+    assert html.count('<picture><source type="image/webp" srcset="data:image/webp;base64,') == 4
+    assert html.count('"><img src="data:image/png;base64,') == 4
+    assert 'url("data:image/png;base64,' in html
+    assert all(row["format"] == "png+webp" for row in optimizer.report)
+
+    lazy = embed(site, "lazy.html", lazy=True, optimizer=optimizer)
+    assert '<picture><source type="image/webp" data-embed-ref="embedded-image-1">' in lazy
+    assert 'id="embedded-image-1">data:image/webp;base64,' in lazy
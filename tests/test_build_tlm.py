@@ -0,0 +1,93 @@
+"""BuildGraph: content fingerprints, no-op rebuilds and staleness propagation"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from build_tlm import BuildGraph, Target
+
+# Each command concatenates its inputs (sys.argv[2:]) into its output (sys.argv[1])
+CONCAT = "import sys; open(sys.argv[1], 'w').write(''.join(open(p).read() for p in sys.argv[2:]))"
+
+
+def concat_target(name, inputs, output):
+    return Target(name, inputs, [output], ["-c", CONCAT, output, *inputs], cwd="repo")
+
+
+@pytest.fixture
+def project(tmp_path):
+    """source.txt -> middle.txt -> final.txt (plus extra.txt), and an unrelated side.txt"""
+    for name in ("source.txt", "extra.txt", "other.txt"):
+        (tmp_path / name).write_text(name, encoding="utf-8")
+    paths = {name: str(tmp_path / name) for name in
+             ("source.txt", "extra.txt", "other.txt", "middle.txt", "final.txt", "side.txt")}
+    targets = [
+        concat_target("middle", [paths["source.txt"]], paths["middle.txt"]),
+        concat_target("final", [paths["middle.txt"], paths["extra.txt"]], paths["final.txt"]),
+        concat_target("side", [paths["other.txt"]], paths["side.txt"]),
+    ]
+    return tmp_path, paths, targets
+
+
+def graph(project):
+    tmp_path, _, targets = project
+    return BuildGraph(targets, state_file=tmp_path / "state.json")
+
+
+def touch_later(path):
+    """Bump mtime so the change is seen even on coarse-grained filesystems"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def test_second_build_is_a_no_op(project):
+    assert graph(project).build() == (["middle", "final", "side"], [], [])
+    assert graph(project).build() == ([], ["middle", "final", "side"], [])
+    assert graph(project).build(dry_run=True) == ([], ["middle", "final", "side"], [])
+
+
+def test_changing_one_input_rebuilds_only_what_depends_on_it(project):
+    _, paths, _ = project
+    graph(project).build()
+    Path(paths["source.txt"]).write_text("changed source", encoding="utf-8")
+    touch_later(paths["source.txt"])
+
+    # The dry run cannot see middle.txt change, but still reports final as stale
+    assert graph(project).build(dry_run=True) == (["middle", "final"], ["side"], [])
+    assert graph(project).build() == (["middle", "final"], ["side"], [])
+    assert Path(paths["final.txt"]).read_text(encoding="utf-8") == "changed sourceextra.txt"
+    assert graph(project).build() == ([], ["middle", "final", "side"], [])
+
+
+def test_dry_run_propagates_only_below_the_changed_target(project):
+    _, paths, _ = project
+    graph(project).build()
+    Path(paths["extra.txt"]).write_text("changed extra", encoding="utf-8")
+    touch_later(paths["extra.txt"])
+    assert graph(project).build(dry_run=True) == (["final"], ["middle", "side"], [])
+
+
+def test_fingerprint_is_reused_until_mtime_or_size_changes(project):
+    _, paths, _ = project
+    build = graph(project)
+    digest = build.fingerprint(paths["source.txt"])
+    assert digest is not None
+    assert build.fingerprint(str(Path(paths["source.txt"]).parent / "missing.txt")) is None
+
+    # A matching mtime and size means the stored digest is trusted without reading
+    build.state["files"][paths["source.txt"]]["digest"] = "stored"
+    assert build.fingerprint(paths["source.txt"]) == "stored"
+
+    Path(paths["source.txt"]).write_text("different length", encoding="utf-8")
+    touch_later(paths["source.txt"])
+    assert build.fingerprint(paths["source.txt"]) not in ("stored", digest)
+
+
+def test_a_deleted_output_is_rebuilt(project):
+    _, paths, _ = project
+    graph(project).build()
+    os.remove(paths["side.txt"])
+    assert graph(project).build() == (["side"], ["middle", "final"], [])
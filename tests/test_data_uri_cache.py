@@ -0,0 +1,102 @@
+"""DataUriCache: LRU eviction, the persisted index and streamed misses"""
+import base64
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import data_uri_cache
+from data_uri_cache import DataUriCache
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Strictly increasing time.time(), so last_used never ties"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(data_uri_cache.time, "time", lambda: float(next(ticks)))
+
+
+def make_images(directory, count, size=300):
+    """count distinct files of size bytes; each encodes to size * 4 / 3 base64 characters"""
+    paths = []
+    for index in range(count):
+        path = directory / f"image{index}.png"
+        path.write_bytes(bytes([index]) * size)
+        paths.append(path)
+    return paths
+
+
+def test_evicts_least_recently_used_first(tmp_path):
+    a, b, c = make_images(tmp_path, 3)
+    cache = DataUriCache(tmp_path / "cache", max_bytes=2 * 400)
+    cache.get_data_uri(a)
+    cache.get_data_uri(b)
+    cache.get_data_uri(a)  # hit: a is now more recent than b
+    cache.get_data_uri(c)  # over budget: b goes
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.lookup(a) is not None and cache.lookup(c) is not None
+    assert cache.lookup(b) is None
+    assert sorted(path.stem for path in (tmp_path / "cache").glob("*.b64")) == sorted(cache.entries)
+
+
+def test_payload_larger_than_the_cache_is_not_kept(tmp_path):
+    (big,) = make_images(tmp_path, 1, size=3000)
+    cache = DataUriCache(tmp_path / "cache", max_bytes=1000)
+    data_uri = cache.get_data_uri(big, "image/png")
+    assert data_uri == "data:image/png;base64," + base64.b64encode(big.read_bytes()).decode("ascii")
+    assert cache.entries == {}
+
+
+def test_index_round_trips_through_save(tmp_path):
+    a, b = make_images(tmp_path, 2)
+    cache = DataUriCache(tmp_path / "cache")
+    expected = {path: cache.get_data_uri(path, "image/png") for path in (a, b)}
+    cache.save()
+
+    reloaded = DataUriCache(tmp_path / "cache")
+    assert reloaded.entries == cache.entries
+    for path, data_uri in expected.items():
+        assert reloaded.lookup(path, "image/png") == data_uri
+    assert reloaded.stats()["hits"] == 2 and reloaded.stats()["misses"] == 0
+
+    # A changed file is a miss, not a stale hit
+    a.write_bytes(b"changed")
+    assert reloaded.lookup(a) is None
+
+
+def test_reload_evicts_down_to_a_smaller_budget(tmp_path):
+    paths = make_images(tmp_path, 3)
+    cache = DataUriCache(tmp_path / "cache")
+    for path in paths:
+        cache.get_data_uri(path)
+    cache.save()
+
+    smaller = DataUriCache(tmp_path / "cache", max_bytes=400)
+    assert smaller.evictions == 2
+    assert smaller.lookup(paths[2]) is not None and smaller.lookup(paths[0]) is None
+
+
+def test_stream_base64_matches_and_tees_into_the_cache(tmp_path):
+    (image,) = make_images(tmp_path, 1, size=1000)
+    cache = DataUriCache(tmp_path / "cache")
+    out = []
+    cache.stream_base64(image, out.append, block_size=300)
+    assert "".join(out) == base64.b64encode(image.read_bytes()).decode("ascii")
+    assert cache.lookup(image, "image/png") == "data:image/png;base64," + "".join(out)
+
+
+def test_stream_base64_cleans_up_when_write_fails(tmp_path):
+    (image,) = make_images(tmp_path, 1, size=1000)
+    cache = DataUriCache(tmp_path / "cache")
+
+    def failing_write(block):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        cache.stream_base64(image, failing_write, block_size=300)
+    assert list((tmp_path / "cache").iterdir()) == []
+    assert cache.entries == {}
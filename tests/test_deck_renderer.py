@@ -0,0 +1,97 @@
+"""DeckRenderer: a small spec round-trips through a saved PPTX"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("pptx")
+
+from lxml import etree
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml.ns import qn
+
+from deck_renderer import DeckRenderer, load_deck
+from slide_specs import (
+    BLUE, GREY, NAVY, RED, WHITE, Deck, Font, Paragraph, Picture, Placeholder, Slide, Table, TextBox, Theme,
+    note, title, title_slide,
+)
+
+THEME = Theme(title=Font(30, bold=True, color=NAVY), body=Font(16, color=GREY))
+
+DECK = Deck("small.pptx", [
+    title_slide("cover", "Small Deck", Font(40, bold=True, color=WHITE), "Subtitle line\nSecond line",
+                background=(NAVY, BLUE)),
+    Slide([
+        title("Themed Title", 30, color=NAVY),
+        TextBox((0.5, 1.2, 6, 2), [
+            "Plain text keeps the template look",
+            Paragraph("Text in the theme font", Font(16, color=GREY)),
+            Paragraph("Red warning", Font(16, bold=True, color=RED)),
+        ]),
+    ]),
+    Slide([
+        title("Overridden Title", 30, color=RED),
+        Picture("visualizations/missing_diagram.png", (0.5, 1.2, 6, 4),
+                fallback=[note((0.5, 1.2, 6, 1), "Diagram not rendered yet")]),
+        Table((0.5, 3, 6, 1.5), ["Drug", "Dose"], [["Metformin", "500 mg"], ["Insulin", "10 U"]]),
+    ]),
+], theme=THEME)
+
+
+def slide_title(slide):
+    return slide.shapes.title.text_frame.text
+
+
+@pytest.fixture
+def rendered(tmp_path):
+    output_path, _ = DeckRenderer(root=tmp_path, optimizer=False).build(DECK, tmp_path)
+    return Presentation(str(output_path))
+
+
+def test_slide_count_and_titles(rendered):
+    assert len(rendered.slides) == 3
+    assert [slide_title(slide) for slide in rendered.slides] == ["Small Deck", "Themed Title", "Overridden Title"]
+    assert rendered.slides[0].placeholders[1].text_frame.text == "Subtitle line\nSecond line"
+
+
+def test_only_colours_that_differ_from_the_theme_are_written(rendered):
+    themed, overridden = rendered.slides[1], rendered.slides[2]
+    # The theme title colour lives in the layout, so a matching title carries none itself
+    assert themed.shapes.title.text_frame.paragraphs[0]._p.pPr is None
+    layout_title = rendered.slide_layouts[5].placeholders[0]._element
+    assert b'val="2C3E50"' in etree.tostring(layout_title)
+    assert overridden.shapes.title.text_frame.paragraphs[0].font.color.rgb == RGBColor(*RED)
+
+    # The body font goes into the default text style; text only overrides what differs
+    assert b'val="7F8C8D"' in etree.tostring(rendered.part._element.find(qn("p:defaultTextStyle")))
+    body = next(shape for shape in themed.shapes if shape.has_text_frame and shape != themed.shapes.title)
+    plain, in_theme, warning = body.text_frame.paragraphs
+    assert plain.font.color.rgb == RGBColor(0, 0, 0) and plain.font.size.pt == 18
+    assert in_theme._p.pPr is None
+    assert warning.font.color.rgb == RGBColor(*RED) and warning.font.bold
+
+
+def test_missing_pictures_fall_back_and_tables_are_filled(rendered):
+    slide = rendered.slides[2]
+    texts = [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+    assert "Diagram not rendered yet" in texts
+    assert not any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in slide.shapes)
+
+    table = next(shape for shape in slide.shapes if shape.has_table).table
+    assert [cell.text for cell in table.rows[0].cells] == ["Drug", "Dose"]
+    assert table.cell(0, 0).fill.fore_color.rgb == RGBColor(*BLUE)
+    assert table.cell(2, 1).text == "10 U"
+
+
+def test_real_spec_renders_every_slide_with_its_title():
+    deck = load_deck("npcdcs")
+    prs = DeckRenderer(optimizer=False).render(deck)
+    assert len(prs.slides) == len(deck.slides)
+    expected = [next(shape.paragraphs[0].text for shape in spec.shapes
+                     if isinstance(shape, Placeholder) and shape.idx == 0)
+                for spec in deck.slides]
+    assert [slide_title(slide) for slide in prs.slides] == expected
@@ -0,0 +1,131 @@
+"""HtmlImageRewriter: the single-pass tokenizer behind the embedder and the Drive rewrite"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from html_image_rewriter import HtmlImageRewriter, ImageSlot, image_tag
+
+PLACEHOLDER = ('<div style="margin-top: 10px; background: #f8f9fa; padding: 20px; border: 2px dashed #999;">'
+               '<div><h4>{label}</h4></div><p>Diagram goes here</p></div>')
+
+PAGE = f"""<html><head><style>.hero {{ background: url('visualizations/epidemiology_chart.png'); }}</style></head>
+<body>
+<section class="section active" id="overview">
+  <img src="visualizations/pathophysiology_diagram.png" alt="Patho">
+  <img src="https://example.org/logo.png" alt="Logo">
+</section>
+<section class="section" id="management">
+  {PLACEHOLDER.format(label="Treatment flow")}
+  <img src="treatment_algorithm.png">
+</section>
+<section class="section" id="extra">
+  {PLACEHOLDER.format(label="NPCDCS structure")}
+  {PLACEHOLDER.format(label="Something else")}
+</section>
+</body></html>"""
+
+IMAGES = ["pathophysiology_diagram.png", "epidemiology_chart.png", "treatment_algorithm.png",
+          "national_program_diagram.png"]
+
+
+def rewrite(rewriter, html):
+    out = []
+    slots = rewriter.rewrite(html, lambda slot: f"[{slot.kind}:{slot.name}]", out.append)
+    return "".join(out), slots
+
+
+def test_finds_every_kind_of_slot_in_document_order():
+    rewriter = HtmlImageRewriter(IMAGES)
+    slots = [span.slot for span in rewriter.find_slots(PAGE)]
+    assert slots == [
+        ImageSlot("epidemiology_chart.png", "url", None),
+        ImageSlot("pathophysiology_diagram.png", "src", "overview"),
+        ImageSlot("treatment_algorithm.png", "placeholder", "management"),
+        ImageSlot("treatment_algorithm.png", "src", "management"),
+        ImageSlot("national_program_diagram.png", "placeholder", "extra"),
+    ]
+    assert rewriter.active_sections == {"overview"}
+
+
+def test_spans_cover_the_uri_or_the_whole_placeholder():
+    spans = HtmlImageRewriter(IMAGES).find_slots(PAGE)
+    assert PAGE[spans[0].start:spans[0].end] == "visualizations/epidemiology_chart.png"
+    assert PAGE[spans[1].start:spans[1].end] == "visualizations/pathophysiology_diagram.png"
+    placeholder = PAGE[spans[2].start:spans[2].end]
+    assert placeholder == PLACEHOLDER.format(label="Treatment flow")
+
+
+def test_placeholders_become_images_keeping_their_margins():
+    html, _ = rewrite(HtmlImageRewriter(IMAGES), PAGE)
+    assert ('<div style="margin-top: 10px;"><img src="[placeholder:treatment_algorithm.png]" '
+            'alt="Treatment Algorithm" style="width: 100%; border-radius: 8px;"></div>') in html
+    assert "Treatment flow" not in html and "NPCDCS structure" not in html
+
+
+def test_unmatched_slots_are_left_untouched():
+    html, slots = rewrite(HtmlImageRewriter(IMAGES), PAGE)
+    # External images, unknown names and placeholders no diagram matches stay as they were
+    assert '<img src="https://example.org/logo.png" alt="Logo">' in html
+    assert PLACEHOLDER.format(label="Something else") in html
+    assert len(slots) == 5
+
+    html, slots = rewrite(HtmlImageRewriter([]), PAGE)
+    assert html == PAGE and slots == []
+
+
+def test_kinds_filter_reports_only_the_requested_slots():
+    rewriter = HtmlImageRewriter(IMAGES, kinds=("src", "placeholder"))
+    html, slots = rewrite(rewriter, PAGE)
+    assert {slot.kind for slot in slots} == {"src", "placeholder"}
+    assert "url('visualizations/epidemiology_chart.png')" in html
+
+    html, slots = rewrite(HtmlImageRewriter(IMAGES, kinds=("url",)), PAGE)
+    assert [slot.kind for slot in slots] == ["url"]
+    assert PLACEHOLDER.format(label="Treatment flow") in html
+
+
+def test_unknown_kind_is_rejected():
+    with pytest.raises(ValueError, match="srcset"):
+        HtmlImageRewriter(IMAGES, kinds=("srcset",))
+
+
+def test_whole_tag_slots_span_the_img_and_keep_its_other_attributes():
+    rewriter = HtmlImageRewriter(IMAGES, whole_tags=True)
+    spans = rewriter.find_slots(PAGE)
+    assert PAGE[spans[1].start:spans[1].end] == '<img src="visualizations/pathophysiology_diagram.png" alt="Patho">'
+    assert spans[1].slot.attrs == ' alt="Patho"'
+    assert spans[3].slot.attrs == ''
+    # CSS url() slots are still just the URI
+    assert PAGE[spans[0].start:spans[0].end] == "visualizations/epidemiology_chart.png"
+
+    html = '<p><img class="wide" src="a/treatment_algorithm.png" alt="T" /></p>'
+    (span,) = HtmlImageRewriter(IMAGES, whole_tags=True).find_slots(html)
+    assert span.slot.attrs == ' class="wide" alt="T"'
+
+
+def test_whole_tag_markup_wraps_alternatives_in_picture():
+    def resolve(slot):
+        if slot.kind == "url":
+            return "chart.png"
+        return image_tag(slot, {"src": f"{slot.name}.fallback"},
+                         [{"type": "image/webp", "srcset": f"{slot.name}.webp"}])
+
+    out = []
+    HtmlImageRewriter(IMAGES, whole_tags=True).rewrite(PAGE, resolve, out.append)
+    html = "".join(out)
+    assert ('<picture><source type="image/webp" srcset="pathophysiology_diagram.png.webp">'
+            '<img src="pathophysiology_diagram.png.fallback" alt="Patho"></picture>') in html
+    assert ('<div style="margin-top: 10px;"><picture>'
+            '<source type="image/webp" srcset="treatment_algorithm.png.webp">'
+            '<img src="treatment_algorithm.png.fallback" alt="Treatment Algorithm" '
+            'style="width: 100%; border-radius: 8px;"></picture></div>') in html
+    assert "url('chart.png')" in html
+
+
+def test_image_tag_streams_callable_values_without_picture():
+    slot = ImageSlot("epidemiology_chart.png", "src", None, ' alt="E"')
+    markup = image_tag(slot, {"src": lambda write: (write("data:"), write("abc"))})
+    assert markup == '<img src="data:abc" alt="E">'
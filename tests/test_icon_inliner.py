@@ -0,0 +1,60 @@
+"""IconInliner: a Font Awesome release that cannot be downloaded leaves the page as it was"""
+import functools
+import http.server
+import socket
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+pytest.importorskip("fontTools")
+
+from icon_inliner import IconInliner, used_icon_classes
+
+PAGE = """<html><head>
+    <link rel="stylesheet" href="{base}/font-awesome/6.4.0/css/all.min.css">
+</head><body><i class="fas fa-heartbeat fa-2x"></i></body></html>"""
+
+
+@pytest.fixture
+def empty_server(tmp_path):
+    """HTTP server on 127.0.0.1 that answers 404 for everything"""
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=str(tmp_path))
+    handler.log_message = lambda *args: None
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.parametrize("unreachable", ["refused", "not found"])
+def test_download_failure_keeps_the_cdn_link(tmp_path, empty_server, capsys, unreachable):
+    base = f"http://127.0.0.1:{closed_port()}" if unreachable == "refused" else empty_server
+    html = PAGE.format(base=base)
+    inliner = IconInliner(cache_dir=tmp_path / "cache")
+
+    assert inliner.inline(html) == html
+    assert base in inliner.report["error"]
+    inliner.print_report()
+    assert "⚠️  Font Awesome not inlined, keeping the CDN link" in capsys.readouterr().out
+
+
+def test_page_without_the_cdn_link_is_untouched(tmp_path):
+    inliner = IconInliner(cache_dir=tmp_path / "cache")
+    assert inliner.inline("<html></html>") == "<html></html>"
+    assert inliner.report is None
+
+
+def test_modifier_classes_are_not_icons():
+    assert used_icon_classes(PAGE) == {"solid": {"heartbeat"}}
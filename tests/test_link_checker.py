@@ -0,0 +1,97 @@
+"""LinkChecker against a mock HTTP server on a free loopback port"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from link_checker import LinkCache, LinkChecker
+
+# path -> (status line, extra headers)
+ROUTES = {
+    "/ok.png": ("200 OK", {"Content-Type": "image/png"}),
+    "/page.html": ("200 OK", {"Content-Type": "text/html"}),
+    "/about.html": ("200 OK", {"Content-Type": "text/html"}),
+    "/moved.png": ("302 Found", {"Location": "/ok.png"}),
+}
+
+
+class MockServer:
+    """Keep-alive HTTP/1.1 server; with drop_idle it closes a connection, unanswered,
+    when a second request arrives on it (an idle timeout racing the client)"""
+
+    def __init__(self, drop_idle=False):
+        self.drop_idle = drop_idle
+        self.requests = []
+        self.connections = 0
+        self.handlers = set()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.handlers.add(asyncio.current_task())
+        answered = 0
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if self.drop_idle and answered:
+                    break
+                method, path, _ = head.decode("latin-1").split("\r\n", 1)[0].split(" ")
+                self.requests.append((method, path))
+                status, headers = ROUTES.get(path, ("404 Not Found", {"Content-Type": "text/plain"}))
+                lines = [f"HTTP/1.1 {status}", "Content-Length: 0"]
+                lines += [f"{name}: {value}" for name, value in headers.items()]
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+                await writer.drain()
+                answered += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def check(server, links, port=0, **options):
+    """(checker, {path: result}, port) of checking links on a mock server at port (0: any free one)"""
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", port)
+    port = listener.sockets[0].getsockname()[1]
+    base = f"http://127.0.0.1:{port}"
+    try:
+        checker = LinkChecker(**options)
+        results = await checker.check_all_async({base + path: kind for path, kind in links.items()})
+    finally:
+        listener.close()
+        # The checker has closed its connections; let the handlers see that and finish
+        if server.handlers:
+            await asyncio.wait(server.handlers, timeout=5)
+    return checker, {url[len(base):]: result for url, result in results.items()}, port
+
+
+def test_statuses_redirects_and_content_types():
+    links = {"/ok.png": "image", "/missing.png": "image", "/moved.png": "image", "/page.html": "image",
+             "/about.html": "href"}
+    _, results, _ = asyncio.run(check(MockServer(), links))
+    assert results["/ok.png"]["ok"] and results["/ok.png"]["status"] == 200
+    assert not results["/missing.png"]["ok"] and results["/missing.png"]["error"] == "HTTP 404"
+    assert results["/moved.png"]["ok"] and results["/moved.png"]["final_url"].endswith("/ok.png")
+    assert not results["/page.html"]["ok"] and results["/page.html"]["error"].startswith("not an image")
+    assert results["/about.html"]["ok"]
+
+
+def test_cache_hit_makes_no_requests(tmp_path):
+    links = {"/ok.png": "image", "/missing.png": "image"}
+    checker, first, port = asyncio.run(check(MockServer(), links, cache=LinkCache(tmp_path / "links.json")))
+    assert checker.checked == 2
+
+    cache = LinkCache(tmp_path / "links.json")
+    server = MockServer()
+    checker, second, _ = asyncio.run(check(server, links, port, cache=cache))
+    assert checker.checked == 0 and cache.hits == 2
+    assert server.requests == []
+    assert second == first
+
+
+def test_dropped_keep_alive_connection_is_retried():
+    server = MockServer(drop_idle=True)
+    # One connection per host, so the second check is offered the idle one first
+    checker, results, _ = asyncio.run(check(server, {"/ok.png": "image", "/moved.png": "image"}, per_host=1))
+    assert all(result["ok"] for result in results.values()), results
+    assert checker.connections_opened > 1
@@ -0,0 +1,79 @@
+"""Responsive copies: PNG fallbacks behind WebP, in the embed and the hosted markup"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from google_drive_helper import GoogleDriveHelper
+from html_image_rewriter import ImageSlot
+from responsive_images import SIZES, responsive_image_tag
+
+SLOT = ImageSlot("epidemiology_chart.png", "src", None, ' alt="Chart"')
+
+
+def variant_urls(fmt):
+    urls = {f"epidemiology_chart-{width}w.{fmt}": f"https://cdn/{width}.{fmt}" for width in (480, 960)}
+    urls["epidemiology_chart-960w.png"] = "https://cdn/960.png"
+    return urls
+
+
+def test_webp_candidates_go_in_a_picture_with_the_png_img_behind_them():
+    markup = responsive_image_tag(SLOT, variant_urls("webp"), "https://cdn/original.png")
+    assert markup == ('<picture><source type="image/webp" srcset="https://cdn/480.webp 480w, '
+                      f'https://cdn/960.webp 960w" sizes="{SIZES}">'
+                      '<img src="https://cdn/960.png" alt="Chart"></picture>')
+
+
+def test_png_candidates_stay_on_the_img():
+    urls = {"epidemiology_chart-480w.png": "https://cdn/480.png", "epidemiology_chart-960w.png": "https://cdn/960.png"}
+    markup = responsive_image_tag(SLOT, urls, "https://cdn/original.png")
+    assert markup == ('<img src="https://cdn/960.png" srcset="https://cdn/480.png 480w, '
+                      f'https://cdn/960.png 960w" sizes="{SIZES}" alt="Chart">')
+
+
+def test_without_variants_the_img_keeps_its_url():
+    assert responsive_image_tag(SLOT, {}, "https://cdn/original.png") == \
+        '<img src="https://cdn/original.png" alt="Chart">'
+
+
+def test_drive_rewrite_writes_whole_picture_tags(tmp_path, capsys):
+    html_file = tmp_path / "page.html"
+    html_file.write_text('<p><img class="wide" src="../visualizations/epidemiology_chart.png" alt="E"></p>'
+                         '<p><img src="../visualizations/treatment_algorithm.png"></p>', encoding="utf-8")
+    helper = GoogleDriveHelper(images_dir=tmp_path, html_file=html_file)
+    urls = {"epidemiology_chart.png": "https://cdn/original.png", "treatment_algorithm.png": "https://cdn/t.png",
+            **variant_urls("webp")}
+
+    output_file, replacements = helper.update_html_with_drive_urls(urls)
+    html = output_file.read_text(encoding="utf-8")
+    assert replacements == 2
+    assert ('<p><picture><source type="image/webp" srcset="https://cdn/480.webp 480w, https://cdn/960.webp 960w" '
+            f'sizes="{SIZES}"><img src="https://cdn/960.png" class="wide" alt="E"></picture></p>') in html
+    assert '<p><img src="https://cdn/t.png"></p>' in html
+    assert "srcset/sizes added to: 1 images" in capsys.readouterr().out
+
+
+def test_embed_variant_pairs_the_wide_webp_with_a_png_fallback(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    from responsive_images import ResponsiveImages
+
+    source = tmp_path / "epidemiology_chart.png"
+    Image.new("RGB", (3000, 1500), "white").save(source)
+    responsive = ResponsiveImages(output_dir=tmp_path / "responsive")
+
+    fallback, alternatives = responsive.embed_variant(source)
+    assert fallback.name == "epidemiology_chart-1440w.png"
+    assert {fmt: path.name for fmt, path in alternatives.items()} == {"webp": "epidemiology_chart-2640w.webp"}
+
+    fallback, alternatives = ResponsiveImages(fmt="png", output_dir=tmp_path / "png").embed_variant(source)
+    assert fallback.name == "epidemiology_chart-2640w.png" and alternatives == {}
+
+
+def test_only_embeddable_formats_are_accepted():
+    pytest.importorskip("PIL")
+    from responsive_images import ResponsiveImages
+
+    with pytest.raises(ValueError, match="avif"):
+        ResponsiveImages(fmt="avif")
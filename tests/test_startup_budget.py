@@ -0,0 +1,45 @@
+"""Start-up imports: the lightweight entry points stay free of the plotting and imaging stack"""
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from bench_startup_imports import GENERATORS, HEAVY_MODULES, import_profile, modules_after_render
+from decks import DECKS
+
+# Entry points that only move files, check links or orchestrate builds. Diagrams are
+# drawn in render_diagrams.py's workers and decks by the generators, never in these
+LIGHTWEIGHT_ENTRY_POINTS = [
+    "build_tlm",
+    "render_diagrams",
+    "render_daemon",
+    "asset_server",
+    "link_checker",
+    "html_image_rewriter",
+    "data_uri_cache",
+    "slide_specs",
+]
+IMAGING_MODULES = ("matplotlib", "pptx", "PIL")
+
+
+@pytest.mark.parametrize("module", LIGHTWEIGHT_ENTRY_POINTS)
+def test_lightweight_entry_points_skip_matplotlib_pptx_and_pil(module):
+    _, packages = import_profile(module)
+    assert not set(packages) & set(IMAGING_MODULES + HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("module", GENERATORS)
+def test_generators_import_no_heavy_modules(module):
+    # python-pptx itself needs PIL, so only the scientific stack is ruled out here
+    _, packages = import_profile(module)
+    assert "pptx" in packages
+    assert not set(packages) & set(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("deck", DECKS)
+def test_rendering_a_deck_loads_no_heavy_modules(deck):
+    assert not set(modules_after_render(deck)) & set(HEAVY_MODULES)
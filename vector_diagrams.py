@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Vector Diagrams
+SVG render path for the flowchart-style diagrams, minified for inlining as text
+"""
+import hashlib
+import os
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# Pick the non-interactive backend before anything imports pyplot
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+from figure_cache import FigureCache
+from visualizations import VECTOR_DIAGRAMS
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+
+# Attributes holding coordinates; their numbers are rounded to PRECISION decimals
+NUMERIC_ATTRS = {"d", "x", "y", "width", "height", "transform", "points", "viewBox"}
+PRECISION = 2
+NUMBER = re.compile(r'-?\d+\.\d+|-?\d+')
+PATH_COMMAND_SPACE = re.compile(r'\s*([A-Za-z])\s*')
+REFERENCE = re.compile(r'url\(#([^)]+)\)')
+LONG_HEX_COLOR = re.compile(r'#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b')
+NULL_ROTATION = re.compile(r'rotate\(-?0 [^)]*\)\s*')
+
+# Characters that would end the src="..." attribute, start an entity or a URL fragment
+DATA_URI_ESCAPES = str.maketrans({"%": "%25", "#": "%23", '"': "%22", "&": "%26", "\n": "%0A"})
+
+# Minified copies carry a hash of this file in their name, so changing PRECISION or any
+# minifier rule re-minifies instead of reusing copies made by the old code
+MINIFIER_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:10]
+
+
+def local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def round_numbers(value):
+    def shorten(match):
+        number = f"{float(match.group(0)):.{PRECISION}f}".rstrip("0").rstrip(".")
+        return "0" if number == "-0" else number
+    return NUMBER.sub(shorten, value)
+
+
+def minify_style(style):
+    """'fill: #ffffff; stroke: #000' -> 'fill:#fff;stroke:#000'"""
+    declarations = []
+    for declaration in style.split(";"):
+        if ":" in declaration:
+            name, value = declaration.split(":", 1)
+            value = LONG_HEX_COLOR.sub(r'#\1\2\3', value.strip())
+            declarations.append(f"{name.strip()}:{value}")
+    return ";".join(declarations)
+
+
+def _flatten_groups(parent):
+    """Splice attribute-less <g> wrappers into their parent"""
+    children = []
+    for child in list(parent):
+        _flatten_groups(child)
+        if local_name(child.tag) == "g" and not child.attrib:
+            children.extend(child)
+        else:
+            children.append(child)
+    parent[:] = children
+
+
+def _serialize(element, out, root=False):
+    tag = local_name(element.tag)
+    attrs = []
+    if root:
+        attrs.append(f"xmlns='{SVG_NS}'")
+        if any(name.startswith(f"{{{XLINK_NS}}}") for node in element.iter() for name in node.attrib):
+            attrs.append(f"xmlns:xlink='{XLINK_NS}'")
+    for name, value in element.attrib.items():
+        if name.startswith(f"{{{XLINK_NS}}}"):
+            name = "xlink:" + local_name(name)
+        value = value.replace("&", "&amp;").replace("<", "&lt;").replace("'", "&apos;")
+        attrs.append(f"{name}='{value}'")
+    out.append(f"<{' '.join([tag] + attrs)}")
+    text = (element.text or "") if tag in ("text", "tspan", "style", "title") else ""
+    if not text and not len(element):
+        out.append("/>")
+        return
+    out.append(">")
+    out.append(text.replace("&", "&amp;").replace("<", "&lt;"))
+    for child in element:
+        _serialize(child, out)
+        if tag in ("text", "tspan") and child.tail:
+            out.append(child.tail.replace("&", "&amp;").replace("<", "&lt;"))
+    out.append(f"</{tag}>")
+
+
+def minify_svg(svg):
+    """Smaller equivalent of a matplotlib SVG.
+
+    Drops metadata, unreferenced ids and empty groups, rounds coordinates,
+    compacts styles and hoists the font stack shared by every <text> into
+    the stylesheet. Attributes are single-quoted so the result can sit in a
+    double-quoted HTML attribute.
+    """
+    root = ET.fromstring(svg.encode("utf-8") if isinstance(svg, str) else svg)
+
+    for parent in list(root.iter()):
+        for child in list(parent):
+            if local_name(child.tag) == "metadata":
+                parent.remove(child)
+
+    referenced = set(REFERENCE.findall(svg if isinstance(svg, str) else svg.decode("utf-8")))
+    referenced.update(value[1:] for node in root.iter() for name, value in node.attrib.items()
+                      if local_name(name) == "href" and value.startswith("#"))
+
+    fonts = set()
+    texts = []
+    for node in root.iter():
+        tag = local_name(node.tag)
+        if node.get("id") is not None and node.get("id") not in referenced:
+            del node.attrib["id"]
+        for name in list(node.attrib):
+            value = node.attrib[name]
+            if name in NUMERIC_ATTRS:
+                value = round_numbers(value)
+            if name == "d":
+                value = PATH_COMMAND_SPACE.sub(r'\1', " ".join(value.split()))
+            if name == "transform":
+                value = NULL_ROTATION.sub("", value).strip()
+                if not value:
+                    del node.attrib[name]
+                    continue
+            if name == "style":
+                value = minify_style(value)
+            node.attrib[name] = value
+        if tag == "text":
+            texts.append(node)
+            declarations = dict(item.split(":", 1) for item in node.get("style", "").split(";") if ":" in item)
+            fonts.add(declarations.get("font-family"))
+        if tag == "style" and node.text:
+            node.attrib.pop("type", None)
+            node.text = re.sub(r'\s*([{}:;,])\s*', r'\1', node.text.strip())
+    root.attrib.pop("version", None)
+
+    if len(fonts) == 1 and None not in fonts:
+        font_family = re.sub(r',\s+', ',', fonts.pop())
+        for node in texts:
+            node.attrib["style"] = ";".join(item for item in node.get("style").split(";")
+                                            if not item.startswith("font-family:"))
+            if not node.attrib["style"]:
+                del node.attrib["style"]
+        style = next((node for node in root.iter() if local_name(node.tag) == "style"), None)
+        if style is None:
+            defs = ET.Element(f"{{{SVG_NS}}}defs")
+            style = ET.SubElement(defs, f"{{{SVG_NS}}}style")
+            style.text = ""
+            root.insert(0, defs)
+        style.text += f"text{{font-family:{font_family}}}"
+
+    _flatten_groups(root)
+    out = []
+    _serialize(root, out, root=True)
+    return "".join(out)
+
+
+def svg_data_uri(svg):
+    """Percent-encoded (not base64) data URI; most of the markup stays readable text"""
+    return "data:image/svg+xml;charset=utf-8," + svg.translate(DATA_URI_ESCAPES)
+
+
+class VectorDiagrams:
+    def __init__(self, names=VECTOR_DIAGRAMS, cache=None):
+        """
+        names -- diagrams to embed as SVG; the rest keep their PNG
+        cache -- figure_cache.FigureCache holding the raw and minified renders
+        """
+        self.names = list(names)
+        self.cache = cache or FigureCache()
+        self.report = []
+
+    def svg_path(self, name, png_path=None):
+        """Minified SVG render of one diagram, rendering and minifying only on a miss.
+
+        png_path is the raster it replaces, for the size report.
+        """
+        raw = self.cache.get_figure(name, fmt="svg")
+        stem = raw.name[:-len('.svg')]
+        minified = raw.with_name(f"{stem}.min-{MINIFIER_HASH}.svg")
+        if not minified.exists():
+            tmp_path = minified.with_name(f"{minified.name}.tmp{os.getpid()}")
+            tmp_path.write_text(minify_svg(raw.read_text(encoding="utf-8")), encoding="utf-8")
+            os.replace(tmp_path, minified)
+            for stale in raw.parent.glob(f"{stem}.min*.svg"):
+                if stale != minified:
+                    stale.unlink()
+
+        png_bytes = Path(png_path).stat().st_size if png_path and Path(png_path).exists() else 0
+        self.report.append({
+            "name": name,
+            # What the PNG costs once base64-encoded into the page
+            "png_inline_bytes": (png_bytes + 2) // 3 * 4,
+            "svg_bytes": raw.stat().st_size,
+            "inline_bytes": len(svg_data_uri(minified.read_text(encoding="utf-8")).encode("utf-8")),
+        })
+        return minified
+
+    def print_report(self):
+        """Per-diagram table of inline bytes, base64 PNG vs percent-encoded SVG"""
+        if not self.report:
+            return
+        print(f"{'Diagram':<30} {'PNG base64 KB':>14} {'SVG KB':>7} {'Inline KB':>10} {'Smaller':>8}")
+        for row in self.report:
+            ratio = row["png_inline_bytes"] / row["inline_bytes"] if row["png_inline_bytes"] else 0
+            print(f"{row['name']:<30} {row['png_inline_bytes'] / 1024:>14.0f} {row['svg_bytes'] / 1024:>7.1f} "
+                  f"{row['inline_bytes'] / 1024:>10.1f} {ratio:>7.0f}x")
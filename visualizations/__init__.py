@@ -0,0 +1,31 @@
+"""
+Diagram scripts for the Diabetes TLM
+
+Each module exposes render(output, dpi=300, size=None, theme=None) and can
+still be run directly as a script. size overrides the figure size in inches
+and theme is a matplotlib style name or rc dict applied while drawing.
+Data shared with the PPTX decks lives in the SHARED_MODULES below.
+"""
+
+DIAGRAMS = [
+    "pathophysiology_diagram",
+    "epidemiology_chart",
+    "risk_factor_diagram",
+    "treatment_algorithm",
+    "prevention_flowchart",
+    "national_program_diagram",
+    "control_strategies_diagram",
+]
+
+# Flowchart-style diagrams (boxes and labels) that embed far smaller as SVG
+VECTOR_DIAGRAMS = [
+    "pathophysiology_diagram",
+    "prevention_flowchart",
+    "national_program_diagram",
+    "control_strategies_diagram",
+]
+
+# Dataset modules imported by the diagrams; a change here re-renders them
+SHARED_MODULES = [
+    "epidemiology_data",
+]
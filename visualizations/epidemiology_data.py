@@ -0,0 +1,23 @@
+"""
+Diabetes epidemiology dataset shared by the matplotlib chart and the PPTX decks
+"""
+
+# Global diabetes cases (2021 projection), in millions
+YEARS = ['2011', '2013', '2015', '2017', '2019', '2021', '2030', '2045']
+GLOBAL_CASES = [366, 382, 415, 425, 463, 537, 643, 783]
+
+# Indian diabetes prevalence (%) and cases (millions)
+INDIA_YEARS = ['2000', '2005', '2010', '2015', '2020', '2021', '2030', '2045']
+INDIA_PREVALENCE = [5.5, 6.5, 8.3, 9.8, 10.8, 11.4, 14.5, 16.0]
+INDIA_CASES = [31.7, 40.9, 61.3, 69.2, 88.9, 101.2, 140.2, 160.0]
+
+# Regional diabetes prevalence (%) in 2021; labels use '\n' where the charts wrap
+REGIONS = ['South Asia', 'East Asia &\nPacific', 'North\nAmerica', 'Western\nEurope',
+           'Middle East &\nN Africa', 'South &\nCentral America', 'Sub-Saharan\nAfrica']
+REGIONAL_PREVALENCE = [8.8, 8.4, 11.7, 5.4, 14.0, 9.9, 3.3]
+REGION_COLORS = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', '#795548', '#607D8B']
+
+# Series colours of the four panels
+GLOBAL_COLOR = '#1976D2'
+INDIA_PREVALENCE_COLOR = '#388E3C'
+INDIA_CASES_COLOR = '#F57C00'